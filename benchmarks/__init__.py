@@ -0,0 +1,4 @@
+"""
+Benchmarks of the application. Run them as modules from the repository root, e.g.
+`python -m benchmarks.startup`.
+"""
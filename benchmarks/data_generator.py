@@ -0,0 +1,272 @@
+"""
+Generator of synthetic pysystemtrade data trees.
+
+Writes the `csvconfig/`, `adjusted_prices_csv/`, `multiple_prices_csv/`, `fx_prices_csv/`
+and `roll_calendars_csv/` folders with the file names and columns the schemas expect.
+The scale is instruments x years x bars per business day. Prices are geometric random
+walks and contracts roll quarterly, so the files compress, aggregate and deduplicate
+like the real ones.
+
+    python -m benchmarks.data_generator /tmp/synthetic --instruments 50 --years 10 --bars-per-day 24
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Real instrument codes first, synthetic ones once they run out
+INSTRUMENTS = (
+    ("AEX", "EUR", "Equity"),
+    ("BUND", "EUR", "Bond"),
+    ("CORN", "USD", "Ags"),
+    ("CRUDE_W", "USD", "OilGas"),
+    ("EDOLLAR", "USD", "STIR"),
+    ("EUROSTX", "EUR", "Equity"),
+    ("GAS_US", "USD", "OilGas"),
+    ("GOLD", "USD", "Metals"),
+    ("JGB", "JPY", "Bond"),
+    ("KOSPI", "KRW", "Equity"),
+    ("MXP", "USD", "FX"),
+    ("NASDAQ", "USD", "Equity"),
+    ("SMI", "CHF", "Equity"),
+    ("SP500", "USD", "Equity"),
+    ("US10", "USD", "Bond"),
+    ("V2X", "EUR", "Vol"),
+    ("VIX", "USD", "Vol"),
+    ("WHEAT", "USD", "Ags"),
+    ("GILT", "GBP", "Bond"),
+    ("AUD", "USD", "FX"),
+)
+CURRENCIES = ("EUR", "JPY", "KRW", "CHF", "GBP", "USD")
+END_DATE = "2023-12-29"
+
+
+def instrument_universe(count):
+    """
+    Returns the code, currency and asset class of every instrument.
+
+    Parameters:
+        count (int): Number of instruments.
+
+    Returns:
+        list: Tuples of (code, currency, asset class).
+    """
+    instruments = list(INSTRUMENTS[:count])
+    for number in range(len(instruments), count):
+        currency = CURRENCIES[number % len(CURRENCIES)]
+        instruments.append((f"SYN{number:04d}", currency, "Synthetic"))
+    return instruments
+
+
+def bar_times(years, bars_per_day, end=END_DATE):
+    """
+    Returns the timestamps of the bars, evenly spread over the trading hours of every
+    business day. A single bar per day sits at 23:00 like pysystemtrade's daily closes.
+
+    Parameters:
+        years (int): Number of years up to the end date.
+        bars_per_day (int): Bars per business day.
+        end (str): Last business day.
+
+    Returns:
+        pd.DatetimeIndex: The bar timestamps.
+    """
+    days = pd.bdate_range(end=end, periods=max(int(years * 260), 1))
+    if bars_per_day == 1:
+        offsets = pd.to_timedelta([23], unit="h")
+    else:
+        offsets = pd.to_timedelta(np.linspace(7, 22, bars_per_day), unit="h").round(
+            "min"
+        )
+    return pd.DatetimeIndex(
+        (days.values[:, None] + offsets.values[None, :]).ravel(), name="DATETIME"
+    )
+
+
+def random_walk(rng, length, start=100.0, daily_vol=0.01, bars_per_day=1):
+    """
+    Returns a geometric random walk of prices rounded to a tick.
+
+    Parameters:
+        rng (np.random.Generator): Random number generator.
+        length (int): Number of prices.
+        start (float): First price.
+        daily_vol (float): Daily standard deviation of the log returns.
+        bars_per_day (int): Bars per day, scales the volatility of a step.
+
+    Returns:
+        np.ndarray: The prices.
+    """
+    steps = rng.normal(0.0, daily_vol / np.sqrt(bars_per_day), length)
+    return np.round(start * np.exp(np.cumsum(steps)), 4)
+
+
+def contract_dates(times, months_ahead=0):
+    """
+    Returns the yyyymm00 code of the quarterly contract held at every timestamp.
+
+    Parameters:
+        times (pd.DatetimeIndex): Timestamps of the bars.
+        months_ahead (int): Offset of the contract, 3 for the next quarterly contract.
+
+    Returns:
+        np.ndarray: Contract codes such as 20230600.
+    """
+    months = times.year * 12 + (times.month - 1) + months_ahead
+    # The next quarterly month at or after the month
+    quarter = ((months % 12) // 3) * 3 + 2
+    months = months - months % 12 + quarter
+    return (months // 12) * 10000 + (months % 12 + 1) * 100
+
+
+def write_configs(root, instruments, rng):
+    """Writes the instrument, roll and spread cost configurations."""
+    config_path = os.path.join(root, "csvconfig")
+    os.makedirs(config_path, exist_ok=True)
+    codes = [code for code, _, _ in instruments]
+    pd.DataFrame(
+        {
+            "Instrument": codes,
+            "Description": [f"{code} future" for code in codes],
+            "Pointsize": rng.choice([1.0, 10.0, 25.0, 50.0, 1000.0], len(codes)),
+            "Currency": [currency for _, currency, _ in instruments],
+            "AssetClass": [asset_class for _, _, asset_class in instruments],
+            "PerBlock": rng.choice([0.0, 1.0, 2.5], len(codes)),
+            "Percentage": rng.choice([0.0, 0.0002], len(codes)),
+            "PerTrade": rng.choice([0, 1], len(codes)),
+            "Region": rng.choice(["EMEA", "US", "ASIA"], len(codes)),
+        }
+    ).to_csv(os.path.join(config_path, "instrumentconfig.csv"), index=False)
+    pd.DataFrame(
+        {
+            "Instrument": codes,
+            "HoldRollCycle": "HMUZ",
+            "RollOffsetDays": rng.integers(-20, -1, len(codes)),
+            "CarryOffset": rng.choice([-1, 1], len(codes)),
+            "PricedRollCycle": "HMUZ",
+            "ExpiryOffset": rng.integers(10, 20, len(codes)),
+        }
+    ).to_csv(os.path.join(config_path, "rollconfig.csv"), index=False)
+    pd.DataFrame(
+        {
+            "Instrument": codes,
+            "SpreadCost": np.round(rng.uniform(0.1, 5, len(codes)), 3),
+        }
+    ).to_csv(os.path.join(config_path, "spreadcosts.csv"), index=False)
+    return len(codes)
+
+
+def write_instrument(root, code, times, bars_per_day, rng):
+    """
+    Writes the adjusted prices, multiple prices and roll calendar of an instrument.
+
+    Returns:
+        dict: Rows written per table.
+    """
+    price = random_walk(rng, len(times), rng.uniform(10, 5000), 0.01, bars_per_day)
+    carry = np.round(price * (1 + rng.normal(0, 0.002, len(times))), 4)
+    forward = np.round(price * (1 + rng.normal(0, 0.004, len(times))), 4)
+    price_contract = contract_dates(times)
+    pd.DataFrame({"price": price}, index=times).to_csv(
+        os.path.join(root, "adjusted_prices_csv", f"{code}.csv")
+    )
+    pd.DataFrame(
+        {
+            "CARRY": carry,
+            "CARRY_CONTRACT": contract_dates(times, -3),
+            "PRICE": price,
+            "PRICE_CONTRACT": price_contract,
+            "FORWARD": forward,
+            "FORWARD_CONTRACT": contract_dates(times, 3),
+        },
+        index=times,
+    ).to_csv(os.path.join(root, "multiple_prices_csv", f"{code}.csv"))
+
+    # One roll per quarter, on the first bar after the contract changed
+    rolls = np.flatnonzero(np.diff(price_contract, prepend=price_contract[0]))
+    rolls = np.concatenate(([0], rolls))
+    roll_times = pd.DatetimeIndex(times[rolls], name="DATE_TIME")
+    current = contract_dates(roll_times)
+    pd.DataFrame(
+        {
+            "current_contract": current,
+            "next_contract": contract_dates(roll_times, 3),
+            "carry_contract": contract_dates(roll_times, -3),
+        },
+        index=roll_times,
+    ).to_csv(os.path.join(root, "roll_calendars_csv", f"{code}.csv"))
+    return {
+        "adjusted_prices": len(times),
+        "multiple_prices": len(times),
+        "roll_calendars": len(roll_times),
+    }
+
+
+def generate_dataset(root, instruments=10, years=5, bars_per_day=1, seed=0) -> dict:
+    """
+    Writes a synthetic pysystemtrade data tree.
+
+    Parameters:
+        root (str): Folder to write the tree to, the schemas' SOURCE_DATA_PATH.
+        instruments (int): Number of instruments.
+        years (int): Years of prices per instrument.
+        bars_per_day (int): Price bars per business day.
+        seed (int): Seed of the random number generator, equal seeds write equal trees.
+
+    Returns:
+        dict: Rows written per table, the input size of the pipeline.
+    """
+    rng = np.random.default_rng(seed)
+    for folder in (
+        "adjusted_prices_csv",
+        "multiple_prices_csv",
+        "fx_prices_csv",
+        "roll_calendars_csv",
+    ):
+        os.makedirs(os.path.join(root, folder), exist_ok=True)
+
+    universe = instrument_universe(instruments)
+    times = bar_times(years, bars_per_day)
+    rows = {"instrument_config": write_configs(root, universe, rng)}
+    rows["roll_config"] = rows["spread_cost"] = rows["instrument_config"]
+
+    for code, _, _ in universe:
+        for table_name, count in write_instrument(
+            root, code, times, bars_per_day, rng
+        ).items():
+            rows[table_name] = rows.get(table_name, 0) + count
+
+    currencies = sorted({currency for _, currency, _ in universe} - {"USD"})
+    for currency in currencies:
+        prices = random_walk(
+            rng, len(times), rng.uniform(0.5, 150), 0.006, bars_per_day
+        )
+        pd.DataFrame({"PRICE": prices}, index=times).to_csv(
+            os.path.join(root, "fx_prices_csv", f"{currency}USD.csv")
+        )
+    rows["fx_prices"] = len(currencies) * len(times)
+    return rows
+
+
+def main(argv=None) -> int:
+    """Generates a data tree from the command line, returns the exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("root", help="folder to write the data tree to")
+    parser.add_argument("--instruments", type=int, default=10)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--bars-per-day", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rows = generate_dataset(
+        args.root, args.instruments, args.years, args.bars_per_day, args.seed
+    )
+    print(json.dumps(rows, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,281 @@
+"""
+Performance regression check of the pipeline against a stored baseline.
+
+`record` runs the pipeline benchmark several times, every run in a fresh interpreter so
+peak memory is measured per run, and writes the per-stage seconds, throughput and peak
+RSS with their medians and spreads to a baseline file. `compare` reruns the benchmark
+with the parameters stored in the baseline and flags every metric whose median got worse
+by more than the threshold and by more than the noise of both measurements.
+
+    python -m benchmarks.regression record --instruments 20 --years 5 --bars-per-day 24
+    python -m benchmarks.regression compare --threshold 0.10
+
+Baselines depend on the machine, record them on the machine that compares. Everything
+runs locally, the COPY stage only with a database URL.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+# Metrics of a stage and whether larger values are better
+STAGE_METRICS = {"seconds": False, "rows_per_second": True, "peak_rss_mb": False}
+RUN_METRICS = {
+    "processing_wall_seconds": False,
+    "copy_wall_seconds": False,
+    "peak_rss_mb": False,
+}
+
+
+def summarize(samples) -> dict:
+    """
+    Summarizes repeated measurements robustly.
+
+    Parameters:
+        samples (list): Measurements of one metric, None where it was not measured.
+
+    Returns:
+        dict or None: Median, median absolute deviation, minimum, maximum and the
+        samples, None without measurements.
+    """
+    samples = [sample for sample in samples if sample is not None]
+    if not samples:
+        return None
+    median = statistics.median(samples)
+    return {
+        "median": median,
+        "mad": statistics.median(abs(sample - median) for sample in samples),
+        "min": min(samples),
+        "max": max(samples),
+        "samples": samples,
+    }
+
+
+def summarize_runs(reports) -> dict:
+    """
+    Summarizes the reports of repeated pipeline benchmark runs.
+
+    Parameters:
+        reports (list): Reports of benchmarks.pipeline.run_benchmark.
+
+    Returns:
+        dict: Summaries per run metric and per stage metric.
+    """
+    stages = {}
+    for stage in reports[0]["stages"]:
+        stages[stage] = {
+            metric: summarize([report["stages"][stage][metric] for report in reports])
+            for metric in STAGE_METRICS
+        }
+    return {
+        "runs": {
+            metric: summarize([report[metric] for report in reports])
+            for metric in RUN_METRICS
+        },
+        "stages": stages,
+    }
+
+
+def compare_summaries(baseline, current, threshold=0.1, noise_factor=3.0) -> list:
+    """
+    Compares the metric summaries of a baseline and of the current code.
+
+    A metric regressed when its median got worse by more than `threshold` relative to the
+    baseline and the difference exceeds `noise_factor` times the summed median absolute
+    deviations, so noisy metrics need a larger change to be flagged.
+
+    Parameters:
+        baseline (dict): Summaries of the baseline, as returned by summarize_runs.
+        current (dict): Summaries of the current code.
+        threshold (float): Relative change that counts, 0.1 for 10%.
+        noise_factor (float): Multiple of the noise a change must exceed.
+
+    Returns:
+        list: One finding per metric with status 'regression', 'improvement' or 'ok'.
+    """
+    pairs = [
+        ("run", metric, higher_is_better, baseline["runs"], current["runs"])
+        for metric, higher_is_better in RUN_METRICS.items()
+    ]
+    for stage, summaries in current["stages"].items():
+        pairs.extend(
+            (
+                stage,
+                metric,
+                higher_is_better,
+                baseline["stages"].get(stage, {}),
+                summaries,
+            )
+            for metric, higher_is_better in STAGE_METRICS.items()
+        )
+
+    findings = []
+    for name, metric, higher_is_better, before, after in pairs:
+        before, after = before.get(metric), after.get(metric)
+        if before is None or after is None or not before["median"]:
+            continue
+        change = (after["median"] - before["median"]) / before["median"]
+        worse = -change if higher_is_better else change
+        noise = noise_factor * (before["mad"] + after["mad"])
+        significant = abs(after["median"] - before["median"]) > noise
+        status = "ok"
+        if significant and worse > threshold:
+            status = "regression"
+        elif significant and worse < -threshold:
+            status = "improvement"
+        findings.append(
+            {
+                "name": name,
+                "metric": metric,
+                "baseline": before["median"],
+                "current": after["median"],
+                "change": change,
+                "status": status,
+            }
+        )
+    return findings
+
+
+def run_pipeline(parameters, repetitions) -> list:
+    """
+    Runs the pipeline benchmark repeatedly, each run in a fresh interpreter.
+
+    Parameters:
+        parameters (dict): Scale, seed, rollups and database URL of the benchmark.
+        repetitions (int): Number of runs.
+
+    Returns:
+        list: The reports of the runs.
+    """
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.pipeline",
+        "--json",
+        "--instruments",
+        str(parameters["instruments"]),
+        "--years",
+        str(parameters["years"]),
+        "--bars-per-day",
+        str(parameters["bars_per_day"]),
+        "--seed",
+        str(parameters["seed"]),
+    ]
+    if parameters.get("rollups"):
+        command.append("--rollups")
+    env = dict(os.environ)
+    if parameters.get("database_url"):
+        env["BENCHMARK_DATABASE_URL"] = parameters["database_url"]
+    else:
+        env.pop("BENCHMARK_DATABASE_URL", None)
+
+    reports = []
+    for _ in range(repetitions):
+        output = subprocess.run(
+            command, capture_output=True, check=True, env=env, text=True
+        ).stdout
+        reports.append(json.loads(output))
+    return reports
+
+
+def environment() -> dict:
+    """Returns a description of the machine the measurements were taken on."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def record(parameters, repetitions, path) -> dict:
+    """
+    Measures the pipeline and writes the results to a baseline file.
+
+    Returns:
+        dict: The written baseline.
+    """
+    reports = run_pipeline(parameters, repetitions)
+    stored = {key: value for key, value in parameters.items() if key != "database_url"}
+    baseline = {
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": environment(),
+        "parameters": {**stored, "with_copy": bool(parameters.get("database_url"))},
+        "repetitions": repetitions,
+        "summary": summarize_runs(reports),
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2)
+    return baseline
+
+
+def format_findings(findings) -> str:
+    """Returns the findings as a text table."""
+    lines = [
+        f"{'stage':<12}{'metric':<26}{'baseline':>14}{'current':>14}{'change':>9}  status"
+    ]
+    for finding in findings:
+        lines.append(
+            f"{finding['name']:<12}{finding['metric']:<26}{finding['baseline']:>14.3f}"
+            f"{finding['current']:>14.3f}{finding['change']:>+9.1%}  {finding['status']}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    """Records or compares from the command line, returns 1 on regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="write a baseline file")
+    record_parser.add_argument("--instruments", type=int, default=10)
+    record_parser.add_argument("--years", type=int, default=5)
+    record_parser.add_argument("--bars-per-day", type=int, default=1)
+    record_parser.add_argument("--seed", type=int, default=0)
+    record_parser.add_argument("--rollups", action="store_true")
+    compare_parser = commands.add_parser("compare", help="compare with a baseline")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.add_argument("--noise-factor", type=float, default=3.0)
+    compare_parser.add_argument("--json", action="store_true")
+    for command in (record_parser, compare_parser):
+        command.add_argument("--baseline", default=DEFAULT_BASELINE)
+        command.add_argument("--repetitions", type=int, default=5)
+        command.add_argument(
+            "--database-url", default=os.environ.get("BENCHMARK_DATABASE_URL")
+        )
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        parameters = {
+            "instruments": args.instruments,
+            "years": args.years,
+            "bars_per_day": args.bars_per_day,
+            "seed": args.seed,
+            "rollups": args.rollups,
+            "database_url": args.database_url,
+        }
+        record(parameters, args.repetitions, args.baseline)
+        print(f"Baseline of {args.repetitions} runs written to {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    parameters = {**baseline["parameters"], "database_url": args.database_url}
+    if baseline["parameters"]["with_copy"] and not args.database_url:
+        print("The baseline includes COPY, pass --database-url.", file=sys.stderr)
+        return 2
+    current = summarize_runs(run_pipeline(parameters, args.repetitions))
+    findings = compare_summaries(
+        baseline["summary"], current, args.threshold, args.noise_factor
+    )
+    print(json.dumps(findings, indent=2) if args.json else format_findings(findings))
+    return 1 if any(finding["status"] == "regression" for finding in findings) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,114 @@
+"""
+Benchmark of the cold start of the application.
+
+Every run starts a fresh interpreter that imports `src.main` and runs the application
+lifespan, which is what an autoscaled replica or a test session pays before serving the
+first request. The benchmark fails if a run loads one of the heavy modules or if the
+median start takes longer than `--max-ms`.
+
+    python -m benchmarks.startup --runs 10 --max-ms 1000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules that must only be loaded once a route needs them
+HEAVY_MODULES = ("pandas", "numpy", "asyncpg", "zstandard")
+
+_STARTUP_SCRIPT = """
+import asyncio, json, sys, time
+start = time.perf_counter()
+from src.main import app
+imported = time.perf_counter()
+
+async def start_up():
+    async with app.router.lifespan_context(app):
+        pass
+
+asyncio.run(start_up())
+finished = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "startup_ms": (finished - start) * 1000,
+    "heavy_modules": [name for name in %r if name in sys.modules],
+}))
+"""
+
+
+def measure_startup() -> dict:
+    """
+    Measures one cold start in a fresh interpreter.
+
+    Returns:
+        dict: Milliseconds to import the application and to finish its startup, and the
+        heavy modules that were loaded.
+    """
+    env = {"DB_PORT": "5432", **os.environ}
+    output = subprocess.run(
+        [sys.executable, "-c", _STARTUP_SCRIPT % (HEAVY_MODULES,)],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark(runs) -> dict:
+    """
+    Measures several cold starts.
+
+    Parameters:
+        runs (int): Number of cold starts.
+
+    Returns:
+        dict: Minimum and median milliseconds of import and startup, and the heavy
+        modules loaded by any run.
+    """
+    results = [measure_startup() for _ in range(runs)]
+    import_ms = [result["import_ms"] for result in results]
+    startup_ms = [result["startup_ms"] for result in results]
+    return {
+        "runs": runs,
+        "import_ms_min": min(import_ms),
+        "import_ms_median": statistics.median(import_ms),
+        "startup_ms_min": min(startup_ms),
+        "startup_ms_median": statistics.median(startup_ms),
+        "heavy_modules": sorted(
+            {name for result in results for name in result["heavy_modules"]}
+        ),
+    }
+
+
+def main(argv=None) -> int:
+    """Runs the benchmark from the command line, returns the exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts")
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="fail if the median startup takes longer",
+    )
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.runs)
+    print(json.dumps(report, indent=2))
+    if report["heavy_modules"]:
+        print(f"Startup loaded {', '.join(report['heavy_modules'])}", file=sys.stderr)
+        return 1
+    if args.max_ms is not None and report["startup_ms_median"] > args.max_ms:
+        print(
+            f"Median startup of {report['startup_ms_median']:.0f}ms exceeds {args.max_ms:g}ms",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+This module provides the handlers of the routes as FastAPI dependencies.
+
+The application lifespan sets up a HandlerRegistry on the application state. A handler is
+created the first time a route needs it and reused afterwards, so importing and starting
+the application never loads pandas, NumPy or asyncpg. Set PRELOAD_HANDLERS=True to create
+every handler during startup instead, which moves that cost out of the first requests.
+"""
+
+from fastapi import Request
+
+from src.core.config import settings
+
+
+class HandlerRegistry:
+    """
+    Creates handlers on first use and caches them for the lifetime of the application.
+    """
+
+    def __init__(self, factories):
+        """
+        Initialize the HandlerRegistry.
+
+        Parameters:
+            factories (dict): Mapping of handler names to functions creating the handler.
+        """
+        self._factories = factories
+        self._handlers = {}
+
+    def get(self, name):
+        """
+        Returns a handler, creating it on first use.
+
+        Parameters:
+            name (str): Name of the handler.
+
+        Returns:
+            object: The handler.
+        """
+        if name not in self._handlers:
+            self._handlers[name] = self._factories[name]()
+        return self._handlers[name]
+
+    def preload(self) -> None:
+        """
+        Creates every handler up front.
+        """
+        for name in self._factories:
+            self.get(name)
+
+    @property
+    def created(self):
+        """
+        Returns the names of the handlers created so far.
+
+        Returns:
+            list: Names of the created handlers.
+        """
+        return list(self._handlers)
+
+
+# The handler modules are imported inside the factories, they pull in pandas and asyncpg
+def _analytics_handler():
+    from src.handlers.analytics_handler import AnalyticsHandler
+
+    return AnalyticsHandler(settings.database_url)
+
+
+def _config_data_handler():
+    from src.handlers.config_data_handler import ConfigDataHandler
+
+    return ConfigDataHandler()
+
+
+def _covariance_handler():
+    from src.handlers.covariance_handler import CovarianceHandler
+
+    return CovarianceHandler()
+
+
+def _database_handler():
+    from src.handlers.database_handler import DatabaseHandler
+
+    return DatabaseHandler(settings.database_url)
+
+
+def _forecast_handler():
+    from src.handlers.forecast_handler import ForecastHandler
+
+    return ForecastHandler(settings.database_url)
+
+
+def _packed_series_handler():
+    from src.handlers.packed_series_handler import PackedSeriesHandler
+
+    return PackedSeriesHandler(settings.database_url)
+
+
+def _price_matrix_handler():
+    from src.handlers.price_matrix_handler import PriceMatrixHandler
+
+    return PriceMatrixHandler(settings.database_url)
+
+
+def _raw_data_handler():
+    from src.handlers.raw_data_handler import RawDataHandler
+
+    return RawDataHandler()
+
+
+def _rebuild_handler():
+    from src.handlers.rebuild_handler import RebuildHandler
+
+    return RebuildHandler(settings.database_url)
+
+
+def _seed_db_handler():
+    from src.handlers.seed_db_handler import SeedDBHandler
+
+    return SeedDBHandler(settings.database_url)
+
+
+def _snapshot_handler():
+    from src.handlers.snapshot_handler import SnapshotHandler
+
+    return SnapshotHandler(settings.database_url)
+
+
+def _upload_handler():
+    from src.handlers.upload_handler import UploadHandler
+
+    return UploadHandler(settings.database_url)
+
+
+HANDLER_FACTORIES = {
+    "analytics": _analytics_handler,
+    "config_data": _config_data_handler,
+    "covariance": _covariance_handler,
+    "database": _database_handler,
+    "forecast": _forecast_handler,
+    "packed_series": _packed_series_handler,
+    "price_matrix": _price_matrix_handler,
+    "raw_data": _raw_data_handler,
+    "rebuild": _rebuild_handler,
+    "seed_db": _seed_db_handler,
+    "snapshot": _snapshot_handler,
+    "upload": _upload_handler,
+}
+
+
+def create_handler_registry() -> HandlerRegistry:
+    """
+    Returns a registry of every handler of the application.
+
+    Returns:
+        HandlerRegistry: The registry, with the handlers created if PRELOAD_HANDLERS is set.
+    """
+    registry = HandlerRegistry(HANDLER_FACTORIES)
+    if settings.preload_handlers:
+        registry.preload()
+    return registry
+
+
+def _handler(name):
+    # Async, so handlers are created on the event loop and never twice
+    async def dependency(request: Request):
+        return request.app.state.handlers.get(name)
+
+    dependency.__name__ = f"get_{name}_handler"
+    return dependency
+
+
+get_analytics_handler = _handler("analytics")
+get_config_data_handler = _handler("config_data")
+get_covariance_handler = _handler("covariance")
+get_database_handler = _handler("database")
+get_forecast_handler = _handler("forecast")
+get_packed_series_handler = _handler("packed_series")
+get_price_matrix_handler = _handler("price_matrix")
+get_raw_data_handler = _handler("raw_data")
+get_rebuild_handler = _handler("rebuild")
+get_seed_db_handler = _handler("seed_db")
+get_snapshot_handler = _handler("snapshot")
+get_upload_handler = _handler("upload")
@@ -0,0 +1,54 @@
+"""
+This module defines the ASGI middleware that sets up the request context.
+It traces every request and assigns a profile id to requests that opt in to profiling.
+"""
+
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+
+from src.monitoring.profiling import is_profiling_requested, request_profile
+from src.monitoring.tracing import span
+
+
+class RequestContextMiddleware:
+    """
+    Traces every HTTP request as the root 'request' span of the work it runs and assigns a
+    profile id to requests that opt in, returned in the X-Profile-Id header.
+
+    It is a plain ASGI middleware: the request runs in the same task and the streamed
+    request and response bodies pass through untouched, so requests that are not profiled
+    only pay for the span and the check of the opt-in.
+    """
+
+    def __init__(self, app):
+        """
+        Initialize the middleware.
+
+        Parameters:
+            app (ASGIApp): The wrapped application.
+        """
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with span(
+            "request", method=scope["method"], path=scope["path"]
+        ) as request_span:
+            profile_id = None
+
+            async def send_with_context(message):
+                if message["type"] == "http.response.start":
+                    request_span.set_attributes(status_code=message["status"])
+                    if profile_id is not None:
+                        MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+                await send(message)
+
+            if not is_profiling_requested(
+                Headers(scope=scope), QueryParams(scope["query_string"])
+            ):
+                await self.app(scope, receive, send_with_context)
+                return
+            with request_profile() as profile_id:
+                await self.app(scope, receive, send_with_context)
@@ -1,15 +1,29 @@
 """
 This module configures the API routing for the application.
 It imports and includes routers from different components of the application
-such as database, config files, raw data, and database seeding.
+such as database, config files, raw data, database seeding, analytics, forecasts, the price matrix store, the
+correlation cache, background jobs, stored profiles, tracing spans, memory accounting,
+streamed uploads, the one-shot rebuild, the snapshot views and the packed series.
 """
 
 from fastapi import APIRouter
 
+from src.api.routes.analytics_route import router as analytics_router
 from src.api.routes.config_files_route import router as config_files_router
+from src.api.routes.correlation_route import router as correlation_router
 from src.api.routes.database_route import router as database_router
+from src.api.routes.forecast_route import router as forecast_router
+from src.api.routes.jobs_route import router as jobs_router
+from src.api.routes.memory_route import router as memory_router
+from src.api.routes.packed_series_route import router as packed_series_router
+from src.api.routes.price_matrix_route import router as price_matrix_router
+from src.api.routes.profiles_route import router as profiles_router
 from src.api.routes.raw_data_route import router as raw_data_router
+from src.api.routes.rebuild_route import router as rebuild_router
 from src.api.routes.seed_db_route import router as seed_db_router
+from src.api.routes.snapshot_route import router as snapshot_router
+from src.api.routes.traces_route import router as traces_router
+from src.api.routes.upload_route import router as upload_router
 
 router = APIRouter()
 
@@ -17,3 +31,15 @@ router.include_router(database_router, prefix="/database")
 router.include_router(config_files_router, prefix="/config_files")
 router.include_router(raw_data_router, prefix="/raw_data")
 router.include_router(seed_db_router, prefix="/seed_db")
+router.include_router(analytics_router, prefix="/analytics")
+router.include_router(price_matrix_router, prefix="/price_matrix")
+router.include_router(forecast_router, prefix="/forecast")
+router.include_router(correlation_router, prefix="/correlation")
+router.include_router(jobs_router, prefix="/jobs")
+router.include_router(profiles_router, prefix="/profiles")
+router.include_router(traces_router, prefix="/traces")
+router.include_router(memory_router, prefix="/memory")
+router.include_router(upload_router, prefix="/upload")
+router.include_router(rebuild_router, prefix="/rebuild")
+router.include_router(snapshot_router, prefix="/snapshots")
+router.include_router(packed_series_router, prefix="/packed")
@@ -0,0 +1,24 @@
+"""
+This module defines the API routes for the analytics stage.
+It includes a POST endpoint that derives returns and volatility from the seeded prices.
+"""
+
+from fastapi import APIRouter, Depends, status
+
+from src.api.dependencies import get_analytics_handler
+from src.api.routes.utils import execute_with_logging_async
+
+router = APIRouter()
+
+
+@router.post(
+    "/compute_analytics/", status_code=status.HTTP_200_OK, name="compute_analytics"
+)
+async def compute_analytics(analytics_handler=Depends(get_analytics_handler)):
+    """Compute returns and volatility for newly seeded prices."""
+    await execute_with_logging_async(
+        analytics_handler.compute_analytics_async,
+        start_msg="Analytics computation started.",
+        end_msg="Analytics computation completed.",
+    )
+    return {"status": "returns and volatility were computed"}
@@ -1,23 +1,30 @@
 """
 This module defines the API route for handling configuration files.
-It includes a POST endpoint for parsing files and storing them in a temporary location.
+It includes a POST endpoint that starts parsing files and storing them in a temporary location as a background job.
 """
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, Query, status
 
-from src.api.routes.utils import execute_with_logging
-from src.handlers.config_data_handler import ConfigDataHandler
+from src.api.dependencies import get_config_data_handler
+from src.api.routes.utils import check_schema_filter, submit_job
 
 router = APIRouter()
-config_handler = ConfigDataHandler()
 
 
-@router.post("/parse_files/", status_code=status.HTTP_200_OK, name="parse_files")
-def parse_files():
-    """Parse files and store them in temp."""
-    execute_with_logging(
+@router.post("/parse_files/", status_code=status.HTTP_202_ACCEPTED, name="parse_files")
+async def parse_files(
+    schemas: list[str] | None = Query(None),
+    symbols: list[str] | None = Query(None),
+    config_handler=Depends(get_config_data_handler),
+):
+    """
+    Start parsing files and storing them in temp, returns the job to poll.
+    Schema and symbol filters take glob patterns and limit the parsed files and rows.
+    """
+    check_schema_filter(config_handler.schemas, schemas)
+    return submit_job(
         config_handler.handle_data_processing,
-        start_msg="File parsing started.",
-        end_msg="File parsing completed.",
+        schemas,
+        symbols,
+        name="config_files/parse_files",
     )
-    return {"status": "files were preprocessed and stored in the temp folder"}
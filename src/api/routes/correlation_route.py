@@ -0,0 +1,58 @@
+"""
+This module defines the API routes for the covariance and correlation matrix cache.
+It includes a POST endpoint that builds the cache and a GET endpoint that reads a matrix.
+"""
+
+from enum import Enum
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.api.dependencies import get_covariance_handler
+from src.api.routes.utils import execute_with_logging
+from src.db.errors import MatrixNotFoundError
+
+router = APIRouter()
+
+
+class MatrixKind(str, Enum):
+    """Kinds of matrices served from the cache."""
+
+    COVARIANCE = "covariance"
+    CORRELATION = "correlation"
+
+
+@router.post("/build/", status_code=status.HTTP_200_OK, name="build_covariances")
+def build_covariances(
+    rebuild: bool = False, covariance_handler=Depends(get_covariance_handler)
+):
+    """Build or extend the cached weekly covariance matrices."""
+    execute_with_logging(
+        covariance_handler.build_covariances,
+        rebuild,
+        start_msg="Covariance matrix build started.",
+        end_msg="Covariance matrix build completed.",
+    )
+    return {"status": "covariance matrices were written to the cache"}
+
+
+@router.get("/matrix/", status_code=status.HTTP_200_OK, name="get_matrix")
+def get_matrix(
+    date: int,
+    kind: MatrixKind = MatrixKind.CORRELATION,
+    covariance_handler=Depends(get_covariance_handler),
+):
+    """Return the cached matrix of the last sampled week at or before the unix date."""
+    # Deferred with the handler, NumPy is not needed to start the application
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    try:
+        sample_date, symbols, matrix = covariance_handler.get_matrix(date, kind.value)
+    except MatrixNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
+    return {
+        "date": sample_date,
+        "symbols": symbols,
+        "matrix": np.where(np.isnan(matrix), None, matrix).tolist(),
+    }
@@ -0,0 +1,22 @@
+"""
+This module defines the API routes for the forecast stage.
+It includes a POST endpoint that computes carry forecasts for every instrument.
+"""
+
+from fastapi import APIRouter, Depends, status
+
+from src.api.dependencies import get_forecast_handler
+from src.api.routes.utils import execute_with_logging_async
+
+router = APIRouter()
+
+
+@router.post("/carry/", status_code=status.HTTP_200_OK, name="carry_forecasts")
+async def compute_carry_forecasts(forecast_handler=Depends(get_forecast_handler)):
+    """Compute carry forecasts from multiple prices."""
+    await execute_with_logging_async(
+        forecast_handler.compute_carry_forecasts_async,
+        start_msg="Carry forecast computation started.",
+        end_msg="Carry forecast computation completed.",
+    )
+    return {"status": "carry forecasts were computed"}
@@ -0,0 +1,83 @@
+"""
+This module defines the API routes for background jobs.
+It includes GET endpoints that report the status and per-schema progress of jobs, a Server-Sent Events
+stream of live throughput and a POST endpoint that cancels a job.
+"""
+
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+
+from src.core.config import settings
+from src.jobs.errors import JobNotFoundError
+from src.jobs.events import ThroughputSampler, format_event
+from src.jobs.job_manager import job_manager
+
+router = APIRouter()
+
+
+@router.get("/", status_code=status.HTTP_200_OK, name="list_jobs")
+async def list_jobs():
+    """Return the queued, running and recently finished jobs."""
+    return [job.to_dict() for job in job_manager.list()]
+
+
+@router.get("/events/", status_code=status.HTTP_200_OK, name="job_events")
+async def job_events(
+    request: Request,
+    job_id: str | None = None,
+    interval: float = settings.progress_event_interval,
+):
+    """
+    Stream live throughput events of every job, or of a single job until it is finished.
+    Every event reports rows and megabytes per second, completion and idle time per schema
+    together with the number of queued and running jobs.
+    """
+    if job_id is not None:
+        try:
+            job_manager.get(job_id)
+        except JobNotFoundError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+            ) from exc
+    return StreamingResponse(
+        _stream_events(request, job_id, max(interval, 0.1)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+async def _stream_events(request, job_id, interval):
+    sampler = ThroughputSampler()
+    while not await request.is_disconnected():
+        jobs = job_manager.list() if job_id is None else [job_manager.get(job_id)]
+        yield format_event(sampler.sample(jobs))
+        if job_id is not None and jobs[0].is_finished:
+            yield format_event(jobs[0].to_dict(), name="finished")
+            return
+        await asyncio.sleep(interval)
+
+
+@router.get("/{job_id}/", status_code=status.HTTP_200_OK, name="get_job")
+async def get_job(job_id: str):
+    """Return the status and progress of a job."""
+    try:
+        return job_manager.get(job_id).to_dict()
+    except JobNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
+
+
+@router.post(
+    "/{job_id}/cancel/", status_code=status.HTTP_202_ACCEPTED, name="cancel_job"
+)
+async def cancel_job(job_id: str):
+    """Request cancellation of a job, in-flight COPY commands are cancelled too."""
+    try:
+        return job_manager.cancel(job_id).to_dict()
+    except JobNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
@@ -0,0 +1,46 @@
+"""
+This module defines the API routes for the per-stage memory accounting.
+It includes endpoints that switch the accounting on and off, return the peaks and allocation sites
+recorded per stage and schema, and clear them.
+"""
+
+from fastapi import APIRouter, status
+
+from src.monitoring.memory import memory_tracker
+
+router = APIRouter()
+
+
+@router.get("/", status_code=status.HTTP_200_OK, name="memory_report")
+async def memory_report(
+    stage: str | None = None, schema: str | None = None, limit: int = 100
+):
+    """
+    Return the memory recorded per stage and schema, largest peak first, optionally of
+    one stage or schema.
+    """
+    return {
+        "enabled": memory_tracker.enabled,
+        "stages": memory_tracker.report(stage, schema)[:limit],
+    }
+
+
+@router.post("/enable/", status_code=status.HTTP_200_OK, name="enable_memory")
+async def enable_memory_tracking():
+    """Start recording the memory of the pipeline stages, which slows them down."""
+    memory_tracker.enable()
+    return {"enabled": memory_tracker.enabled}
+
+
+@router.post("/disable/", status_code=status.HTTP_200_OK, name="disable_memory")
+async def disable_memory_tracking():
+    """Stop recording the memory of the pipeline stages, the report is kept."""
+    memory_tracker.disable()
+    return {"enabled": memory_tracker.enabled}
+
+
+@router.delete("/", status_code=status.HTTP_200_OK, name="reset_memory")
+async def reset_memory_report():
+    """Clear the recorded memory report."""
+    memory_tracker.reset()
+    return {"enabled": memory_tracker.enabled}
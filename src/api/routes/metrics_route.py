@@ -0,0 +1,19 @@
+"""
+This module defines the API route exposing the application metrics.
+It includes a GET endpoint that renders the metrics in the Prometheus text format.
+"""
+
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from src.monitoring.metrics import render_metrics
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+@router.get("/metrics", status_code=status.HTTP_200_OK, name="metrics")
+async def metrics():
+    """Return stage timings, row and byte counters and cache hit rates."""
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,36 @@
+"""
+This module defines the API routes for the array-packed raw data tables.
+It includes a GET endpoint that reads the full history of a symbol from a packed table.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.api.dependencies import get_packed_series_handler
+from src.db.errors import TableOrColumnNotFoundError
+from src.handlers.errors import UnknownSchemaError
+
+router = APIRouter()
+
+
+@router.get(
+    "/{table_name}/{symbol}/", status_code=status.HTTP_200_OK, name="get_packed_series"
+)
+async def get_packed_series(
+    table_name: str,
+    symbol: str,
+    columns: list[str] | None = Query(None),
+    packed_series_handler=Depends(get_packed_series_handler),
+):
+    """
+    Return the full history of a symbol from the packed table of a raw data table,
+    optionally only the given value columns. Requires PACKED_SERIES.
+    """
+    try:
+        series = await packed_series_handler.read_series_async(
+            table_name, symbol, columns
+        )
+    except (UnknownSchemaError, TableOrColumnNotFoundError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
+    return {"table": table_name, "symbol": symbol, "series": series}
@@ -0,0 +1,25 @@
+"""
+This module defines the API routes for the memory-mapped price matrix store.
+It includes a POST endpoint that builds or extends the matrices from the seeded tables.
+"""
+
+from fastapi import APIRouter, Depends, status
+
+from src.api.dependencies import get_price_matrix_handler
+from src.api.routes.utils import execute_with_logging_async
+
+router = APIRouter()
+
+
+@router.post("/build/", status_code=status.HTTP_200_OK, name="build_price_matrices")
+async def build_price_matrices(
+    rebuild: bool = False, price_matrix_handler=Depends(get_price_matrix_handler)
+):
+    """Build or extend the aligned price matrices from the database tables."""
+    await execute_with_logging_async(
+        price_matrix_handler.build_matrices_async,
+        rebuild,
+        start_msg="Price matrix build started.",
+        end_msg="Price matrix build completed.",
+    )
+    return {"status": "price matrices were written to the matrix store"}
@@ -0,0 +1,42 @@
+"""
+This module defines the API routes for stored profiles.
+It includes GET endpoints that list the profiles recorded for opted-in requests and return their artifacts.
+"""
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse
+
+from src.monitoring.errors import ProfileNotFoundError
+from src.monitoring.profiling import profile_store
+
+router = APIRouter()
+
+
+@router.get("/", status_code=status.HTTP_200_OK, name="list_profiles")
+async def list_profiles():
+    """Return the metadata of the stored profiles, newest first."""
+    return profile_store.list()
+
+
+@router.get("/{profile_id}/", status_code=status.HTTP_200_OK, name="get_profile")
+async def get_profile(profile_id: str):
+    """Return the metadata of a profile."""
+    try:
+        return profile_store.get(profile_id)
+    except ProfileNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
+
+
+@router.get(
+    "/{profile_id}/{artifact}", status_code=status.HTTP_200_OK, name="get_artifact"
+)
+async def get_profile_artifact(profile_id: str, artifact: str):
+    """Download an artifact of a profile: profile.pstats, summary.txt or allocations.txt."""
+    try:
+        return FileResponse(profile_store.artifact_path(profile_id, artifact))
+    except ProfileNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
@@ -1,23 +1,31 @@
 """
 This module defines the API routes for raw data processing.
-It includes a POST endpoint for parsing raw data files and storing them in a temporary location.
+It includes a POST endpoint that starts parsing raw data files and storing them in a temporary location
+as a background job.
 """
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, Query, status
 
-from src.api.routes.utils import execute_with_logging
-from src.handlers.raw_data_handler import RawDataHandler
+from src.api.dependencies import get_raw_data_handler
+from src.api.routes.utils import check_schema_filter, submit_job
 
 router = APIRouter()
-data_handler = RawDataHandler()
 
 
-@router.post("/parse_files/", status_code=status.HTTP_200_OK, name="parse_files")
-def parse_raw_data_files():
-    """Parse raw data files and store them in temp."""
-    execute_with_logging(
+@router.post("/parse_files/", status_code=status.HTTP_202_ACCEPTED, name="parse_files")
+async def parse_raw_data_files(
+    schemas: list[str] | None = Query(None),
+    symbols: list[str] | None = Query(None),
+    data_handler=Depends(get_raw_data_handler),
+):
+    """
+    Start parsing raw data files and storing them in temp, returns the job to poll.
+    Schema and symbol filters take glob patterns and limit the parsed files.
+    """
+    check_schema_filter(data_handler.schemas, schemas)
+    return submit_job(
         data_handler.handle_data_processing,
-        start_msg="Raw data file parsing started.",
-        end_msg="Raw data file parsing completed.",
+        schemas,
+        symbols,
+        name="raw_data/parse_files",
     )
-    return {"status": "Raw data files were preprocessed and stored in the temp folder"}
@@ -0,0 +1,36 @@
+"""
+This module defines the API route for the one-shot database rebuild.
+It includes a POST endpoint that starts resetting, creating, parsing and seeding every table as one background job.
+"""
+
+from fastapi import APIRouter, Depends, Query, status
+
+from src.api.dependencies import get_rebuild_handler
+from src.api.routes.utils import check_schema_filter, submit_job
+from src.db.repositories.advisory_locks import GLOBAL
+from src.db.schemas.schemas import select_schemas
+
+router = APIRouter()
+
+
+@router.post("/", status_code=status.HTTP_202_ACCEPTED, name="rebuild")
+async def rebuild_database(
+    schemas: list[str] | None = Query(None),
+    symbols: list[str] | None = Query(None),
+    rebuild_handler=Depends(get_rebuild_handler),
+):
+    """
+    Start the complete rebuild of the database, returns the job to poll.
+    With schema or symbol filters only the matching rows are parsed and replaced.
+    """
+    check_schema_filter(rebuild_handler.seed_handler.schemas, schemas)
+    # A full rebuild drops every table, a filtered one only replaces rows
+    lock = GLOBAL
+    if schemas or symbols:
+        lock = [
+            schema.table_name
+            for schema in select_schemas(rebuild_handler.seed_handler.schemas, schemas)
+        ]
+    return submit_job(
+        rebuild_handler.rebuild_async, schemas, symbols, name="rebuild", lock=lock
+    )
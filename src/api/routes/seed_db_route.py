@@ -1,24 +1,36 @@
 """
 This module defines the API routes for seeding the database.
-It includes a POST endpoint to fill the database tables with data from a temporary folder.
+It includes a POST endpoint that starts filling the database tables with data from a temporary folder
+as a background job.
 """
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, Query, status
 
-from src.api.routes.utils import execute_with_logging_async
-from src.core.config import settings
-from src.handlers.seed_db_handler import SeedDBHandler
+from src.api.dependencies import get_seed_db_handler
+from src.api.routes.utils import check_schema_filter, submit_job
+from src.db.schemas.schemas import select_schemas
 
 router = APIRouter()
-seed_db_handler = SeedDBHandler(settings.database_url)
 
 
-@router.post("/seed_db/", status_code=status.HTTP_200_OK, name="seed_db")
-async def fill_database():
-    """Fill the database tables with data."""
-    await execute_with_logging_async(
+@router.post("/seed_db/", status_code=status.HTTP_202_ACCEPTED, name="seed_db")
+async def fill_database(
+    schemas: list[str] | None = Query(None),
+    symbols: list[str] | None = Query(None),
+    seed_db_handler=Depends(get_seed_db_handler),
+):
+    """
+    Start filling the database tables with data, returns the job to poll.
+    With a symbol filter only the stored rows of the matching symbols are replaced.
+    """
+    check_schema_filter(seed_db_handler.schemas, schemas)
+    tables = [
+        schema.table_name for schema in select_schemas(seed_db_handler.schemas, schemas)
+    ]
+    return submit_job(
         seed_db_handler.insert_data_from_csv_async,
-        start_msg="Database table filling started.",
-        end_msg="Database table filling completed.",
+        schemas,
+        symbols,
+        name="seed_db",
+        lock=tables,
     )
-    return {"status": "Table was filled with data from temp folder"}
@@ -0,0 +1,44 @@
+"""
+This module defines the API routes for the materialized snapshot views.
+It includes a GET endpoint that reads the latest row or the summary statistics of every symbol.
+"""
+
+from enum import Enum
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.api.dependencies import get_snapshot_handler
+from src.handlers.errors import UnknownSchemaError
+
+router = APIRouter()
+
+
+class SnapshotKind(str, Enum):
+    """Kinds of snapshot views."""
+
+    LATEST = "latest"
+    SUMMARY = "summary"
+
+
+@router.get(
+    "/{table_name}/{kind}/", status_code=status.HTTP_200_OK, name="get_snapshot"
+)
+async def get_snapshot(
+    table_name: str,
+    kind: SnapshotKind,
+    symbols: list[str] | None = Query(None),
+    snapshot_handler=Depends(get_snapshot_handler),
+):
+    """
+    Return the latest row or the first and last date and row count of every symbol in a
+    raw data table, optionally only of the symbols matching glob patterns.
+    """
+    try:
+        rows = await snapshot_handler.read_snapshot_async(
+            table_name, kind.value, symbols
+        )
+    except UnknownSchemaError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
+    return {"table": table_name, "kind": kind.value, "rows": rows}
@@ -0,0 +1,27 @@
+"""
+This module defines the API routes for the tracing spans kept in memory.
+It includes GET endpoints that return the recent spans and the slowest spans, stages or instruments.
+"""
+
+from fastapi import APIRouter, status
+
+from src.monitoring.tracing import exporter
+
+router = APIRouter()
+
+
+@router.get("/spans/", status_code=status.HTTP_200_OK, name="list_spans")
+async def list_spans(
+    name: str | None = None, trace_id: str | None = None, limit: int = 1000
+):
+    """Return the most recent finished spans, optionally of one name or trace."""
+    return exporter.spans(name, trace_id)[-limit:]
+
+
+@router.get("/slowest/", status_code=status.HTTP_200_OK, name="slowest_spans")
+async def slowest_spans(name: str, group_by: str | None = None, limit: int = 10):
+    """
+    Return the slowest spans of a name, or the attribute values with the largest total
+    duration, e.g. name=file&group_by=symbol for the slowest instruments.
+    """
+    return exporter.slowest(name, group_by, limit)
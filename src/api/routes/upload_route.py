@@ -0,0 +1,72 @@
+"""
+This module defines the API route for streamed CSV uploads.
+It includes a POST endpoint per table that copies an uploaded CSV into the database without buffering it.
+"""
+
+from enum import Enum
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from src.api.dependencies import get_upload_handler
+from src.api.routes.utils import admit_run
+from src.data_processing.errors import (
+    ColumnRenameError,
+    DataTypeCastError,
+    StreamDecodingError,
+)
+from src.db.errors import LockTimeoutError
+from src.handlers.errors import InvalidUploadError, UnknownSchemaError
+
+router = APIRouter()
+
+
+class Compression(str, Enum):
+    """Compressions of uploaded bodies."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+@router.post("/{table_name}/", status_code=status.HTTP_201_CREATED, name="upload_csv")
+async def upload_csv(
+    table_name: str,
+    request: Request,
+    symbol: str | None = None,
+    compression: Compression | None = None,
+    upload_handler=Depends(get_upload_handler),
+):
+    """
+    Copy the CSV in the request body into a config or raw data table. Raw data uploads need
+    the symbol of the rows. The compression defaults to the Content-Encoding header.
+    """
+    if compression is None:
+        encoding = request.headers.get("content-encoding", "none").lower()
+        try:
+            compression = Compression(encoding)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail=f"Unsupported Content-Encoding {encoding}",
+            ) from exc
+    upload = admit_run(upload_handler.upload_csv_async, [table_name])
+    try:
+        rows = await upload(table_name, request.stream(), compression.value, symbol)
+    except UnknownSchemaError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)
+        ) from exc
+    except LockTimeoutError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+        ) from exc
+    except (
+        InvalidUploadError,
+        StreamDecodingError,
+        ColumnRenameError,
+        DataTypeCastError,
+    ) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    return {"status": f"{rows} rows were copied into {table_name}", "rows": rows}
@@ -1,19 +1,40 @@
 """
 Utility functions for executing tasks with logging.
-These functions are used to handle both asynchronous and synchronous operations.
+These functions are used to handle both asynchronous and synchronous operations,
+either within the request or as background jobs.
 """
 
 import logging
 
 from fastapi import HTTPException, status
 
+from src.db.errors import LockTimeoutError
+from src.db.schemas.schemas import select_schemas
+from src.jobs.admission import admission
+from src.jobs.errors import PipelineBusyError
+from src.jobs.job_manager import job_manager
+from src.monitoring.errors import ProfilingBusyError
+from src.monitoring.metrics import stage_timer
+from src.monitoring.profiling import maybe_profiled
 
-async def execute_with_logging_async(task, *args, start_msg, end_msg):
-    """Helper function to wrap asynchronous task execution with logging."""
+
+async def execute_with_logging_async(task, *args, start_msg, end_msg, lock=None):
+    """
+    Helper function to wrap asynchronous task execution with logging and stage timing.
+    With a lock scope the task first waits for the pipeline locks.
+    """
+    if lock is not None:
+        task = admit_run(task, lock)
     logging.info(start_msg)
 
     try:
-        await task(*args)
+        with stage_timer(task.__name__):
+            await maybe_profiled(task, task.__name__)(*args)
+    except (LockTimeoutError, ProfilingBusyError) as exc:
+        logging.error("Error occurred: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+        ) from exc
     except Exception as exc:
         logging.error("Error occurred: %s", exc)
         raise HTTPException(
@@ -25,11 +46,17 @@ async def execute_with_logging_async(task, *args, start_msg, end_msg):
 
 
 def execute_with_logging(task, *args, start_msg, end_msg):
-    """Helper function to wrap synchronous task execution with logging."""
+    """Helper function to wrap synchronous task execution with logging and stage timing."""
     logging.info(start_msg)
 
     try:
-        task(*args)
+        with stage_timer(task.__name__):
+            maybe_profiled(task, task.__name__)(*args)
+    except ProfilingBusyError as exc:
+        logging.error("Error occurred: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+        ) from exc
     except Exception as exc:
         logging.error("Error occurred: %s", exc)
         raise HTTPException(
@@ -38,3 +65,40 @@ def execute_with_logging(task, *args, start_msg, end_msg):
         ) from exc
 
     logging.info(end_msg)
+
+
+def submit_job(task, *args, name, lock=None):
+    """
+    Helper function to start a task as a background job and describe it to the client.
+    With a lock scope the job first waits for the pipeline locks.
+    """
+    if lock is not None:
+        task = admit_run(task, lock)
+    job = job_manager.submit(name, task, *args)
+    if lock is not None:
+        # A job cancelled while queued never waits for its locks
+        job.task.add_done_callback(lambda _: task.release())
+    logging.info("Job %s (%s) was queued.", job.id, name)
+    return job.to_dict()
+
+
+def check_schema_filter(schemas, patterns):
+    """Helper function to reject a schema filter that selects none of the given schemas."""
+    if patterns and not select_schemas(schemas, patterns):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No schema matches {', '.join(patterns)}",
+        )
+
+
+def admit_run(task, lock):
+    """Helper function to admit a run that changes the database, or reject it with 429."""
+    try:
+        return admission.admit(task, lock)
+    except PipelineBusyError as exc:
+        logging.warning("Run of %s was rejected: %s", task.__name__, exc)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(exc),
+            headers={"Retry-After": "10"},
+        ) from exc
@@ -31,12 +31,65 @@ class GlobalConfig(BaseConfig):
     postgres_user: str = os.getenv("DB_USER")
     postgres_password: str = os.getenv("DB_PASSWORD")
     postgres_server: str = os.getenv("POSTGRES_SERVER")
-    postgres_port: int = int(os.getenv("DB_PORT"))
+    postgres_port: int = int(os.getenv("DB_PORT", "5432"))
     postgres_db: str = os.getenv("DB_NAME")
 
     postgres_db_tests: str = os.environ.get("POSTGRES_DB_TESTS", "test_grayfox_db")
     db_echo_log: bool = debug
 
+    price_rollups: bool = os.environ.get("PRICE_ROLLUPS", "False") == "True"
+    # Raw data rows reference the 'symbols' table by id, switching needs a reset
+    compact_symbols: bool = os.environ.get("COMPACT_SYMBOLS", "False") == "True"
+    # Raw data tables also get '<table>_packed' copies with per symbol and year arrays
+    packed_series: bool = os.environ.get("PACKED_SERIES", "False") == "True"
+    # Materialized latest-row and summary views per raw data table, refreshed by seeding
+    snapshot_views: bool = os.environ.get("SNAPSHOT_VIEWS", "True") == "True"
+
+    volatility_window: int = int(os.environ.get("VOLATILITY_WINDOW", "25"))
+    volatility_ewma_span: int = int(os.environ.get("VOLATILITY_EWMA_SPAN", "35"))
+
+    carry_smooth_span: int = int(os.environ.get("CARRY_SMOOTH_SPAN", "90"))
+    carry_forecast_scalar: float = float(os.environ.get("CARRY_FORECAST_SCALAR", "30"))
+    forecast_cap: float = float(os.environ.get("FORECAST_CAP", "20"))
+
+    # Root of the pysystemtrade data tree, mounted into the container by docker compose
+    source_data_path: str = os.environ.get("SOURCE_DATA_PATH", "/path/in/container")
+    temp_data_path: str = os.environ.get("TEMP_DATA_PATH", "/tmp")
+
+    price_matrix_path: str = os.environ.get("PRICE_MATRIX_PATH", "/tmp/price_matrices")
+    covariance_path: str = os.environ.get("COVARIANCE_PATH", "/tmp/covariance")
+    correlation_ewma_span: int = int(os.environ.get("CORRELATION_EWMA_SPAN", "25"))
+
+    max_concurrent_jobs: int = int(os.environ.get("MAX_CONCURRENT_JOBS", "2"))
+    job_history_size: int = int(os.environ.get("JOB_HISTORY_SIZE", "100"))
+    copy_batch_size: int = int(os.environ.get("COPY_BATCH_SIZE", "100000"))
+    # Seeded rows are copied ordered by (symbol, unix_date_time) and the tables finalised
+    sort_before_copy: bool = os.environ.get("SORT_BEFORE_COPY", "False") == "True"
+    analyze_after_seed: bool = os.environ.get("ANALYZE_AFTER_SEED", "True") == "True"
+    cluster_after_seed: bool = os.environ.get("CLUSTER_AFTER_SEED", "False") == "True"
+    table_fillfactor: int = int(os.environ.get("TABLE_FILLFACTOR", "0"))
+    max_index_builds: int = int(os.environ.get("MAX_INDEX_BUILDS", "2"))
+    concurrent_index_builds: bool = (
+        os.environ.get("CONCURRENT_INDEX_BUILDS", "False") == "True"
+    )
+    profile_path: str = os.environ.get("PROFILE_PATH", "/tmp/profiles")
+    profile_retention: int = int(os.environ.get("PROFILE_RETENTION", "20"))
+    memory_tracking: bool = os.environ.get("MEMORY_TRACKING", "False") == "True"
+    memory_top_sites: int = int(os.environ.get("MEMORY_TOP_SITES", "10"))
+    trace_buffer_size: int = int(os.environ.get("TRACE_BUFFER_SIZE", "10000"))
+    trace_file: str = os.environ.get("TRACE_FILE")
+    max_parallel_parses: int = int(
+        os.environ.get("MAX_PARALLEL_PARSES", str(os.cpu_count() or 1))
+    )
+    max_waiting_runs: int = int(os.environ.get("MAX_WAITING_RUNS", "4"))
+    lock_wait_timeout: float = float(os.environ.get("LOCK_WAIT_TIMEOUT", "600"))
+    max_copy_connections: int = int(os.environ.get("MAX_COPY_CONNECTIONS", "4"))
+    preload_handlers: bool = os.environ.get("PRELOAD_HANDLERS", "False") == "True"
+    upload_chunk_rows: int = int(os.environ.get("UPLOAD_CHUNK_ROWS", "50000"))
+    progress_event_interval: float = float(
+        os.environ.get("PROGRESS_EVENT_INTERVAL", "1")
+    )
+
     @property
     def database_url(self) -> str:
         """Construct and return the PostgreSQL database URL."""
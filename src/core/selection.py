@@ -0,0 +1,38 @@
+"""
+This module provides the matching of schema and symbol filters.
+
+Filters are lists of shell-style glob patterns such as 'adjusted_prices' or 'GOLD*'.
+An empty filter selects everything.
+"""
+
+from fnmatch import fnmatchcase
+
+
+def matches_any(name, patterns=None) -> bool:
+    """
+    Checks whether a name is selected by a filter.
+
+    Parameters:
+        name (str): The schema table name or symbol to check.
+        patterns (list, optional): Glob patterns of the filter.
+
+    Returns:
+        bool: True if the filter is empty or any pattern matches the name.
+    """
+    if not patterns:
+        return True
+    return any(fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def select_names(names, patterns=None):
+    """
+    Returns the names selected by a filter, keeping their order.
+
+    Parameters:
+        names (iterable): Schema table names or symbols.
+        patterns (list, optional): Glob patterns of the filter.
+
+    Returns:
+        list: The selected names.
+    """
+    return [name for name in names if matches_any(name, patterns)]
@@ -0,0 +1,171 @@
+"""
+Covariance Helper module.
+
+This module provides functions that compute EWMA-weighted covariance and correlation
+matrices of weekly instrument returns from an aligned date x symbol price panel. The
+matrices are packed into compact upper-triangle vectors, one per sampled week.
+
+Missing prices are handled pairwise: every pair of instruments keeps its own EWMA weight,
+so an instrument that starts trading later does not distort the matrices of the others.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing.errors import CovarianceComputationError
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SECONDS_IN_DAY = 86400
+# 1970-01-01 was a Thursday, shifting by three days makes weeks start on Monday
+WEEK_START_OFFSET_DAYS = 3
+
+
+def weekly_sample_positions(dates):
+    """
+    Returns the positions of the last date of every complete week.
+    The last week of the panel is treated as incomplete and is not sampled.
+
+    Parameters:
+        dates (np.ndarray): Sorted unix timestamps.
+
+    Returns:
+        np.ndarray: Positions of the weekly sample dates.
+    """
+    weeks = _week_numbers(dates)
+    return np.flatnonzero(weeks[1:] != weeks[:-1])
+
+
+def weekly_sample_prices(dates, prices):
+    """
+    Samples the last price of every instrument within every complete week, so an instrument
+    without a price on the last trading date of a week, e.g. on a holiday, keeps its week.
+
+    Parameters:
+        dates (np.ndarray): Sorted unix timestamps of the panel rows.
+        prices (np.ndarray): Date x symbol matrix of prices.
+
+    Returns:
+        tuple: Unix timestamps of the last date of every complete week and the week x symbol
+        matrix of prices, NaN where an instrument has no price during the whole week.
+    """
+    positions = weekly_sample_positions(dates)
+    # last() skips NaN, which forward-fills every instrument within its week
+    weekly = pd.DataFrame(np.asarray(prices)).groupby(_week_numbers(dates)).last()
+    return np.asarray(dates)[positions], weekly.to_numpy()[: len(positions)]
+
+
+def _week_numbers(dates):
+    return (np.asarray(dates) // SECONDS_IN_DAY + WEEK_START_OFFSET_DAYS) // 7
+
+
+class EwmaCovarianceState:
+    """
+    Running EWMA sums that allow the covariance recursion to continue with new weeks.
+    """
+
+    def __init__(self, weighted_products, weights, last_prices):
+        """
+        Initialize the state.
+
+        Parameters:
+            weighted_products (np.ndarray): EWMA of the pairwise products of returns.
+            weights (np.ndarray): EWMA of the pairwise indicators that both returns are present.
+            last_prices (np.ndarray): Prices of the last sampled week, used for the next return.
+        """
+        self.weighted_products = weighted_products
+        self.weights = weights
+        self.last_prices = last_prices
+
+    @classmethod
+    def empty(cls, size):
+        """
+        Creates the state of a panel with no sampled weeks yet.
+
+        Parameters:
+            size (int): Number of instruments.
+
+        Returns:
+            EwmaCovarianceState: State with zero sums and no last prices.
+        """
+        return cls(
+            np.zeros((size, size)), np.zeros((size, size)), np.full(size, np.nan)
+        )
+
+
+def compute_ewma_covariances(weekly_prices, span, state):
+    """
+    Computes the EWMA covariance matrix after every sampled week.
+
+    Parameters:
+        weekly_prices (np.ndarray): Week x symbol matrix of sampled prices.
+        span (int): Span of the EWMA in weeks.
+        state (EwmaCovarianceState): State after the previously processed week.
+
+    Returns:
+        tuple: Week x upper-triangle float32 array of packed covariance matrices
+        and the updated state.
+    """
+    try:
+        decay = 1 - 2 / (span + 1)
+        products, weights = state.weighted_products.copy(), state.weights.copy()
+        previous_prices = state.last_prices.copy()
+        rows, columns = np.triu_indices(len(previous_prices))
+        covariances = np.empty((len(weekly_prices), len(rows)), dtype=np.float32)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for week, prices in enumerate(weekly_prices):
+                returns = prices / previous_prices - 1
+                present = np.isfinite(returns)
+                returns = np.where(present, returns, 0.0)
+                products = decay * products + (1 - decay) * np.outer(returns, returns)
+                weights = decay * weights + (1 - decay) * np.outer(present, present)
+                pair_weights = weights[rows, columns]
+                covariances[week] = np.where(
+                    pair_weights > 0, products[rows, columns] / pair_weights, np.nan
+                )
+                # Keep the last known price of instruments without a price this week
+                previous_prices = np.where(np.isnan(prices), previous_prices, prices)
+
+        return covariances, EwmaCovarianceState(products, weights, previous_prices)
+    except Exception as error:
+        logger.error("Error during covariance computation: %s", error)
+        raise CovarianceComputationError from error
+
+
+def covariance_to_correlation(covariance):
+    """
+    Converts a covariance matrix to a correlation matrix.
+
+    Parameters:
+        covariance (np.ndarray): Symmetric covariance matrix.
+
+    Returns:
+        np.ndarray: Correlation matrix clipped to [-1, 1], NaN where a variance is missing.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        deviations = np.sqrt(np.diag(covariance))
+        correlation = covariance / np.outer(deviations, deviations)
+    return np.clip(correlation, -1.0, 1.0)
+
+
+def from_upper_triangle(vector, size):
+    """
+    Unpacks an upper triangle vector into a full symmetric matrix.
+
+    Parameters:
+        vector (np.ndarray): Upper triangle values including the diagonal.
+        size (int): Number of rows and columns of the matrix.
+
+    Returns:
+        np.ndarray: Symmetric size x size matrix.
+    """
+    matrix = np.empty((size, size), dtype=np.float64)
+    rows, columns = np.triu_indices(size)
+    matrix[rows, columns] = vector
+    matrix[columns, rows] = vector
+    return matrix
@@ -11,15 +11,19 @@ import logging
 
 import pandas as pd
 
+from src.monitoring.metrics import timed
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def load_csv(path: str, base_path: str = "") -> pd.DataFrame:
+@timed("load_csv")
+def load_csv(path: str, base_path: str = "", dtype=None) -> pd.DataFrame:
     """Load CSV file from the given path.
     Args:
         path (str): Path to the CSV file.
         base_path (str): Base path for the CSV file.
+        dtype (dict, optional): Dtypes of columns, the others are inferred.
 
     Returns:
         pd.DataFrame: Loaded dataframe.
@@ -27,12 +31,13 @@ def load_csv(path: str, base_path: str = "") -> pd.DataFrame:
     full_path = _get_full_path(base_path, path)
     try:
         logger.info("Loading CSV file from %s", full_path)
-        return pd.read_csv(full_path)
+        return pd.read_csv(full_path, dtype=dtype)
     except Exception as error:
         logger.error("Error loading CSV file from %s: %s", full_path, error)
         raise
 
 
+@timed("save_csv")
 def save_to_csv(data_frame: pd.DataFrame, path: str, base_path: str = ""):
     """Save dataframe to the given CSV path.
 
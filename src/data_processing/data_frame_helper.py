@@ -3,28 +3,34 @@ Data Frame Helper module.
 
 This module provides utility functions to preprocess and transform pandas DataFrames. 
 It provides functions to rename columns, handle empty values, add symbols, convert 
-datetime columns to UNIX timestamp, and aggregate raw prices to daily averages.
+datetime columns to UNIX timestamp, aggregate raw prices to daily averages and roll
+them up to daily, weekly and monthly OHLC bars.
 """
 
 import logging
 
 import pandas as pd
 
+from src.core.selection import matches_any
 from src.data_processing.errors import (
     ColumnRenameError,
     DataAggregationError,
+    DataRollupError,
+    DataTypeCastError,
     DateTimeConversionError,
     DuplicateRowsError,
     EmptyValueFillError,
     InvalidDatetimeColumnError,
     SymbolAdditionError,
 )
+from src.monitoring.metrics import timed
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@timed("rename_columns")
 def rename_columns(data_frame, new_column_names):
     """
     Renames DataFrame columns based on the provided dictionary.
@@ -71,6 +77,42 @@ def add_symbol_by_file_name(data_frame, symbol):
         raise SymbolAdditionError from error
 
 
+def filter_symbols(data_frame, patterns=None):
+    """
+    Keeps the rows whose 'symbol' matches any of the glob patterns, all rows if there are none.
+    """
+    if not patterns:
+        return data_frame
+    selected = data_frame["symbol"].map(lambda symbol: matches_any(symbol, patterns))
+    return data_frame[selected]
+
+
+def cast_columns(data_frame, dtypes):
+    """
+    Casts the columns of the DataFrame that have a dtype in the mapping, the others are kept.
+    Integral floats such as averaged contract months become integers again.
+    """
+    present = {
+        column: dtype for column, dtype in dtypes.items() if column in data_frame
+    }
+    try:
+        return data_frame.astype(present)
+    except (TypeError, ValueError) as error:
+        logger.error("Error during casting columns: %s", error)
+        raise DataTypeCastError(f"Columns cannot be cast to {present}") from error
+
+
+@timed("sort")
+def sort_rows(data_frame, columns):
+    """
+    Sorts the rows by the given columns, keeping the order of equal keys.
+    """
+    if not columns:
+        return data_frame
+    return data_frame.sort_values(list(columns), kind="stable", ignore_index=True)
+
+
+@timed("convert_datetime")
 def convert_datetime_to_unixtime(data_frame):
     """
     Converts the date_column to UNIX time.
@@ -86,6 +128,7 @@ def convert_datetime_to_unixtime(data_frame):
         raise DateTimeConversionError from error
 
 
+@timed("aggregate")
 def aggregate_to_day_based_prices(data_frame):
     """
     Aggregates the time-based price data to daily averages.
@@ -97,7 +140,8 @@ def aggregate_to_day_based_prices(data_frame):
         DataFrame: Aggregated DataFrame with daily average prices.
     """
     try:
-        converted_date = convert_column_to_datetime(data_frame, "unix_date_time")
+        # Untimed, the conversion is part of the aggregate stage
+        converted_date = _to_datetime_column(data_frame, "unix_date_time")
         # Set DATETIME as index
         converted_date.set_index("unix_date_time", inplace=True)
         # Resample to daily frequency using the mean of the prices for each day
@@ -110,6 +154,115 @@ def aggregate_to_day_based_prices(data_frame):
         raise DataAggregationError from error
 
 
+@timed("aggregate")
+def build_daily_bars(data_frame):
+    """
+    Aggregates time-based price data to daily OHLC bars in a single grouped pass over the rows.
+
+    Parameters:
+        data_frame: DataFrame containing 'unix_date_time' and 'price' columns
+
+    Returns:
+        DataFrame: Daily bars indexed by the day, with 'open', 'high', 'low', 'close', 'mean'
+        and 'sample_count' columns.
+    """
+    try:
+        converted = _to_datetime_column(
+            data_frame[["unix_date_time", "price"]], "unix_date_time"
+        ).sort_values("unix_date_time", kind="stable")
+        daily = converted.groupby(converted["unix_date_time"].dt.floor("D"))[
+            "price"
+        ].agg(
+            open="first",
+            high="max",
+            low="min",
+            close="last",
+            mean="mean",
+            sample_count="count",
+        )
+        return daily[daily["sample_count"] > 0]
+    except Exception as error:
+        logger.error("Error during price rollup: %s", error)
+        raise DataRollupError from error
+
+
+@timed("rollup")
+def roll_up_daily_bars(daily_bars, resolutions):
+    """
+    Derives the requested rollups from daily OHLC bars.
+
+    Parameters:
+        daily_bars: Daily bars as returned by build_daily_bars
+        resolutions: Resolutions to return, any of 'daily', 'weekly' and 'monthly'
+
+    Returns:
+        dict: Mapping of each resolution to a DataFrame with 'unix_date_time', 'open', 'high',
+        'low', 'close', 'mean' and 'sample_count' columns, labelled with the period start.
+    """
+    try:
+        rollups = {"daily": daily_bars}
+        for resolution, frequency in (("weekly", "W-MON"), ("monthly", "MS")):
+            if resolution in resolutions:
+                rollups[resolution] = _roll_up_bars(daily_bars, frequency)
+        return {
+            resolution: rollups[resolution].reset_index() for resolution in resolutions
+        }
+    except Exception as error:
+        logger.error("Error during price rollup: %s", error)
+        raise DataRollupError from error
+
+
+def build_price_rollups(data_frame, resolutions):
+    """
+    Rolls time-based price data up to OHLC bars.
+    The daily bars are built from the raw rows; weekly and monthly bars are derived from them.
+
+    Parameters:
+        data_frame: DataFrame containing 'unix_date_time' and 'price' columns
+        resolutions: Resolutions to return, any of 'daily', 'weekly' and 'monthly'
+
+    Returns:
+        dict: Mapping of each resolution to a DataFrame with 'unix_date_time', 'open', 'high',
+        'low', 'close', 'mean' and 'sample_count' columns, labelled with the period start.
+    """
+    return roll_up_daily_bars(build_daily_bars(data_frame), resolutions)
+
+
+def daily_bars_to_prices(daily_bars):
+    """
+    Returns the daily average prices of daily OHLC bars, the same result
+    aggregate_to_day_based_prices gives for the rows the bars were built from.
+
+    Parameters:
+        daily_bars: Daily bars as returned by build_daily_bars
+
+    Returns:
+        DataFrame: DataFrame with 'unix_date_time' and 'price' rounded to 1 decimal place.
+    """
+    return daily_bars["mean"].round(1).rename("price").reset_index()
+
+
+def _roll_up_bars(bars, frequency):
+    """Rolls OHLC bars up to a coarser frequency, weighting the means by their sample counts."""
+    resampled = bars.assign(price_sum=bars["mean"] * bars["sample_count"]).resample(
+        frequency, label="left", closed="left"
+    )
+    result = resampled.agg(
+        {
+            "open": "first",
+            "high": "max",
+            "low": "min",
+            "close": "last",
+            "price_sum": "sum",
+            "sample_count": "sum",
+        }
+    )
+    result = result[result["sample_count"] > 0]
+    result.insert(4, "mean", result.pop("price_sum") / result["sample_count"])
+    return result
+
+
+@timed("convert_datetime")
 def convert_column_to_datetime(data_frame, column_name):
     """
     Converts a specified column in the DataFrame to datetime format.
@@ -121,6 +274,11 @@ def convert_column_to_datetime(data_frame, column_name):
     Returns:
         pd.DataFrame: A new DataFrame with the specified column converted to datetime.
     """
+    return _to_datetime_column(data_frame, column_name)
+
+
+def _to_datetime_column(data_frame, column_name):
+    # Shared by the timed stages, so each conversion is recorded in one stage only
     new_df = data_frame.copy()  # Create a new DataFrame
     try:
         # Ensure the column is of a datetime type
@@ -138,6 +296,7 @@ def convert_column_to_datetime(data_frame, column_name):
     return new_df
 
 
+@timed("concat_dedup")
 def concat_dataframes(data_frames):
     """
     Concatenates a list of pandas DataFrames, resetting the index and checking for duplicate rows.
@@ -161,3 +320,16 @@ def concat_dataframes(data_frames):
             f"Found duplicate rows based on 'unix_date_time' and 'symbol': {concatenated_df[duplicate_rows]}"
         )
     return concatenated_df
+
+
+def replace_nan_with_none(data_frame):
+    """
+    Replaces NaN values with None so that they are stored as NULL instead of NaN in the database.
+
+    Parameters:
+        data_frame (pd.DataFrame): The DataFrame to convert.
+
+    Returns:
+        pd.DataFrame: A new object DataFrame with None in place of missing values.
+    """
+    return data_frame.astype(object).where(data_frame.notna(), None)
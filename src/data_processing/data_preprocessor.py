@@ -9,22 +9,30 @@ for downstream analyses.
 import logging
 import os
 
+from src.core.selection import matches_any
 from src.data_processing.csv_helper import load_csv, save_to_csv
 from src.data_processing.data_frame_helper import (
     add_symbol_by_file_name,
     aggregate_to_day_based_prices,
+    build_daily_bars,
     concat_dataframes,
     convert_datetime_to_unixtime,
+    daily_bars_to_prices,
     rename_columns,
+    roll_up_daily_bars,
 )
 from src.data_processing.errors import ProcessingError
+from src.jobs.progress import check_cancelled, report_file_done, report_files_total
+from src.monitoring.tracing import span
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def load_and_process_raw_data_csv(file_path, column_mapping, file_name):
+def load_and_process_raw_data_csv(
+    file_path, column_mapping, file_name, rollups=None, dtypes=None
+):
     """
     Loads and processes raw data from a CSV file.
 
@@ -32,16 +40,25 @@ def load_and_process_raw_data_csv(file_path, column_mapping, file_name):
         file_path (str): The path to the CSV file.
         column_mapping (dict): A mapping from old column names to new column names.
         file_name (str): The name of the file, used to add a 'symbol' column.
+        rollups (dict, optional): Mapping of rollup resolutions to lists that collect the
+            OHLC bars of the file's intraday prices before they are aggregated.
+        dtypes (dict, optional): Dtypes of the source columns, the others are inferred.
 
     Returns:
         pd.DataFrame or None: A DataFrame containing the processed data, or None if an error occurs.
     """
     try:
-        data_frame = load_csv(file_path)
+        data_frame = load_csv(file_path, dtype=dtypes)
         data_frame = rename_columns(data_frame, column_mapping)
         # Check if 'price' column is present before aggregation
         if "price" in data_frame.columns:
-            data_frame = aggregate_to_day_based_prices(data_frame)
+            if rollups:
+                # The daily bars serve both the rollups and the daily prices
+                daily_bars = build_daily_bars(data_frame)
+                _collect_price_rollups(daily_bars, file_name, rollups)
+                data_frame = daily_bars_to_prices(daily_bars)
+            else:
+                data_frame = aggregate_to_day_based_prices(data_frame)
 
         data_frame = convert_datetime_to_unixtime(data_frame)
         data_frame = add_symbol_by_file_name(data_frame, file_name)
@@ -53,26 +70,52 @@ def load_and_process_raw_data_csv(file_path, column_mapping, file_name):
         return None
 
 
-def process_all_csv_in_directory(directory_path, column_mapping):
+def _collect_price_rollups(daily_bars, file_name, rollups):
+    """Rolls the daily bars of a file up to the requested resolutions and appends them to the collected rollups."""
+    for resolution, bars in roll_up_daily_bars(daily_bars, list(rollups)).items():
+        bars = convert_datetime_to_unixtime(bars)
+        rollups[resolution].append(add_symbol_by_file_name(bars, file_name))
+
+
+def process_all_csv_in_directory(
+    directory_path, column_mapping, rollups=None, symbols=None, dtypes=None
+):
     """
     Processes all CSV files in a given directory.
 
     Parameters:
         directory_path (str): The path to the directory containing CSV files.
         column_mapping (dict): A mapping from old column names to new column names.
+        rollups (dict, optional): Mapping of rollup resolutions to lists that collect the
+            OHLC bars of every file.
+        symbols (list, optional): Glob patterns of the symbols to process, all files if empty.
+        dtypes (dict, optional): Dtypes of the source columns, the others are inferred.
 
     Returns:
         list: A list of processed DataFrames.
     """
     processed_dfs = []
-    for file_name in os.listdir(directory_path):
-        if file_name.endswith(".csv"):
-            file_path = os.path.join(directory_path, file_name)
+    # The file name is the symbol, so unselected files are never opened
+    file_names = [
+        name
+        for name in os.listdir(directory_path)
+        if name.endswith(".csv") and matches_any(os.path.splitext(name)[0], symbols)
+    ]
+    report_files_total(len(file_names))
+    for file_name in file_names:
+        check_cancelled()
+        file_path = os.path.join(directory_path, file_name)
+        symbol = os.path.splitext(file_name)[0]
+        file_size = os.path.getsize(file_path)
+        with span("file", file=file_name, symbol=symbol, bytes=file_size) as file_span:
             processed_df = load_and_process_raw_data_csv(
-                file_path, column_mapping, os.path.splitext(file_name)[0]
+                file_path, column_mapping, symbol, rollups, dtypes
             )
-            if processed_df is not None:
-                processed_dfs.append(processed_df)
+            rows = 0 if processed_df is None else len(processed_df)
+            file_span.set_attributes(rows=rows)
+        if processed_df is not None:
+            processed_dfs.append(processed_df)
+        report_file_done(rows, file_size)
     return processed_dfs
 
 
@@ -50,3 +50,35 @@ class DuplicateRowsError(Exception):
 
 class InvalidDatetimeColumnError(Exception):
     """Raised when the specified column cannot be converted to datetime."""
+
+
+class ReturnsComputationError(Exception):
+    """Raised when returns cannot be computed from the price data."""
+
+
+class VolatilityComputationError(Exception):
+    """Raised when volatility cannot be computed from the returns data."""
+
+
+class MatrixPivotError(Exception):
+    """Raised when long rows cannot be pivoted into a date x symbol matrix."""
+
+
+class CarryComputationError(Exception):
+    """Raised when the carry forecast cannot be computed from multiple prices."""
+
+
+class CovarianceComputationError(Exception):
+    """Raised when covariance matrices cannot be computed from the return panel."""
+
+
+class DataRollupError(Exception):
+    """Raised when there's an error in rolling prices up to OHLC bars."""
+
+
+class StreamDecodingError(Exception):
+    """Raised when an uploaded stream cannot be decompressed or decoded."""
+
+
+class DataTypeCastError(Exception):
+    """Raised when DataFrame columns cannot be cast to the types of their table columns."""
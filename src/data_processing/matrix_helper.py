@@ -0,0 +1,59 @@
+"""
+Matrix Helper module.
+
+This module provides functions that turn long price tables with one row per
+(unix_date_time, symbol) into dense, aligned date x symbol NumPy matrices.
+"""
+
+import logging
+
+import numpy as np
+
+from src.data_processing.errors import MatrixPivotError
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def pivot_to_matrices(data_frame, value_columns, symbols=None):
+    """
+    Pivots long rows into aligned date x symbol matrices, one per value column.
+
+    Parameters:
+        data_frame (pd.DataFrame): DataFrame containing 'unix_date_time', 'symbol' and the value columns.
+        value_columns (list): Names of the columns to pivot.
+        symbols (list, optional): Symbol order of the matrix columns. Defaults to the sorted
+            symbols of the DataFrame; every symbol in the DataFrame must be part of it.
+
+    Returns:
+        tuple: Sorted unique dates as an int64 array, the list of symbols and a dictionary
+        mapping each value column to a float64 matrix with NaN where a value is missing.
+    """
+    try:
+        dates, date_index = np.unique(
+            data_frame["unix_date_time"].to_numpy(dtype=np.int64), return_inverse=True
+        )
+        if symbols is None:
+            symbols = sorted(data_frame["symbol"].unique())
+        symbol_positions = {symbol: position for position, symbol in enumerate(symbols)}
+        symbol_index = data_frame["symbol"].map(symbol_positions)
+        if symbol_index.isna().any():
+            raise MatrixPivotError(
+                "DataFrame contains symbols outside of the symbol order"
+            )
+        symbol_index = symbol_index.to_numpy(dtype=np.int64)
+
+        matrices = {}
+        for column in value_columns:
+            matrix = np.full((len(dates), len(symbols)), np.nan)
+            matrix[date_index, symbol_index] = data_frame[column].to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+            matrices[column] = matrix
+        return dates, list(symbols), matrices
+    except MatrixPivotError:
+        raise
+    except Exception as error:
+        logger.error("Error during matrix pivot: %s", error)
+        raise MatrixPivotError from error
@@ -0,0 +1,108 @@
+"""
+Returns Helper module.
+
+This module provides vectorized functions that derive daily returns and volatility
+from the prices of many instruments at once. Every function expects a long DataFrame
+with 'unix_date_time' and 'symbol' columns and processes all symbols in grouped passes
+instead of looping over instruments.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing.errors import (
+    ReturnsComputationError,
+    VolatilityComputationError,
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def compute_returns(data_frame):
+    """
+    Computes price and percentage returns for every symbol.
+
+    Parameters:
+        data_frame (pd.DataFrame): DataFrame containing 'unix_date_time', 'symbol' and 'price' columns.
+
+    Returns:
+        pd.DataFrame: DataFrame with 'unix_date_time', 'symbol', 'price_return' and 'percentage_return'
+        columns, sorted by symbol and time. The first row of each symbol has no return and is dropped.
+    """
+    try:
+        prices = data_frame.sort_values(["symbol", "unix_date_time"], ignore_index=True)
+        previous_price = prices.groupby("symbol", sort=False)["price"].shift()
+        result = prices[["unix_date_time", "symbol"]].copy()
+        result["price_return"] = prices["price"] - previous_price
+        # Back-adjusted prices can cross zero, so percentage returns are not always defined
+        result["percentage_return"] = (prices["price"] / previous_price - 1).replace(
+            [np.inf, -np.inf], np.nan
+        )
+        return result[previous_price.notna()].reset_index(drop=True)
+    except Exception as error:
+        logger.error("Error during returns computation: %s", error)
+        raise ReturnsComputationError from error
+
+
+def compute_volatility(returns, window, span, seeds=None):
+    """
+    Computes rolling-window and EWMA volatility of price returns for every symbol.
+
+    Parameters:
+        returns (pd.DataFrame): DataFrame containing 'unix_date_time', 'symbol' and 'price_return' columns.
+        window (int): Number of returns in the rolling standard deviation window.
+        span (int): Span of the exponentially weighted moving average of squared returns.
+        seeds (pd.DataFrame, optional): Last computed 'unix_date_time' and 'ewma_vol' per 'symbol'.
+            Returns at or before the seed time only serve as rolling-window lookback and the
+            EWMA recursion continues from the seed value instead of starting over.
+
+    Returns:
+        pd.DataFrame: DataFrame with 'unix_date_time', 'symbol', 'rolling_vol' and 'ewma_vol' columns
+        for the returns after the seed time of each symbol.
+    """
+    try:
+        frame = returns.sort_values(["symbol", "unix_date_time"], ignore_index=True)
+        frame["rolling_vol"] = (
+            frame.groupby("symbol", sort=False)["price_return"]
+            .rolling(window, min_periods=window)
+            .std()
+            .reset_index(level=0, drop=True)
+        )
+        frame = frame[["unix_date_time", "symbol", "rolling_vol", "price_return"]]
+        variance = frame[["unix_date_time", "symbol"]].assign(
+            variance=frame["price_return"] ** 2, is_seed=False
+        )
+
+        if seeds is not None and not seeds.empty:
+            last_time = frame["symbol"].map(seeds.set_index("symbol")["unix_date_time"])
+            is_new = last_time.isna() | (frame["unix_date_time"] > last_time)
+            frame = frame[is_new]
+            variance = pd.concat(
+                [
+                    seeds[["unix_date_time", "symbol"]].assign(
+                        variance=seeds["ewma_vol"] ** 2, is_seed=True
+                    ),
+                    variance[is_new],
+                ],
+                ignore_index=True,
+            ).sort_values(["symbol", "unix_date_time"], ignore_index=True)
+
+        variance["ewma_variance"] = (
+            variance.groupby("symbol", sort=False)["variance"]
+            .ewm(span=span, adjust=False)
+            .mean()
+            .reset_index(level=0, drop=True)
+        )
+        result = frame.drop(columns="price_return").reset_index(drop=True)
+        # Both frames are sorted by symbol and time and hold the same non-seed rows
+        result["ewma_vol"] = np.sqrt(
+            variance.loc[~variance["is_seed"], "ewma_variance"].to_numpy()
+        )
+        return result
+    except Exception as error:
+        logger.error("Error during volatility computation: %s", error)
+        raise VolatilityComputationError from error
@@ -0,0 +1,185 @@
+"""
+Stream Processor module.
+
+This module turns a streamed, optionally compressed CSV body into transformed DataFrame
+chunks without holding the whole file in memory. Bytes are decompressed incrementally,
+split into chunks of complete lines, parsed with the header of the stream and passed
+through the same transformations as files parsed from the data directory.
+
+Raw prices are aggregated to days. The rows of the last day of a chunk are held back and
+prepended to the next chunk, so a day split across two chunks is still averaged once.
+"""
+
+import io
+import logging
+import zlib
+
+import pandas as pd
+
+from src.data_processing.data_frame_helper import (
+    add_symbol_by_file_name,
+    aggregate_to_day_based_prices,
+    cast_columns,
+    convert_column_to_datetime,
+    convert_datetime_to_unixtime,
+    fill_empty_values,
+    rename_columns,
+)
+from src.data_processing.errors import StreamDecodingError
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+COMPRESSIONS = ("none", "gzip", "zstd")
+# wbits accepting a gzip header
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def create_decompressor(compression):
+    """
+    Returns a function that decompresses the next piece of a compressed stream.
+
+    Parameters:
+        compression (str): One of 'none', 'gzip' and 'zstd'.
+
+    Returns:
+        callable: Function mapping compressed bytes to the decompressed bytes available so far.
+    """
+    if compression == "none":
+        return lambda data: data
+    if compression == "gzip":
+        decompressor = zlib.decompressobj(GZIP_WBITS)
+
+        def decompress(data):
+            try:
+                return decompressor.decompress(data)
+            except zlib.error as error:
+                raise StreamDecodingError("Uploaded body is not valid gzip") from error
+
+        return decompress
+    if compression == "zstd":
+        try:
+            import zstandard  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise StreamDecodingError(
+                "zstd uploads require the optional 'zstandard' package"
+            ) from error
+        return zstandard.ZstdDecompressor().decompressobj().decompress
+    raise StreamDecodingError(f"Unsupported compression {compression}")
+
+
+async def iter_csv_chunks(byte_stream, compression, chunk_rows):
+    """
+    Splits a streamed CSV body into text chunks of complete lines, each starting with the header.
+
+    Parameters:
+        byte_stream (AsyncIterator[bytes]): The request body.
+        compression (str): One of 'none', 'gzip' and 'zstd'.
+        chunk_rows (int): Number of data lines per chunk.
+
+    Yields:
+        str: CSV text with the header line and up to chunk_rows data lines.
+    """
+    decompress = create_decompressor(compression)
+    header, pending, lines = None, b"", []
+    async for data in byte_stream:
+        pending += decompress(data)
+        *complete, pending = pending.split(b"\n")
+        for line in complete:
+            if header is None:
+                header = line
+            elif line.strip():
+                lines.append(line)
+        if len(lines) >= chunk_rows:
+            yield _decode(header, lines)
+            lines = []
+    if pending.strip():
+        if header is None:
+            header = pending
+        else:
+            lines.append(pending)
+    if lines:
+        yield _decode(header, lines)
+
+
+def _decode(header, lines):
+    try:
+        return b"\n".join([header, *lines]).decode("utf-8")
+    except UnicodeDecodeError as error:
+        raise StreamDecodingError("Uploaded CSV is not valid UTF-8") from error
+
+
+class StreamTransformer:
+    """
+    Applies the transformations of a schema to consecutive chunks of one CSV stream.
+    """
+
+    def __init__(self, column_mapping, symbol=None, dtypes=None, column_dtypes=None):
+        """
+        Initialize the transformer.
+
+        Parameters:
+            column_mapping (dict): The schema's mapping from CSV to database column names.
+            symbol (str, optional): Symbol of a raw data stream. Config streams have none and
+                get their empty values filled like the config files.
+            dtypes (dict, optional): Dtypes of the CSV columns, the others are inferred.
+            column_dtypes (dict, optional): Dtypes of the table columns the transformed rows
+                are cast to, so integer columns are not copied as floats after averaging.
+        """
+        self.column_mapping = column_mapping
+        self.dtypes = dtypes
+        self.column_dtypes = column_dtypes or {}
+        self.symbol = symbol
+        self._carry = None
+
+    def transform(self, csv_text):
+        """
+        Parses and transforms a chunk.
+
+        Parameters:
+            csv_text (str): CSV text starting with the header line.
+
+        Returns:
+            pd.DataFrame: Rows ready to be copied, possibly empty while a day is held back.
+        """
+        data_frame = rename_columns(
+            pd.read_csv(io.StringIO(csv_text), dtype=self.dtypes), self.column_mapping
+        )
+        if self.symbol is None:
+            return cast_columns(
+                fill_empty_values(data_frame, fill_value=0), self.column_dtypes
+            )
+        if "price" not in data_frame.columns:
+            return self._finish_raw(data_frame)
+
+        data_frame = convert_column_to_datetime(data_frame, "unix_date_time")
+        if self._carry is not None:
+            data_frame = pd.concat([self._carry, data_frame], ignore_index=True)
+        days = data_frame["unix_date_time"].dt.floor("D")
+        last_day = days == days.max()
+        self._carry = data_frame[last_day]
+        return self._aggregate(data_frame[~last_day])
+
+    def flush(self):
+        """
+        Returns the rows held back from the last chunk.
+
+        Returns:
+            pd.DataFrame: Transformed rows of the last day, possibly empty.
+        """
+        carry, self._carry = self._carry, None
+        if carry is None:
+            return pd.DataFrame()
+        return self._aggregate(carry)
+
+    def _aggregate(self, data_frame):
+        if data_frame.empty:
+            return pd.DataFrame()
+        return self._finish_raw(aggregate_to_day_based_prices(data_frame))
+
+    def _finish_raw(self, data_frame):
+        data_frame = convert_datetime_to_unixtime(data_frame)
+        data_frame = add_symbol_by_file_name(data_frame, self.symbol)
+        data_frame = data_frame.drop(columns=["Unnamed: 4"], errors="ignore")
+        return cast_columns(data_frame, self.column_dtypes)
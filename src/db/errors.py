@@ -23,3 +23,15 @@ class TableOrColumnNotFoundError(DatabaseInteractionError):
 
 class ParameterMismatchError(DatabaseInteractionError):
     """Raised when there's a mismatch between the parameters provided and what's expected by the SQL command."""
+
+
+class MatrixStoreError(Exception):
+    """Raised when the price matrix store cannot be read or written."""
+
+
+class MatrixNotFoundError(MatrixStoreError):
+    """Raised when a requested matrix has not been materialised yet."""
+
+
+class LockTimeoutError(Exception):
+    """Raised when a pipeline lock was not acquired within the wait timeout."""
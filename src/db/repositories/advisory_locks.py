@@ -0,0 +1,146 @@
+"""
+This module provides Postgres advisory locks that coordinate pipeline runs.
+
+The locks live in the database, so they also coordinate runs of several uvicorn workers
+or containers. Runs that change every table hold the global lock exclusively. Runs that
+change single tables hold the global lock shared and an exclusive lock per table, so
+they can overlap with runs on other tables but never with a reset.
+"""
+
+import asyncio
+import logging
+import zlib
+from contextlib import asynccontextmanager
+
+from src.db.errors import DatabaseConnectionError, LockTimeoutError
+
+# Setting up the logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# First key of the two-key advisory locks, keeps them apart from locks of other applications
+PIPELINE_LOCK_NAMESPACE = 0x50534401
+COPY_SLOT_NAMESPACE = 0x50534402
+GLOBAL = "global"
+_GLOBAL_KEY = 0
+
+
+def table_lock_key(table_name) -> int:
+    """
+    Returns the second advisory lock key of a table.
+
+    Parameters:
+        table_name (str): Name of the database table.
+
+    Returns:
+        int: A positive 31 bit key that never collides with the global lock.
+    """
+    return zlib.crc32(table_name.encode()) & 0x7FFFFFFF or 1
+
+
+def describe_scope(scope) -> str:
+    """Returns a readable description of a lock scope."""
+    if scope == GLOBAL:
+        return "the global lock"
+    return f"the locks of {', '.join(sorted(set(scope)))}"
+
+
+class AdvisoryLocks:
+    """
+    Acquires the pipeline locks of a run on a dedicated connection.
+    """
+
+    def __init__(self, database_url, wait_timeout):
+        """
+        Initialize the AdvisoryLocks with a database URL.
+
+        Parameters:
+            database_url (str): URL of the database to connect to.
+            wait_timeout (float): Seconds to wait for a lock before giving up, 0 waits forever.
+        """
+        self.database_url = database_url
+        self.wait_timeout = wait_timeout
+
+    @asynccontextmanager
+    async def hold(self, scope):
+        """
+        Hold the locks of a scope for the duration of the context.
+
+        Parameters:
+            scope (str or list): GLOBAL, or the names of the tables the run changes.
+        """
+        # The routes admit runs through this module, keep asyncpg out of the startup path
+        import asyncpg  # pylint: disable=import-outside-toplevel
+
+        try:
+            conn = await asyncpg.connect(self.database_url)
+        except (OSError, asyncpg.exceptions.PostgresError) as exc:
+            logger.error("Failed to connect to the database.")
+            raise DatabaseConnectionError("Failed to connect to the database.") from exc
+        try:
+            # Advisory lock waits honour lock_timeout and fail with LockNotAvailableError
+            await conn.execute(f"SET lock_timeout = {int(self.wait_timeout * 1000)}")
+            try:
+                await self._lock_async(conn, scope)
+            except asyncpg.exceptions.LockNotAvailableError as exc:
+                raise LockTimeoutError(
+                    f"Timed out after {self.wait_timeout:g}s waiting for {describe_scope(scope)}"
+                ) from exc
+            logger.info("Acquired %s.", describe_scope(scope))
+            yield
+        finally:
+            # Session level locks are released together with the session
+            await conn.close()
+
+    @staticmethod
+    async def _lock_async(conn, scope):
+        if scope == GLOBAL:
+            await conn.execute(
+                "SELECT pg_advisory_lock($1, $2)", PIPELINE_LOCK_NAMESPACE, _GLOBAL_KEY
+            )
+            return
+        await conn.execute(
+            "SELECT pg_advisory_lock_shared($1, $2)",
+            PIPELINE_LOCK_NAMESPACE,
+            _GLOBAL_KEY,
+        )
+        # A fixed order keeps two runs on overlapping tables from deadlocking
+        for table_name in sorted(set(scope)):
+            await conn.execute(
+                "SELECT pg_advisory_lock($1, $2)",
+                PIPELINE_LOCK_NAMESPACE,
+                table_lock_key(table_name),
+            )
+
+
+@asynccontextmanager
+async def copy_slot(conn, slots, poll_interval=0.05):
+    """
+    Hold one of a fixed number of COPY slots on a connection. The slots are advisory locks,
+    so at most `slots` connections of all workers copy at the same time.
+
+    Parameters:
+        conn (asyncpg.Connection): The connection that runs the COPY.
+        slots (int): Number of concurrent COPY connections allowed, 0 for no limit.
+        poll_interval (float): Seconds to wait before trying the slots again.
+    """
+    if slots <= 0:
+        yield
+        return
+    slot = None
+    while slot is None:
+        for candidate in range(slots):
+            if await conn.fetchval(
+                "SELECT pg_try_advisory_lock($1, $2)", COPY_SLOT_NAMESPACE, candidate
+            ):
+                slot = candidate
+                break
+        else:
+            await asyncio.sleep(poll_interval)
+    try:
+        yield
+    finally:
+        # The connection goes back to a pool, so the lock must not outlive the COPY
+        await conn.execute(
+            "SELECT pg_advisory_unlock($1, $2)", COPY_SLOT_NAMESPACE, slot
+        )
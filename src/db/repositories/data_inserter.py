@@ -1,16 +1,30 @@
 """
 This module provides functionalities for inserting data into a database asynchronously.
 """
+import io
 import logging
 from contextlib import asynccontextmanager
 
 import asyncpg
 
+from src.core.config import settings
+from src.core.selection import select_names
 from src.db.errors import (
     DatabaseConnectionError,
     DatabaseInteractionError,
     TableOrColumnNotFoundError,
 )
+from src.db.repositories.advisory_locks import copy_slot
+from src.db.schemas.symbol_dimension import (
+    SYMBOLS_TABLE,
+    encode_symbols,
+    storage_table_name,
+    uses_symbol_ids,
+)
+from src.jobs.progress import report_rows_copied
+from src.monitoring.metrics import acquire_timed, stage_timer, timed
+from src.monitoring.profiling import to_thread
+from src.monitoring.tracing import set_span_attributes
 
 # Setting up the logger
 logging.basicConfig(level=logging.INFO)
@@ -31,22 +45,154 @@ class DataInserter:
         """
         self._database_url = database_url
 
-    async def insert_dataframe_async(self, data_frame, table_name) -> None:
+    async def insert_dataframe_async(self, data_frame, table_name, plan=None) -> None:
         """
         Insert a Pandas DataFrame into a database table asynchronously.
 
         Parameters:
             data_frame (pd.DataFrame): The DataFrame to insert.
             table_name (str): The name of the database table to insert into.
+            plan (TablePlan, optional): Compiled plan of the table written to, the rows are
+                sent with binary COPY in its column order. Records are copied without one.
+        """
+        async with self._create_connection_pool_async() as pool:
+            data_frame, table_name = await self._to_storage_async(
+                pool, data_frame, table_name
+            )
+            await self._bulk_insert_async(pool, data_frame, table_name, plan)
+
+    async def insert_dataframes_async(self, data_frames) -> None:
+        """
+        Insert several Pandas DataFrames into their tables within a single transaction.
+
+        Parameters:
+            data_frames (dict): Mapping of database table names to the DataFrames to insert.
+        """
+        async with self._create_connection_pool_async() as pool:
+            stored = [
+                await self._to_storage_async(pool, data_frame, table_name)
+                for table_name, data_frame in data_frames.items()
+            ]
+            async with self._acquire_copy_connection(pool) as conn:
+                async with conn.transaction():
+                    for data_frame, table_name in stored:
+                        await self._insert_with_error_handling_async(
+                            conn, data_frame, table_name
+                        )
+
+    async def replace_dataframe_async(self, data_frame, table_name, plan=None) -> None:
+        """
+        Replace the whole content of a database table with a Pandas DataFrame.
+        The table is truncated and filled within a single transaction.
+
+        Parameters:
+            data_frame (pd.DataFrame): The DataFrame to insert.
+            table_name (str): The name of the database table to replace.
+            plan (TablePlan, optional): Compiled plan of the table written to.
         """
         async with self._create_connection_pool_async() as pool:
-            await self._bulk_insert_async(pool, data_frame, table_name)
+            data_frame, table_name = await self._to_storage_async(
+                pool, data_frame, table_name
+            )
+            async with self._acquire_copy_connection(pool) as conn:
+                async with conn.transaction():
+                    await conn.execute(f"TRUNCATE TABLE {table_name}")
+                    await self._insert_with_error_handling_async(
+                        conn, data_frame, table_name, plan
+                    )
+
+    async def replace_symbols_async(
+        self, data_frame, table_name, symbols, plan=None
+    ) -> None:
+        """
+        Replace the rows of the selected symbols in a database table with a Pandas DataFrame.
+        Rows of other symbols are kept. The old rows are deleted and the new ones copied
+        within a single transaction.
+
+        Parameters:
+            data_frame (pd.DataFrame): The DataFrame with the new rows of the symbols.
+            table_name (str): The name of the database table to update.
+            symbols (list): Glob patterns of the symbols to replace.
+            plan (TablePlan, optional): Compiled plan of the table written to.
+        """
+        delete_command = f"DELETE FROM {table_name} WHERE symbol = ANY($1::text[])"
+        if uses_symbol_ids(table_name):
+            delete_command = (
+                f"DELETE FROM {storage_table_name(table_name)} WHERE symbol_id IN "
+                f"(SELECT symbol_id FROM {SYMBOLS_TABLE} WHERE symbol = ANY($1::text[]))"
+            )
+        async with self._create_connection_pool_async() as pool:
+            new_symbols = data_frame["symbol"].unique()
+            data_frame, storage_table = await self._to_storage_async(
+                pool, data_frame, table_name
+            )
+            async with self._acquire_copy_connection(pool) as conn:
+                async with conn.transaction():
+                    stored = await conn.fetch(
+                        f"SELECT DISTINCT symbol FROM {table_name}"
+                    )
+                    replaced = set(
+                        select_names([row["symbol"] for row in stored], symbols)
+                    )
+                    replaced.update(new_symbols)
+                    await conn.execute(delete_command, sorted(replaced))
+                    await self._insert_with_error_handling_async(
+                        conn, data_frame, storage_table, plan
+                    )
+
+    async def symbol_ids_async(self, symbols) -> dict:
+        """
+        Returns the ids of symbols in the 'symbols' dimension table, registering new ones.
+
+        Parameters:
+            symbols (list): The symbols.
+
+        Returns:
+            dict: Mapping of every symbol to its id.
+        """
+        async with self._create_connection_pool_async() as pool:
+            return await self._symbol_ids_async(pool, symbols)
+
+    async def copy_csv_stream_async(self, table_name, columns, chunks) -> None:
+        """
+        Pipe CSV encoded rows into a database table with a single COPY command.
+        The rows are sent as they are produced, so the stream is never held in memory.
+
+        Parameters:
+            table_name (str): The name of the database table to insert into.
+            columns (list): Names of the columns in the order of the CSV fields.
+            chunks (AsyncIterator[bytes]): CSV encoded rows without a header line.
+        """
+        async with self._create_connection_pool_async() as pool:
+            async with self._acquire_copy_connection(pool) as conn:
+                try:
+                    await conn.copy_to_table(
+                        table_name, source=chunks, columns=columns, format="csv"
+                    )
+                except asyncpg.exceptions.UndefinedTableError as exc:
+                    logger.error("Table or column not defined in SQL: %s", exc)
+                    raise TableOrColumnNotFoundError(
+                        f"Table or column not defined in SQL: {exc}"
+                    ) from exc
+                except asyncpg.exceptions.PostgresError as exc:
+                    logger.error("Error inserting data: %s", exc)
+                    raise DatabaseInteractionError(
+                        f"Error inserting data: {exc}"
+                    ) from exc
+
+    @staticmethod
+    @asynccontextmanager
+    async def _acquire_copy_connection(pool):
+        async with acquire_timed(pool, "data_inserter") as conn:
+            async with copy_slot(conn, settings.max_copy_connections):
+                yield conn
 
     @asynccontextmanager
     async def _create_connection_pool_async(self):
         logger.info("Creating connection pool.")
         try:
-            pool = await asyncpg.create_pool(dsn=self._database_url)
+            # Every insert copies over a single connection, don't open idle ones
+            pool = await asyncpg.create_pool(dsn=self._database_url, min_size=1)
             yield pool
         except asyncpg.exceptions.ConnectionDoesNotExistError as exc:
             logger.error("Failed to connect to the database.")
@@ -54,20 +200,107 @@ class DataInserter:
         finally:
             await pool.close()
 
-    async def _bulk_insert_async(self, pool, data_frame, table_name):
-        async with pool.acquire() as conn:
+    async def _to_storage_async(self, pool, data_frame, table_name):
+        # Tables stored with symbol ids are written through their storage table
+        if not uses_symbol_ids(table_name):
+            return data_frame, table_name
+        symbol_ids = await self._symbol_ids_async(pool, data_frame["symbol"].unique())
+        return encode_symbols(data_frame, symbol_ids), storage_table_name(table_name)
+
+    @staticmethod
+    async def _symbol_ids_async(pool, symbols):
+        symbols = sorted(str(symbol) for symbol in symbols)
+        async with acquire_timed(pool, "data_inserter") as conn:
             try:
-                await self._insert_records_async(conn, data_frame, table_name)
+                # Registered outside of the COPY transactions, so concurrent seeds of
+                # other tables don't wait for each other's new symbols. Only missing
+                # symbols are inserted, conflicts would use up identity values.
+                await conn.execute(
+                    f"""
+                    INSERT INTO {SYMBOLS_TABLE} (symbol)
+                    SELECT symbol FROM unnest($1::text[]) AS new (symbol)
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM {SYMBOLS_TABLE} s WHERE s.symbol = new.symbol
+                    )
+                    ORDER BY symbol
+                    ON CONFLICT (symbol) DO NOTHING
+                    """,
+                    symbols,
+                )
+                rows = await conn.fetch(
+                    f"SELECT symbol, symbol_id FROM {SYMBOLS_TABLE} "
+                    "WHERE symbol = ANY($1::text[])",
+                    symbols,
+                )
             except asyncpg.exceptions.UndefinedTableError as exc:
                 logger.error("Table or column not defined in SQL: %s", exc)
                 raise TableOrColumnNotFoundError(
                     f"Table or column not defined in SQL: {exc}"
                 ) from exc
-            except Exception as exc:
-                logger.error("Error inserting data: %s", exc)
-                raise DatabaseInteractionError(f"Error inserting data: {exc}") from exc
+        return {row["symbol"]: row["symbol_id"] for row in rows}
 
+    async def _bulk_insert_async(self, pool, data_frame, table_name, plan=None):
+        async with self._acquire_copy_connection(pool) as conn:
+            await self._insert_with_error_handling_async(
+                conn, data_frame, table_name, plan
+            )
+
+    async def _insert_with_error_handling_async(
+        self, conn, data_frame, table_name, plan=None
+    ):
+        try:
+            if plan is None:
+                await self._insert_records_async(conn, data_frame, table_name)
+            else:
+                await self._insert_binary_async(conn, data_frame, table_name, plan)
+        except asyncpg.exceptions.UndefinedTableError as exc:
+            logger.error("Table or column not defined in SQL: %s", exc)
+            raise TableOrColumnNotFoundError(
+                f"Table or column not defined in SQL: {exc}"
+            ) from exc
+        except Exception as exc:
+            logger.error("Error inserting data: %s", exc)
+            raise DatabaseInteractionError(f"Error inserting data: {exc}") from exc
+
+    @timed("copy")
     async def _insert_records_async(self, conn, data_frame, table_name):
-        records = data_frame.values.tolist()
+        # Converting millions of rows takes seconds, keep it off the event loop
+        with stage_timer("to_records"):
+            # An object array keeps integers as ints in frames without text columns
+            records = await to_thread(data_frame.to_numpy(object).tolist)
         columns = data_frame.columns.tolist()
-        await conn.copy_records_to_table(table_name, records=records, columns=columns)
+        # asyncpg encodes the records itself, the in-memory size of the rows stands in
+        # for the payload when reporting the throughput
+        row_bytes = (
+            data_frame.memory_usage(index=False).sum() / len(records) if records else 0
+        )
+        set_span_attributes(table=table_name, rows=len(records))
+        batch_size = settings.copy_batch_size
+        # Batches report progress and let a cancelled job stop between COPY commands
+        async with conn.transaction():
+            for start in range(0, len(records), batch_size):
+                batch = records[start : start + batch_size]
+                await conn.copy_records_to_table(
+                    table_name, records=batch, columns=columns
+                )
+                report_rows_copied(len(batch), int(len(batch) * row_bytes))
+
+    @timed("copy")
+    async def _insert_binary_async(self, conn, data_frame, table_name, plan):
+        # The plan fixes the wire format of every column, so encoding never looks at the
+        # Python type of a value
+        data_frame = data_frame[plan.copy_columns]
+        set_span_attributes(table=table_name, rows=len(data_frame))
+        batch_size = settings.copy_batch_size
+        async with conn.transaction():
+            for start in range(0, len(data_frame), batch_size):
+                batch = data_frame.iloc[start : start + batch_size]
+                with stage_timer("encode_binary"):
+                    payload = await to_thread(plan.encoder.encode, batch)
+                await conn.copy_to_table(
+                    table_name,
+                    source=io.BytesIO(payload),
+                    columns=plan.copy_columns,
+                    format="binary",
+                )
+                report_rows_copied(len(batch), len(payload))
@@ -13,6 +13,7 @@ from src.db.errors import (
     SQLSyntaxError,
     TableOrColumnNotFoundError,
 )
+from src.monitoring.metrics import acquire_timed
 
 # Setting up the logger
 logging.basicConfig(level=logging.INFO)
@@ -40,7 +41,8 @@ class DataLoader:
 
         Parameters:
             sql_template (str): The SQL template to use for fetching data.
-            parameters (dict): The parameters to use with the SQL template.
+            parameters (dict): The parameters to use with the SQL template, bound to the
+                positional placeholders ($1, $2, ...) in insertion order.
 
         Returns:
             pd.DataFrame: The fetched data as a Pandas DataFrame.
@@ -62,14 +64,14 @@ class DataLoader:
             raise DatabaseConnectionError("Failed to connect to the database.") from exc
 
     async def _execute_sql(self, pool, sql_template, parameters):
-        async with pool.acquire() as conn:
+        async with acquire_timed(pool, "data_loader") as conn:
             try:
                 logger.info("Preparing and executing SQL statement.")
                 statement = await conn.prepare(sql_template)
                 params_copy = parameters.copy() if parameters else {}
                 if "TABLE" not in sql_template and "TABLE" in params_copy:
                     params_copy.pop("TABLE")
-                return await statement.fetch(**params_copy)
+                return await statement.fetch(*params_copy.values())
             except asyncpg.exceptions.UndefinedTableError as exc:
                 logger.error("Table or column not defined in SQL: %s", exc)
                 raise TableOrColumnNotFoundError(
@@ -95,4 +97,4 @@ class DataLoader:
         logger.info("Converting fetched rows to DataFrame.")
         if not rows:
             return pd.DataFrame()
-        return pd.DataFrame(rows, columns=[desc[0] for desc in rows[0].keys()])
+        return pd.DataFrame(rows, columns=list(rows[0].keys()))
@@ -0,0 +1,131 @@
+"""
+This module provides the writing and reading of the array-packed raw data tables.
+"""
+
+import logging
+
+import asyncpg
+
+from src.core.selection import select_names
+from src.db.errors import DatabaseInteractionError, TableOrColumnNotFoundError
+from src.db.schemas.packed_series import (
+    decode_array,
+    pack_sql_command,
+    packed_table_name,
+    series_columns,
+)
+from src.monitoring.metrics import timed
+
+# Setting up the logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class PackedSeriesRepository:
+    """
+    Packs the rows of raw data tables into per symbol and year arrays and reads them back.
+    """
+
+    def __init__(self, database_url):
+        """
+        Initialize the repository with a database URL.
+
+        Parameters:
+            database_url (str): URL of the database to connect to.
+        """
+        self.database_url = database_url
+
+    @timed("pack_series")
+    async def pack_async(self, schema, symbols=None, new_symbols=()) -> None:
+        """
+        Repacks the rows of a table. Without a symbol filter the packed table is replaced
+        as a whole, otherwise only the symbols that were replaced in the row table.
+
+        Parameters:
+            schema (BaseConfigSchema): Schema of the raw data table.
+            symbols (list, optional): Glob patterns of the replaced symbols.
+            new_symbols (iterable): Symbols of the rows that were just loaded.
+        """
+        packed_table = packed_table_name(schema.table_name)
+        conn = await asyncpg.connect(self.database_url)
+        try:
+            async with conn.transaction():
+                if not symbols:
+                    await conn.execute(f"TRUNCATE TABLE {packed_table}")
+                    await conn.execute(pack_sql_command(schema))
+                    return
+                # The same symbols the row table replaced, the stored and the loaded ones
+                stored = await conn.fetch(f"SELECT DISTINCT symbol FROM {packed_table}")
+                replaced = set(select_names([row["symbol"] for row in stored], symbols))
+                replaced.update(str(symbol) for symbol in new_symbols)
+                await conn.execute(
+                    f"DELETE FROM {packed_table} WHERE symbol = ANY($1::text[])",
+                    sorted(replaced),
+                )
+                await conn.execute(
+                    pack_sql_command(schema, filtered=True), sorted(replaced)
+                )
+        except asyncpg.exceptions.UndefinedTableError as exc:
+            logger.error("Table or column not defined in SQL: %s", exc)
+            raise TableOrColumnNotFoundError(
+                f"Table or column not defined in SQL: {exc}"
+            ) from exc
+        except asyncpg.exceptions.PostgresError as exc:
+            logger.error("Error packing %s: %s", schema.table_name, exc)
+            raise DatabaseInteractionError(
+                f"Error packing {schema.table_name}: {exc}"
+            ) from exc
+        finally:
+            await conn.close()
+
+    async def read_async(self, schema, symbol, columns=None) -> dict:
+        """
+        Reads the full history of a symbol as NumPy arrays in time order.
+
+        Parameters:
+            schema (BaseConfigSchema): Schema of the raw data table.
+            symbol (str): The symbol.
+            columns (list, optional): Value columns to read, all by default. The times
+                are always read.
+
+        Returns:
+            dict: Mapping of 'unix_date_time' and every value column to its array, empty
+            arrays for unknown symbols.
+        """
+        # Deferred like in the application, NumPy is not needed to start it
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        names = [column.name for column in series_columns(schema)]
+        if columns:
+            unknown = set(columns) - set(names)
+            if unknown:
+                raise TableOrColumnNotFoundError(
+                    f"Columns {sorted(unknown)} are not packed in {schema.table_name}"
+                )
+            names = ["unix_date_time"] + [
+                name for name in columns if name != "unix_date_time"
+            ]
+        # The binary arrays are decoded by NumPy instead of one Python object per value
+        arrays = ", ".join(f"array_send({name}) AS {name}" for name in names)
+        conn = await asyncpg.connect(self.database_url)
+        try:
+            rows = await conn.fetch(
+                f"SELECT {arrays} FROM {packed_table_name(schema.table_name)} "
+                "WHERE symbol = $1 ORDER BY year",
+                symbol,
+            )
+        except asyncpg.exceptions.UndefinedTableError as exc:
+            logger.error("Table or column not defined in SQL: %s", exc)
+            raise TableOrColumnNotFoundError(
+                f"Table or column not defined in SQL: {exc}"
+            ) from exc
+        finally:
+            await conn.close()
+        return {
+            name: (
+                np.concatenate([decode_array(row[name]) for row in rows])
+                if rows
+                else np.empty(0)
+            )
+            for name in names
+        }
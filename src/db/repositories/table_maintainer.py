@@ -0,0 +1,143 @@
+"""This module contains a class for finalising tables in a PostgreSQL database after a load."""
+
+import asyncio
+import logging
+
+import asyncpg
+
+from src.monitoring.metrics import timed
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def finalize_commands(table_name, cluster_index=None, fillfactor=None, analyze=True):
+    """
+    Returns the commands finalising a freshly loaded table, in execution order.
+
+    Parameters:
+        table_name (str): Name of the database table.
+        cluster_index (str, optional): Index the rows are physically ordered by with CLUSTER.
+        fillfactor (int, optional): Fill factor of the table pages, between 10 and 100.
+            Pages that exist already only change when CLUSTER rewrites the table.
+        analyze (bool): Whether the planner statistics of the table are refreshed.
+
+    Returns:
+        list: SQL command strings.
+    """
+    commands = []
+    if fillfactor:
+        commands.append(
+            f"ALTER TABLE {table_name} SET (fillfactor = {int(fillfactor)})"
+        )
+    if cluster_index:
+        commands.append(f"CLUSTER {table_name} USING {cluster_index}")
+    if analyze:
+        commands.append(f"ANALYZE {table_name}")
+    return commands
+
+
+class TableMaintainer:
+    """A class to finalise tables in a PostgreSQL database after they were loaded."""
+
+    def __init__(self, database_url: str):
+        self.database_url: str = database_url
+
+    @timed("build_indexes")
+    async def build_indexes_async(self, sql_commands, parallel=1):
+        """
+        Builds indexes of a loaded table, several at the same time on separate connections.
+        A failing build is logged, the other indexes are still built.
+
+        Args:
+        - sql_commands (list): Commands creating one index each.
+        - parallel (int): Number of indexes built at the same time.
+
+        Returns:
+        - None
+        """
+        slots = asyncio.Semaphore(max(parallel, 1))
+
+        async def build(sql_command):
+            async with slots:
+                conn = None
+                try:
+                    conn = await asyncpg.connect(self.database_url)
+                    await conn.execute(sql_command)
+                    logger.info(
+                        "Successfully executed the following SQL command: %s",
+                        sql_command,
+                    )
+                except asyncpg.PostgresError as error:
+                    logger.error(
+                        "Failed to build index with %s due to: %s", sql_command, error
+                    )
+                finally:
+                    if conn is not None:
+                        await conn.close()
+
+        await asyncio.gather(*(build(sql_command) for sql_command in sql_commands))
+
+    @timed("refresh_views")
+    async def refresh_views_async(self, sql_commands):
+        """
+        Refreshes materialized views one after the other.
+        A failing refresh is logged, the other views are still refreshed.
+
+        Args:
+        - sql_commands (list): Commands refreshing one view each.
+
+        Returns:
+        - None
+        """
+        if not sql_commands:
+            return
+        conn = await asyncpg.connect(self.database_url)
+        try:
+            for sql_command in sql_commands:
+                try:
+                    await conn.execute(sql_command)
+                    logger.info(
+                        "Successfully executed the following SQL command: %s",
+                        sql_command,
+                    )
+                except asyncpg.PostgresError as error:
+                    logger.error(
+                        "Failed to refresh with %s due to: %s", sql_command, error
+                    )
+        finally:
+            await conn.close()
+
+    @timed("finalize")
+    async def finalize_table_async(
+        self, table_name, cluster_index=None, fillfactor=None, analyze=True
+    ):
+        """
+        Applies the fill factor, clusters and analyzes a table, each step if requested.
+        A failing step is logged and skips the remaining ones, the loaded rows are kept.
+
+        Args:
+        - table_name (str): Name of the database table.
+        - cluster_index (str, optional): Index the rows are physically ordered by.
+        - fillfactor (int, optional): Fill factor of the table pages.
+        - analyze (bool): Whether the planner statistics are refreshed.
+
+        Returns:
+        - None
+        """
+        commands = finalize_commands(table_name, cluster_index, fillfactor, analyze)
+        if not commands:
+            return
+        conn = None
+        try:
+            conn = await asyncpg.connect(self.database_url)
+            for command in commands:
+                await conn.execute(command)
+                logger.info(
+                    "Successfully executed the following SQL command: %s", command
+                )
+        except asyncpg.PostgresError as error:
+            logger.error("Failed to finalise table %s due to: %s", table_name, error)
+        finally:
+            if conn is not None:
+                await conn.close()
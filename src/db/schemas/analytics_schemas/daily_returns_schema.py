@@ -0,0 +1,59 @@
+"""
+This module defines the schema for configuring the derived 'daily_returns' database table.
+"""
+
+from src.db.schemas.base_config_schema import BaseConfigSchema
+from src.db.schemas.columns import Column, Index
+
+
+class DailyReturnsSchema(BaseConfigSchema):
+    """
+    Concrete class that implements the BaseConfigSchema for the 'daily_returns' database table.
+    The table is derived from 'adjusted_prices' by the analytics stage.
+    """
+
+    @property
+    def columns(self):
+        """
+        Returns the typed columns of the 'daily_returns' table.
+
+        Returns:
+            List[Column]: Column definitions in table order.
+        """
+        return [
+            Column("unix_date_time", "INTEGER", "unix_date_time", primary_key=True),
+            Column("symbol", "VARCHAR(50)", "symbol", primary_key=True),
+            Column("price_return", "FLOAT", "price_return"),
+            Column("percentage_return", "FLOAT", "percentage_return"),
+        ]
+
+    @property
+    def indexes(self):
+        """
+        Returns the secondary indexes of the 'daily_returns' table.
+
+        Returns:
+            List[Index]: Index definitions.
+        """
+        return [Index(("symbol", "unix_date_time"), name="symbol_time")]
+
+    @property
+    def table_name(self):
+        """
+        Returns the name of the 'daily_returns' database table.
+
+        Returns:
+            str: Name of the database table.
+        """
+        return "daily_returns"
+
+    @property
+    def origin_csv_file_path(self):
+        """
+        Returns the file path of the original CSV file for the 'daily_returns' table.
+        The table is derived from other tables, so there is no original CSV file.
+
+        Returns:
+            None: Derived tables are not loaded from CSV files.
+        """
+        return None
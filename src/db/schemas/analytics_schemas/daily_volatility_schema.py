@@ -0,0 +1,59 @@
+"""
+This module defines the schema for configuring the derived 'daily_volatility' database table.
+"""
+
+from src.db.schemas.base_config_schema import BaseConfigSchema
+from src.db.schemas.columns import Column, Index
+
+
+class DailyVolatilitySchema(BaseConfigSchema):
+    """
+    Concrete class that implements the BaseConfigSchema for the 'daily_volatility' database table.
+    The table is derived from 'adjusted_prices' by the analytics stage.
+    """
+
+    @property
+    def columns(self):
+        """
+        Returns the typed columns of the 'daily_volatility' table.
+
+        Returns:
+            List[Column]: Column definitions in table order.
+        """
+        return [
+            Column("unix_date_time", "INTEGER", "unix_date_time", primary_key=True),
+            Column("symbol", "VARCHAR(50)", "symbol", primary_key=True),
+            Column("rolling_vol", "FLOAT", "rolling_vol"),
+            Column("ewma_vol", "FLOAT", "ewma_vol"),
+        ]
+
+    @property
+    def indexes(self):
+        """
+        Returns the secondary indexes of the 'daily_volatility' table.
+
+        Returns:
+            List[Index]: Index definitions.
+        """
+        return [Index(("symbol", "unix_date_time"), name="symbol_time")]
+
+    @property
+    def table_name(self):
+        """
+        Returns the name of the 'daily_volatility' database table.
+
+        Returns:
+            str: Name of the database table.
+        """
+        return "daily_volatility"
+
+    @property
+    def origin_csv_file_path(self):
+        """
+        Returns the file path of the original CSV file for the 'daily_volatility' table.
+        The table is derived from other tables, so there is no original CSV file.
+
+        Returns:
+            None: Derived tables are not loaded from CSV files.
+        """
+        return None
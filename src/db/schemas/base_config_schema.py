@@ -5,6 +5,9 @@ This module defines the base schema for configuring database table creation and
 import logging
 from abc import ABC, abstractmethod
 
+from src.core.config import settings
+from src.db.schemas.columns import compile_table
+
 logging.basicConfig(level=logging.INFO)
 
 
@@ -15,23 +18,65 @@ class BaseConfigSchema(ABC):
 
     @property
     @abstractmethod
+    def columns(self):
+        """
+        Abstract property that should return the typed columns of the table in table order.
+
+        Returns:
+            List[Column]: The column definitions.
+        """
+
+    @property
+    def indexes(self):
+        """
+        Returns the secondary indexes of the table. Tables without secondary indexes return an empty list.
+
+        Returns:
+            List[Index]: The index definitions.
+        """
+        return []
+
+    @property
+    def plan(self):
+        """
+        Returns the plan compiled from the columns and indexes, shared by all instances.
+
+        Returns:
+            TablePlan: DDL, column mapping, dtypes, COPY column order and encoder of the table.
+        """
+        return compile_table(self.table_name, tuple(self.columns), tuple(self.indexes))
+
+    @property
+    def sort_key(self):
+        """
+        Returns the columns the rows are mostly read by, per symbol and in time order.
+        Seeding can load the rows in this order so the rows of a symbol share pages.
+
+        Returns:
+            List[str]: Names of the sort columns, empty if the table has neither.
+        """
+        names = {column.name for column in self.columns}
+        return [name for name in ("symbol", "unix_date_time") if name in names]
+
+    @property
     def column_mapping(self):
         """
-        Abstract property that should return a dictionary mapping column names to their data types.
+        Returns a dictionary mapping the CSV column names to their database fields.
 
         Returns:
-            Dict[str, str]: A dictionary mapping column names to data types.
+            Dict[str, str]: A dictionary mapping CSV column names to database fields.
         """
+        return self.plan.column_mapping
 
     @property
-    @abstractmethod
     def sql_command(self):
         """
-        Abstract property that should return the SQL command to create the table.
+        Returns the SQL command to create the table and its indexes.
 
         Returns:
             str: SQL command string.
         """
+        return self.plan.sql_command
 
     @property
     @abstractmethod
@@ -61,4 +106,26 @@ class BaseConfigSchema(ABC):
         Returns:
             str: Temporary file path for CSV.
         """
-        return f"/tmp/{self.table_name}.csv"
+        return f"{settings.temp_data_path}/{self.table_name}.csv"
+
+    @property
+    def matrix_columns(self):
+        """
+        Returns the value columns that are materialised as aligned date x symbol matrices.
+        Tables without price series return an empty list.
+
+        Returns:
+            List[str]: Names of the columns stored in the price matrix store.
+        """
+        return []
+
+    @property
+    def rollup_resolutions(self):
+        """
+        Returns the resolutions of the OHLC rollups produced for the table's 'price' column
+        when price rollups are enabled. Tables without a rollable price return an empty list.
+
+        Returns:
+            List[str]: Any of 'daily', 'weekly' and 'monthly'.
+        """
+        return []
@@ -0,0 +1,76 @@
+"""
+This module defines the base schema for configuring materialized views over the seeded tables.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class BaseViewSchema(ABC):
+    """
+    Abstract base class that outlines the schema for configuring materialized views.
+    A view is keyed by unique columns, which lets it be refreshed concurrently while it is read.
+    """
+
+    @property
+    @abstractmethod
+    def view_name(self):
+        """
+        Abstract property that should return the name of the materialized view.
+
+        Returns:
+            str: Name of the materialized view.
+        """
+
+    @property
+    @abstractmethod
+    def source_schema(self):
+        """
+        Abstract property that should return the schema of the table the view is computed from.
+
+        Returns:
+            BaseConfigSchema: Schema of the source table.
+        """
+
+    @property
+    @abstractmethod
+    def query(self):
+        """
+        Abstract property that should return the query computing the rows of the view.
+
+        Returns:
+            str: SQL query string.
+        """
+
+    @property
+    def key_columns(self):
+        """
+        Returns the columns that identify a row of the view.
+
+        Returns:
+            List[str]: Names of the key columns.
+        """
+        return ["symbol"]
+
+    @property
+    def sql_command(self):
+        """
+        Returns the SQL command to create the view and the unique index a concurrent refresh needs.
+
+        Returns:
+            str: SQL command string.
+        """
+        key = ", ".join(self.key_columns)
+        return (
+            f"CREATE MATERIALIZED VIEW {self.view_name} AS {self.query};\n"
+            f"CREATE UNIQUE INDEX {self.view_name}_key_idx ON {self.view_name} ({key})"
+        )
+
+    @property
+    def refresh_command(self):
+        """
+        Returns the SQL command to recompute the view without blocking its readers.
+
+        Returns:
+            str: SQL command string.
+        """
+        return f"REFRESH MATERIALIZED VIEW CONCURRENTLY {self.view_name}"
@@ -0,0 +1,210 @@
+"""
+This module defines the typed column model the database tables are declared with.
+
+A schema lists its columns and indexes once. `compile_table` turns them into a TablePlan
+holding everything the stages need: the CREATE TABLE and CREATE INDEX commands, the mapping
+from CSV headers to columns, the pandas dtypes for reading source and parsed files, the
+column order of the COPY and the binary COPY encoder. Plans are compiled once per table and
+cached, so the hot paths look types up instead of inferring them per file.
+"""
+
+import functools
+from typing import NamedTuple, Optional, Tuple
+
+from src.data_processing.binary_copy import TEXT, BinaryCopyEncoder
+
+# SQL type: (dtype of parsed files, dtype of source files or None to infer, COPY format)
+SQL_TYPES = {
+    "SMALLINT": ("Int16", None, ">i2"),
+    "INTEGER": ("Int32", None, ">i4"),
+    "BIGINT": ("Int64", None, ">i8"),
+    "FLOAT": ("float64", "float64", ">f8"),
+    "TEXT": ("str", "str", TEXT),
+    "VARCHAR": ("str", "str", TEXT),
+}
+
+
+class Column(NamedTuple):
+    """
+    A typed column of a database table.
+
+    Attributes:
+        name (str): Column name in the database and in parsed files.
+        sql_type (str): SQL type such as 'INTEGER', 'FLOAT', 'TEXT' or 'VARCHAR(50)'.
+        source (str, optional): Header of the column in the source CSV files, None for
+            columns that are derived while parsing, such as the symbol of a price file.
+        primary_key (bool): Whether the column is part of the primary key.
+    """
+
+    name: str
+    sql_type: str
+    source: Optional[str] = None
+    primary_key: bool = False
+
+    @property
+    def base_type(self):
+        """Returns the SQL type without its length, e.g. 'VARCHAR' for 'VARCHAR(50)'."""
+        return self.sql_type.split("(")[0].upper()
+
+
+class Index(NamedTuple):
+    """
+    A secondary index of a database table.
+
+    Attributes:
+        columns (tuple): Indexed columns in order.
+        name (str, optional): Name suffix, the index is named '<table>_<name>_idx'.
+        method (str, optional): Index access method such as 'brin', a B-tree by default.
+        include (tuple): Columns stored in the index without being indexed, so reads of
+            only these and the indexed columns become index-only scans.
+        after_load (bool): Whether the index is built after the table was seeded instead
+            of with the table, so the COPY does not maintain it row by row.
+    """
+
+    columns: Tuple[str, ...]
+    name: Optional[str] = None
+    method: Optional[str] = None
+    include: Tuple[str, ...] = ()
+    after_load: bool = False
+
+    def index_name(self, table_name):
+        """
+        Returns the name of the index on a table.
+
+        Parameters:
+            table_name (str): Name of the database table.
+
+        Returns:
+            str: Name of the index.
+        """
+        return f"{table_name}_{self.name or '_'.join(self.columns)}_idx"
+
+    def sql_command(self, table_name, concurrently=False, if_not_exists=False):
+        """
+        Returns the command creating the index on a table.
+
+        Parameters:
+            table_name (str): Name of the database table.
+            concurrently (bool): Whether the index is built without blocking writes.
+            if_not_exists (bool): Whether an existing index of the same name is kept.
+
+        Returns:
+            str: SQL command string.
+        """
+        options = " CONCURRENTLY" if concurrently else ""
+        options += " IF NOT EXISTS" if if_not_exists else ""
+        method = f" USING {self.method}" if self.method else ""
+        include = f" INCLUDE ({', '.join(self.include)})" if self.include else ""
+        return (
+            f"CREATE INDEX{options} {self.index_name(table_name)} "
+            f"ON {table_name}{method} ({', '.join(self.columns)}){include}"
+        )
+
+
+class TablePlan:
+    """
+    Everything derived from the column model of a table, compiled once.
+    """
+
+    def __init__(self, table_name, columns, indexes):
+        """
+        Compile the plan of a table.
+
+        Parameters:
+            table_name (str): Name of the database table.
+            columns (tuple): The Column definitions in table order.
+            indexes (tuple): The Index definitions.
+        """
+        unknown = [
+            column.sql_type for column in columns if column.base_type not in SQL_TYPES
+        ]
+        if unknown:
+            raise ValueError(f"Unsupported SQL types in {table_name}: {unknown}")
+
+        self.table_name = table_name
+        self.columns = tuple(columns)
+        self.indexes = tuple(indexes)
+        self.copy_columns = [column.name for column in columns]
+        self.column_mapping = {
+            column.source: column.name for column in columns if column.source
+        }
+        self.dtypes = {
+            column.name: SQL_TYPES[column.base_type][0] for column in columns
+        }
+        self.source_dtypes = {
+            column.source: SQL_TYPES[column.base_type][1]
+            for column in columns
+            if column.source and SQL_TYPES[column.base_type][1]
+        }
+        self.encoder = BinaryCopyEncoder(
+            SQL_TYPES[column.base_type][2] for column in columns
+        )
+        self.create_table_command = self._create_table_command()
+        self.index_commands = [
+            index.sql_command(table_name) for index in indexes if not index.after_load
+        ]
+        self.load_indexes = [index for index in indexes if index.after_load]
+
+    def leading_index(self, columns):
+        """
+        Returns the name of the first index whose leading columns are the given ones.
+
+        Parameters:
+            columns (list): Column names in index order.
+
+        Returns:
+            str or None: Name of the index, None if no index starts with the columns.
+        """
+        columns = tuple(columns)
+        for index in self.indexes:
+            # CLUSTER and ordered reads need a B-tree
+            if index.method not in (None, "btree"):
+                continue
+            if columns and index.columns[: len(columns)] == columns:
+                return index.index_name(self.table_name)
+        return None
+
+    def load_index_commands(self, concurrently=False):
+        """
+        Returns the commands building the indexes that are created after a load.
+        Indexes that exist already are kept, so rebuilding them is cheap.
+
+        Parameters:
+            concurrently (bool): Whether the indexes are built without blocking writes.
+
+        Returns:
+            list: SQL command strings.
+        """
+        return [
+            index.sql_command(self.table_name, concurrently, if_not_exists=True)
+            for index in self.load_indexes
+        ]
+
+    @property
+    def sql_command(self):
+        """Returns the commands creating the table and the indexes built with it."""
+        return ";\n".join([self.create_table_command] + self.index_commands)
+
+    def _create_table_command(self):
+        definitions = [f"{column.name} {column.sql_type}" for column in self.columns]
+        primary_key = [column.name for column in self.columns if column.primary_key]
+        if primary_key:
+            definitions.append(f"PRIMARY KEY ({', '.join(primary_key)})")
+        body = ",\n    ".join(definitions)
+        return f"CREATE TABLE {self.table_name} (\n    {body}\n)"
+
+
+@functools.lru_cache(maxsize=None)
+def compile_table(table_name, columns, indexes=()):
+    """
+    Returns the compiled plan of a table, cached per table definition.
+
+    Parameters:
+        table_name (str): Name of the database table.
+        columns (tuple): The Column definitions in table order.
+        indexes (tuple): The Index definitions.
+
+    Returns:
+        TablePlan: The compiled plan.
+    """
+    return TablePlan(table_name, columns, indexes)
@@ -2,7 +2,9 @@
 This module defines the schema for configuring the 'instrument_config' database table and its associated CSV file.
 """
 
+from src.core.config import settings
 from src.db.schemas.base_config_schema import BaseConfigSchema
+from src.db.schemas.columns import Column
 
 
 class InstrumentConfigSchema(BaseConfigSchema):
@@ -11,46 +13,24 @@ class InstrumentConfigSchema(BaseConfigSchema):
     """
 
     @property
-    def column_mapping(self):
+    def columns(self):
         """
-        Returns a dictionary mapping column names to their corresponding database fields.
+        Returns the typed columns of the 'instrument_config' table.
 
         Returns:
-            Dict[str, str]: A dictionary mapping column names to database fields.
-        """
-        return {
-            "Instrument": "symbol",
-            "Description": "description",
-            "Pointsize": "pointsize",
-            "Currency": "currency",
-            "AssetClass": "asset_class",
-            "PerBlock": "per_block",
-            "Percentage": "percentage",
-            "PerTrade": "per_trade",
-            "Region": "region",
-        }
-
-    @property
-    def sql_command(self):
-        """
-        Returns the SQL command to create the 'instrument_config' table.
-
-        Returns:
-            str: SQL command string.
-        """
-        return """
-                CREATE TABLE instrument_config (
-                        symbol VARCHAR(50) PRIMARY KEY, 
-                        description TEXT, 
-                        pointsize FLOAT, 
-                        currency VARCHAR(10), 
-                        asset_class VARCHAR(50), 
-                        per_block FLOAT, 
-                        percentage FLOAT, 
-                        per_trade INTEGER, 
-                        region VARCHAR(50)
-                    )
-                """
+            List[Column]: Column definitions in table order.
+        """
+        return [
+            Column("symbol", "VARCHAR(50)", "Instrument", primary_key=True),
+            Column("description", "TEXT", "Description"),
+            Column("pointsize", "FLOAT", "Pointsize"),
+            Column("currency", "VARCHAR(10)", "Currency"),
+            Column("asset_class", "VARCHAR(50)", "AssetClass"),
+            Column("per_block", "FLOAT", "PerBlock"),
+            Column("percentage", "FLOAT", "Percentage"),
+            Column("per_trade", "INTEGER", "PerTrade"),
+            Column("region", "VARCHAR(50)", "Region"),
+        ]
 
     @property
     def table_name(self):
@@ -70,4 +50,4 @@ class InstrumentConfigSchema(BaseConfigSchema):
         Returns:
             str: File path of the original CSV.
         """
-        return "/path/in/container/csvconfig/instrumentconfig.csv"
+        return f"{settings.source_data_path}/csvconfig/instrumentconfig.csv"
@@ -2,7 +2,9 @@
 This module defines the schema for configuring the 'instrument_metadata' database table and its associated CSV file.
 """
 
+from src.core.config import settings
 from src.db.schemas.base_config_schema import BaseConfigSchema
+from src.db.schemas.columns import Column
 
 
 class InstrumentMetadataSchema(BaseConfigSchema):
@@ -11,41 +13,20 @@ class InstrumentMetadataSchema(BaseConfigSchema):
     """
 
     @property
-    def column_mapping(self):
+    def columns(self):
         """
-        Returns a dictionary mapping column names to their corresponding database fields.
+        Returns the typed columns of the 'instrument_metadata' table.
 
         Returns:
-            Dict[str, str]: A dictionary mapping column names to database fields.
+            List[Column]: Column definitions in table order.
         """
-        return {
-            "Instrument": "symbol",
-            "AssetClass": "asset_class",
-            "SubClass": "sub_class",
-            "SubSubClass": "sub_sub_class",
-            "Style": "style",
-            "Country": "country",
-            "Duration": "duration",
-            "Description": "description",
-        }
-
-    @property
-    def sql_command(self):
-        """
-        Returns the SQL command to create the 'instrument_metadata' table.
-
-        Returns:
-            str: SQL command string.
-        """
-        return """
-                CREATE TABLE instrument_metadata (
-                    symbol VARCHAR(50) PRIMARY KEY,
-                    asset_class VARCHAR(50),
-                    sub_class VARCHAR(50),
-                    sub_sub_class VARCHAR(50),
-                    description VARCHAR(100)
-                )
-                """
+        return [
+            Column("symbol", "VARCHAR(50)", "Instrument", primary_key=True),
+            Column("asset_class", "VARCHAR(50)", "AssetClass"),
+            Column("sub_class", "VARCHAR(50)", "SubClass"),
+            Column("sub_sub_class", "VARCHAR(50)", "SubSubClass"),
+            Column("description", "VARCHAR(100)", "Description"),
+        ]
 
     @property
     def table_name(self):
@@ -65,4 +46,4 @@ class InstrumentMetadataSchema(BaseConfigSchema):
         Returns:
             str: File path of the original CSV.
         """
-        return "/path/in/container/csvconfig/moreinstrumentinfo.csv"
+        return f"{settings.source_data_path}/csvconfig/moreinstrumentinfo.csv"
@@ -2,7 +2,9 @@
 This module defines the schema for configuring the 'roll_config' database table and its associated CSV file.
 """
 
+from src.core.config import settings
 from src.db.schemas.base_config_schema import BaseConfigSchema
+from src.db.schemas.columns import Column
 
 
 class RollConfigSchema(BaseConfigSchema):
@@ -11,40 +13,21 @@ class RollConfigSchema(BaseConfigSchema):
     """
 
     @property
-    def column_mapping(self):
+    def columns(self):
         """
-        Returns a dictionary mapping column names to their corresponding database fields.
+        Returns the typed columns of the 'roll_config' table.
 
         Returns:
-            Dict[str, str]: A dictionary mapping column names to database fields.
+            List[Column]: Column definitions in table order.
         """
-        return {
-            "Instrument": "symbol",
-            "HoldRollCycle": "hold_roll_cycle",
-            "RollOffsetDays": "roll_offset_days",
-            "CarryOffset": "carry_offset",
-            "PricedRollCycle": "priced_roll_cycle",
-            "ExpiryOffset": "expiry_offset",
-        }
-
-    @property
-    def sql_command(self):
-        """
-        Returns the SQL command to create the 'roll_config' table.
-
-        Returns:
-            str: SQL command string.
-        """
-        return """
-                CREATE TABLE roll_config (
-                    symbol VARCHAR(50) PRIMARY KEY,
-                    hold_roll_cycle VARCHAR(50),
-                    roll_offset_days INTEGER,
-                    carry_offset INTEGER,
-                    priced_roll_cycle VARCHAR(50),
-                    expiry_offset INTEGER
-                )
-                """
+        return [
+            Column("symbol", "VARCHAR(50)", "Instrument", primary_key=True),
+            Column("hold_roll_cycle", "VARCHAR(50)", "HoldRollCycle"),
+            Column("roll_offset_days", "INTEGER", "RollOffsetDays"),
+            Column("carry_offset", "INTEGER", "CarryOffset"),
+            Column("priced_roll_cycle", "VARCHAR(50)", "PricedRollCycle"),
+            Column("expiry_offset", "INTEGER", "ExpiryOffset"),
+        ]
 
     @property
     def table_name(self):
@@ -64,4 +47,4 @@ class RollConfigSchema(BaseConfigSchema):
         Returns:
             str: File path of the original CSV.
         """
-        return "/path/in/container/csvconfig/rollconfig.csv"
+        return f"{settings.source_data_path}/csvconfig/rollconfig.csv"
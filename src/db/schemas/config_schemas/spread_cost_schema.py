@@ -2,7 +2,9 @@
 This module defines the schema for configuring the 'spread_cost' database table and its associated CSV file.
 """
 
+from src.core.config import settings
 from src.db.schemas.base_config_schema import BaseConfigSchema
+from src.db.schemas.columns import Column
 
 
 class SpreadCostSchema(BaseConfigSchema):
@@ -11,29 +13,17 @@ class SpreadCostSchema(BaseConfigSchema):
     """
 
     @property
-    def column_mapping(self):
+    def columns(self):
         """
-        Returns a dictionary mapping column names to their corresponding database fields.
+        Returns the typed columns of the 'spread_cost' table.
 
         Returns:
-            Dict[str, str]: A dictionary mapping column names to database fields.
+            List[Column]: Column definitions in table order.
         """
-        return {"Instrument": "symbol", "SpreadCost": "spread_cost"}
-
-    @property
-    def sql_command(self):
-        """
-        Returns the SQL command to create the 'spread_cost' table.
-
-        Returns:
-            str: SQL command string.
-        """
-        return """
-                CREATE TABLE spread_cost (
-                    symbol VARCHAR(50) PRIMARY KEY,
-                    spread_cost FLOAT
-                )
-                """
+        return [
+            Column("symbol", "VARCHAR(50)", "Instrument", primary_key=True),
+            Column("spread_cost", "FLOAT", "SpreadCost"),
+        ]
 
     @property
     def table_name(self):
@@ -53,4 +43,4 @@ class SpreadCostSchema(BaseConfigSchema):
         Returns:
             str: File path of the original CSV.
         """
-        return "/path/in/container/csvconfig/spreadcosts.csv"
+        return f"{settings.source_data_path}/csvconfig/spreadcosts.csv"
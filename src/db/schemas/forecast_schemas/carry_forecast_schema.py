@@ -0,0 +1,60 @@
+"""
+This module defines the schema for configuring the derived 'carry_forecasts' database table.
+"""
+
+from src.db.schemas.base_config_schema import BaseConfigSchema
+from src.db.schemas.columns import Column, Index
+
+
+class CarryForecastSchema(BaseConfigSchema):
+    """
+    Concrete class that implements the BaseConfigSchema for the 'carry_forecasts' database table.
+    The table is derived from 'multiple_prices' and 'adjusted_prices' by the forecast stage.
+    """
+
+    @property
+    def columns(self):
+        """
+        Returns the typed columns of the 'carry_forecasts' table.
+
+        Returns:
+            List[Column]: Column definitions in table order.
+        """
+        return [
+            Column("unix_date_time", "INTEGER", "unix_date_time", primary_key=True),
+            Column("symbol", "VARCHAR(50)", "symbol", primary_key=True),
+            Column("annualised_carry", "FLOAT", "annualised_carry"),
+            Column("raw_forecast", "FLOAT", "raw_forecast"),
+            Column("forecast", "FLOAT", "forecast"),
+        ]
+
+    @property
+    def indexes(self):
+        """
+        Returns the secondary indexes of the 'carry_forecasts' table.
+
+        Returns:
+            List[Index]: Index definitions.
+        """
+        return [Index(("symbol", "unix_date_time"), name="symbol_time")]
+
+    @property
+    def table_name(self):
+        """
+        Returns the name of the 'carry_forecasts' database table.
+
+        Returns:
+            str: Name of the database table.
+        """
+        return "carry_forecasts"
+
+    @property
+    def origin_csv_file_path(self):
+        """
+        Returns the file path of the original CSV file for the 'carry_forecasts' table.
+        The table is derived from other tables, so there is no original CSV file.
+
+        Returns:
+            None: Derived tables are not loaded from CSV files.
+        """
+        return None
@@ -0,0 +1,142 @@
+"""
+This module defines the optional array-packed layout of the raw data tables.
+
+With PACKED_SERIES enabled, every raw data table gets a companion '<table>_packed' table
+holding one row per symbol and calendar year: the times and every value column of that year
+as arrays in time order. Reading the full history of a symbol then fetches a few rows per
+decade instead of thousands, and the arrays are compressed as a whole. The row tables stay
+the source of truth for ad-hoc SQL, the seeder packs them after every load.
+"""
+
+import struct
+
+from src.core.config import settings
+from src.db.schemas.schemas import get_raw_data_schemas
+
+# Calendar year in UTC of a unix time
+YEAR_SQL = (
+    "EXTRACT(YEAR FROM to_timestamp(unix_date_time) AT TIME ZONE 'UTC')::SMALLINT"
+)
+
+# Element type oid of a binary array: NumPy format of the values
+ARRAY_ELEMENT_FORMATS = {21: ">i2", 23: ">i4", 20: ">i8", 700: ">f4", 701: ">f8"}
+
+
+def uses_packed_series(table_name):
+    """
+    Returns whether a table is also stored in the packed layout.
+
+    Parameters:
+        table_name (str): Name of the database table.
+
+    Returns:
+        bool: True for raw data tables when the packed layout is enabled.
+    """
+    return settings.packed_series and table_name in {
+        schema.table_name for schema in get_raw_data_schemas()
+    }
+
+
+def packed_table_name(table_name):
+    """
+    Returns the name of the packed companion of a table.
+
+    Parameters:
+        table_name (str): Name of the raw data table.
+
+    Returns:
+        str: Name of the packed table.
+    """
+    return f"{table_name}_packed"
+
+
+def series_columns(schema):
+    """
+    Returns the columns of a schema that are packed into arrays, the time first.
+
+    Parameters:
+        schema (BaseConfigSchema): Schema of a raw data table.
+
+    Returns:
+        List[Column]: The packed columns.
+    """
+    return [column for column in schema.columns if column.name != "symbol"]
+
+
+def packed_sql_command(schema):
+    """
+    Returns the SQL command creating the packed table of a schema.
+
+    Parameters:
+        schema (BaseConfigSchema): Schema of a raw data table.
+
+    Returns:
+        str: SQL command string.
+    """
+    definitions = ["symbol VARCHAR(50)", "year SMALLINT"] + [
+        f"{column.name} {column.sql_type}[]" for column in series_columns(schema)
+    ]
+    body = ",\n    ".join(definitions + ["PRIMARY KEY (symbol, year)"])
+    return f"CREATE TABLE {packed_table_name(schema.table_name)} (\n    {body}\n)"
+
+
+def pack_sql_command(schema, filtered=False):
+    """
+    Returns the SQL command packing the rows of a table into its packed table.
+
+    Parameters:
+        schema (BaseConfigSchema): Schema of a raw data table.
+        filtered (bool): Whether only the symbols passed as text array $1 are packed.
+
+    Returns:
+        str: SQL command string.
+    """
+    names = [column.name for column in series_columns(schema)]
+    arrays = ", ".join(f"array_agg({name} ORDER BY unix_date_time)" for name in names)
+    where = " WHERE symbol = ANY($1::text[])" if filtered else ""
+    return (
+        f"INSERT INTO {packed_table_name(schema.table_name)} "
+        f"(symbol, year, {', '.join(names)}) "
+        f"SELECT symbol, {YEAR_SQL} AS year, {arrays} "
+        f"FROM {schema.table_name}{where} GROUP BY symbol, year"
+    )
+
+
+def decode_array(data):
+    """
+    Decodes a one-dimensional array in the binary format of 'array_send' into NumPy.
+    NULL elements become NaN, which turns integer arrays into floats.
+
+    Parameters:
+        data (bytes): The binary array.
+
+    Returns:
+        np.ndarray: The values in native byte order.
+    """
+    # Deferred like in the application, NumPy is not needed to start it
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    dimensions, has_nulls, element_type = struct.unpack_from(">iii", data)
+    value_format = ARRAY_ELEMENT_FORMATS[element_type]
+    if dimensions == 0:
+        return np.empty(0, dtype=np.dtype(value_format).newbyteorder("="))
+    if dimensions != 1:
+        raise ValueError(f"Expected a one-dimensional array, got {dimensions}")
+    (length,) = struct.unpack_from(">i", data, 12)
+    offset = 20
+    if not has_nulls:
+        # Every element is its length followed by the value, a fixed stride
+        elements = np.frombuffer(
+            data, dtype=[("length", ">i4"), ("value", value_format)], offset=offset
+        )
+        return elements["value"].astype(np.dtype(value_format).newbyteorder("="))
+
+    values = np.full(length, np.nan)
+    for position in range(length):
+        (size,) = struct.unpack_from(">i", data, offset)
+        offset += 4
+        if size < 0:
+            continue
+        values[position] = np.frombuffer(data, value_format, 1, offset)[0]
+        offset += size
+    return values
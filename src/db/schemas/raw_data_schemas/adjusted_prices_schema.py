@@ -2,7 +2,9 @@
 This module defines the schema for configuring the 'adjusted_prices' database table and its associated CSV file.
 """
 
+from src.core.config import settings
 from src.db.schemas.base_config_schema import BaseConfigSchema
+from src.db.schemas.columns import Column, Index
 
 
 class AdjustedPricesSchema(BaseConfigSchema):
@@ -11,31 +13,37 @@ class AdjustedPricesSchema(BaseConfigSchema):
     """
 
     @property
-    def column_mapping(self):
+    def columns(self):
         """
-        Returns a dictionary mapping column names to their corresponding database fields.
+        Returns the typed columns of the 'adjusted_prices' table.
 
         Returns:
-            Dict[str, str]: A dictionary mapping column names to database fields.
+            List[Column]: Column definitions in table order.
         """
-        return {"DATETIME": "unix_date_time", "price": "price"}
+        return [
+            Column("unix_date_time", "INTEGER", "DATETIME", primary_key=True),
+            Column("symbol", "VARCHAR(50)", primary_key=True),
+            Column("price", "FLOAT", "price"),
+        ]
 
     @property
-    def sql_command(self):
+    def indexes(self):
         """
-        Returns the SQL command to create the 'adjusted_prices' table.
+        Returns the secondary indexes of the 'adjusted_prices' table, built after it was seeded.
+        Per-symbol history reads use the covering index instead of the primary key,
+        which leads with time.
 
         Returns:
-            str: SQL command string.
+            List[Index]: Index definitions.
         """
-        return """
-                CREATE TABLE adjusted_prices (
-                        unix_date_time INTEGER,
-                        symbol VARCHAR(50),
-                        price FLOAT,
-                        PRIMARY KEY (unix_date_time, symbol)
-                    )
-                """
+        return [
+            Index(
+                ("symbol", "unix_date_time"),
+                name="symbol_time",
+                include=("price",),
+                after_load=True,
+            ),
+        ]
 
     @property
     def table_name(self):
@@ -55,4 +63,24 @@ class AdjustedPricesSchema(BaseConfigSchema):
         Returns:
             str: File path of the original CSV.
         """
-        return "/path/in/container/adjusted_prices_csv/"
+        return f"{settings.source_data_path}/adjusted_prices_csv/"
+
+    @property
+    def matrix_columns(self):
+        """
+        Returns the value columns of the 'adjusted_prices' table that are stored as price matrices.
+
+        Returns:
+            List[str]: Names of the columns stored in the price matrix store.
+        """
+        return ["price"]
+
+    @property
+    def rollup_resolutions(self):
+        """
+        Returns the resolutions of the OHLC rollups produced for the 'adjusted_prices' table.
+
+        Returns:
+            List[str]: Resolutions of the rollup tables.
+        """
+        return ["daily", "weekly", "monthly"]
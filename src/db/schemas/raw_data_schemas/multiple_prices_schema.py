@@ -2,7 +2,9 @@
 This module defines the schema for configuring the 'multiple_prices' database table and its associated CSV file.
 """
 
+from src.core.config import settings
 from src.db.schemas.base_config_schema import BaseConfigSchema
+from src.db.schemas.columns import Column, Index
 
 
 class MultiplePricesSchema(BaseConfigSchema):
@@ -11,44 +13,42 @@ class MultiplePricesSchema(BaseConfigSchema):
     """
 
     @property
-    def column_mapping(self):
+    def columns(self):
         """
-        Returns a dictionary mapping column names to their corresponding database fields.
+        Returns the typed columns of the 'multiple_prices' table.
 
         Returns:
-            Dict[str, str]: A dictionary mapping column names to database fields.
+            List[Column]: Column definitions in table order.
         """
-        return {
-            "DATETIME": "unix_date_time",
-            "CARRY": "carry",
-            "CARRY_CONTRACT": "carry_contract",
-            "PRICE": "price",
-            "PRICE_CONTRACT": "price_contract",
-            "FORWARD": "forward",
-            "FORWARD_CONTRACT": "forward_contract",
-        }
+        return [
+            Column("unix_date_time", "INTEGER", "DATETIME", primary_key=True),
+            Column("symbol", "VARCHAR(50)", primary_key=True),
+            Column("carry", "FLOAT", "CARRY"),
+            Column("carry_contract", "INTEGER", "CARRY_CONTRACT"),
+            Column("price", "FLOAT", "PRICE"),
+            Column("price_contract", "INTEGER", "PRICE_CONTRACT"),
+            Column("forward", "FLOAT", "FORWARD"),
+            Column("forward_contract", "INTEGER", "FORWARD_CONTRACT"),
+        ]
 
     @property
-    def sql_command(self):
+    def indexes(self):
         """
-        Returns the SQL command to create the 'multiple_prices' table.
+        Returns the secondary indexes of the 'multiple_prices' table, built after it was seeded.
+        Per-symbol history reads use the covering index instead of the primary key,
+        which leads with time.
 
         Returns:
-            str: SQL command string.
+            List[Index]: Index definitions.
         """
-        return """
-            CREATE TABLE multiple_prices (
-                    unix_date_time INTEGER,
-                    symbol VARCHAR(50),
-                    carry FLOAT, 
-                    carry_contract INTEGER, 
-                    price FLOAT, 
-                    price_contract INTEGER, 
-                    forward FLOAT, 
-                    forward_contract INTEGER,
-                    PRIMARY KEY (unix_date_time, symbol)
-                )
-            """
+        return [
+            Index(
+                ("symbol", "unix_date_time"),
+                name="symbol_time",
+                include=("price", "carry", "price_contract", "carry_contract"),
+                after_load=True,
+            ),
+        ]
 
     @property
     def table_name(self):
@@ -68,4 +68,14 @@ class MultiplePricesSchema(BaseConfigSchema):
         Returns:
             str: File path of the original CSV.
         """
-        return "/path/in/container/multiple_prices_csv/"
+        return f"{settings.source_data_path}/multiple_prices_csv/"
+
+    @property
+    def matrix_columns(self):
+        """
+        Returns the value columns of the 'multiple_prices' table that are stored as price matrices.
+
+        Returns:
+            List[str]: Names of the columns stored in the price matrix store.
+        """
+        return ["price", "carry", "forward"]
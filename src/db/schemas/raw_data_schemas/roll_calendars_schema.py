@@ -2,7 +2,9 @@
 This module defines the schema for configuring the 'roll_calendars' database table and its associated CSV file.
 """
 
+from src.core.config import settings
 from src.db.schemas.base_config_schema import BaseConfigSchema
+from src.db.schemas.columns import Column, Index
 
 
 class RollCalendarsSchema(BaseConfigSchema):
@@ -11,35 +13,33 @@ class RollCalendarsSchema(BaseConfigSchema):
     """
 
     @property
-    def column_mapping(self):
+    def columns(self):
         """
-        Returns a dictionary mapping column names to their corresponding database fields.
+        Returns the typed columns of the 'roll_calendars' table.
 
         Returns:
-            Dict[str, str]: A dictionary mapping column names to database fields.
+            List[Column]: Column definitions in table order.
         """
-        return {
-            "DATE_TIME": "unix_date_time",
-        }
+        return [
+            Column("unix_date_time", "INTEGER", "DATE_TIME", primary_key=True),
+            Column("symbol", "VARCHAR(50)", primary_key=True),
+            Column("current_contract", "INTEGER", "current_contract"),
+            Column("next_contract", "INTEGER", "next_contract"),
+            Column("carry_contract", "INTEGER", "carry_contract"),
+        ]
 
     @property
-    def sql_command(self):
+    def indexes(self):
         """
-        Returns the SQL command to create the 'roll_calendars' table.
+        Returns the secondary indexes of the 'roll_calendars' table, built after it was seeded.
+        Per-symbol reads use it instead of the primary key, which leads with time.
 
         Returns:
-            str: SQL command string.
-        """
-        return """
-                CREATE TABLE roll_calendars (
-                        unix_date_time INTEGER,
-                        symbol VARCHAR(50),
-                        current_contract INTEGER,
-                        next_contract INTEGER,
-                        carry_contract INTEGER,
-                        PRIMARY KEY (unix_date_time, symbol)
-                    )
-                """
+            List[Index]: Index definitions.
+        """
+        return [
+            Index(("symbol", "unix_date_time"), name="symbol_time", after_load=True),
+        ]
 
     @property
     def table_name(self):
@@ -59,4 +59,4 @@ class RollCalendarsSchema(BaseConfigSchema):
         Returns:
             str: File path of the original CSV.
         """
-        return "/path/in/container/roll_calendars_csv/"
+        return f"{settings.source_data_path}/roll_calendars_csv/"
@@ -0,0 +1,63 @@
+"""
+This module defines the schema for configuring the OHLC rollup tables of raw price data.
+"""
+
+from src.db.schemas.base_config_schema import BaseConfigSchema
+from src.db.schemas.columns import Column
+
+
+class PriceRollupSchema(BaseConfigSchema):
+    """
+    Concrete class that implements the BaseConfigSchema for an OHLC rollup table of a raw data table,
+    e.g. 'adjusted_prices_weekly_ohlc'. The rollups are produced while parsing the raw data files.
+    """
+
+    def __init__(self, source_schema, resolution):
+        """
+        Initialize the rollup schema for a resolution of a raw data schema.
+
+        Parameters:
+            source_schema (BaseConfigSchema): Schema of the raw data table that is rolled up.
+            resolution (str): One of 'daily', 'weekly' and 'monthly'.
+        """
+        self.source_schema = source_schema
+        self.resolution = resolution
+
+    @property
+    def columns(self):
+        """
+        Returns the typed columns of the rollup table.
+
+        Returns:
+            List[Column]: Column definitions in table order.
+        """
+        return [
+            Column("unix_date_time", "INTEGER", "unix_date_time", primary_key=True),
+            Column("symbol", "VARCHAR(50)", "symbol", primary_key=True),
+            Column("open", "FLOAT", "open"),
+            Column("high", "FLOAT", "high"),
+            Column("low", "FLOAT", "low"),
+            Column("close", "FLOAT", "close"),
+            Column("mean", "FLOAT", "mean"),
+            Column("sample_count", "INTEGER", "sample_count"),
+        ]
+
+    @property
+    def table_name(self):
+        """
+        Returns the name of the rollup database table.
+
+        Returns:
+            str: Name of the database table.
+        """
+        return f"{self.source_schema.table_name}_{self.resolution}_ohlc"
+
+    @property
+    def origin_csv_file_path(self):
+        """
+        Returns the file path of the original CSV files, shared with the rolled up raw data table.
+
+        Returns:
+            str: File path of the original CSV.
+        """
+        return self.source_schema.origin_csv_file_path
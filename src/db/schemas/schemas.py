@@ -2,15 +2,27 @@
 This module serves as an aggregator for different schema objects used to configure database tables.
 """
 
+from src.core.config import settings
+from src.core.selection import matches_any
+from src.db.schemas.analytics_schemas.daily_returns_schema import DailyReturnsSchema
+from src.db.schemas.analytics_schemas.daily_volatility_schema import (
+    DailyVolatilitySchema,
+)
 from src.db.schemas.config_schemas.instrument_config_schema import (
     InstrumentConfigSchema,
 )
 from src.db.schemas.config_schemas.roll_config_schema import RollConfigSchema
 from src.db.schemas.config_schemas.spread_cost_schema import SpreadCostSchema
+from src.db.schemas.forecast_schemas.carry_forecast_schema import CarryForecastSchema
 from src.db.schemas.raw_data_schemas.adjusted_prices_schema import AdjustedPricesSchema
 from src.db.schemas.raw_data_schemas.fx_prices_schema import FxPricesSchema
 from src.db.schemas.raw_data_schemas.multiple_prices_schema import MultiplePricesSchema
 from src.db.schemas.raw_data_schemas.roll_calendars_schema import RollCalendarsSchema
+from src.db.schemas.rollup_schemas.price_rollup_schema import PriceRollupSchema
+from src.db.schemas.view_schemas.latest_values_view_schema import LatestValuesViewSchema
+from src.db.schemas.view_schemas.symbol_summary_view_schema import (
+    SymbolSummaryViewSchema,
+)
 
 
 def get_schemas():
@@ -20,7 +32,7 @@ def get_schemas():
     Returns:
         list: A list containing all schema objects.
     """
-    return get_configs_schemas() + get_raw_data_schemas()
+    return get_configs_schemas() + get_raw_data_schemas() + get_rollup_schemas()
 
 
 def get_configs_schemas():
@@ -51,3 +63,98 @@ def get_raw_data_schemas():
         MultiplePricesSchema(),
         RollCalendarsSchema(),
     ]
+
+
+def get_rollup_schemas(source_schema=None):
+    """
+    Returns a list of schema objects for the OHLC rollup tables of raw data.
+    The list is empty unless price rollups are enabled.
+
+    Parameters:
+        source_schema (BaseConfigSchema, optional): Only return the rollups of this raw data schema.
+
+    Returns:
+        list: A list containing schema objects related to price rollups.
+    """
+    if not settings.price_rollups:
+        return []
+    source_schemas = (
+        get_raw_data_schemas() if source_schema is None else [source_schema]
+    )
+    return [
+        PriceRollupSchema(schema, resolution)
+        for schema in source_schemas
+        for resolution in schema.rollup_resolutions
+    ]
+
+
+def get_analytics_schemas():
+    """
+    Returns a list of schema objects for tables derived from the seeded data.
+
+    Returns:
+        list: A list containing schema objects related to derived analytics.
+    """
+    return [
+        DailyReturnsSchema(),
+        DailyVolatilitySchema(),
+    ]
+
+
+def get_forecast_schemas():
+    """
+    Returns a list of schema objects for forecast tables.
+
+    Returns:
+        list: A list containing schema objects related to forecasts.
+    """
+    return [
+        CarryForecastSchema(),
+    ]
+
+
+def get_view_schemas(source_schema=None):
+    """
+    Returns a list of schema objects for the materialized views over the raw data tables:
+    the latest row and the summary statistics of every symbol.
+    The list is empty unless snapshot views are enabled.
+
+    Parameters:
+        source_schema (BaseConfigSchema, optional): Only return the views of this raw data schema.
+
+    Returns:
+        list: A list containing schema objects related to materialized views.
+    """
+    if not settings.snapshot_views:
+        return []
+    source_schemas = (
+        get_raw_data_schemas() if source_schema is None else [source_schema]
+    )
+    return [
+        view_schema(schema)
+        for schema in source_schemas
+        for view_schema in (LatestValuesViewSchema, SymbolSummaryViewSchema)
+    ]
+
+
+def select_schemas(schemas, patterns=None):
+    """
+    Returns the schemas whose table name matches any of the glob patterns.
+    Rollup schemas are also selected by the table name of their raw data schema, so
+    selecting 'adjusted_prices' includes its OHLC rollups.
+
+    Parameters:
+        schemas (list): The schema objects to select from.
+        patterns (list, optional): Glob patterns of table names, all schemas if empty.
+
+    Returns:
+        list: The selected schema objects.
+    """
+    selected = []
+    for schema in schemas:
+        names = [schema.table_name]
+        if isinstance(schema, PriceRollupSchema):
+            names.append(schema.source_schema.table_name)
+        if any(matches_any(name, patterns) for name in names):
+            selected.append(schema)
+    return selected
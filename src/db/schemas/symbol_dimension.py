@@ -0,0 +1,141 @@
+"""
+This module defines the optional compact layout of the raw data tables, keyed by symbol ids.
+
+With COMPACT_SYMBOLS enabled, symbols are stored once in the 'symbols' dimension table and
+the raw data rows reference them by a SMALLINT id. The rows live in '<table>_by_id' and a
+view under the original table name joins the symbol back, so queries reading the raw data
+tables keep working unchanged. Writes go to the storage table with the symbols translated
+to their ids by the DataInserter.
+"""
+
+from src.core.config import settings
+from src.db.schemas.columns import Column, compile_table
+from src.db.schemas.schemas import get_raw_data_schemas
+
+SYMBOLS_TABLE = "symbols"
+SYMBOLS_SQL_COMMAND = """
+    CREATE TABLE IF NOT EXISTS symbols (
+            symbol_id SMALLINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+            symbol VARCHAR(50) NOT NULL UNIQUE
+        )
+    """
+
+
+def uses_symbol_ids(table_name):
+    """
+    Returns whether a table is stored with symbol ids.
+
+    Parameters:
+        table_name (str): Name of the database table.
+
+    Returns:
+        bool: True for raw data tables when the compact layout is enabled.
+    """
+    return settings.compact_symbols and table_name in {
+        schema.table_name for schema in get_raw_data_schemas()
+    }
+
+
+def storage_table_name(table_name):
+    """
+    Returns the name of the table holding the rows of a table stored with symbol ids.
+
+    Parameters:
+        table_name (str): Name of the raw data table, which is a view in the compact layout.
+
+    Returns:
+        str: Name of the storage table.
+    """
+    return f"{table_name}_by_id"
+
+
+def storage_columns(schema, names):
+    """
+    Returns the names of columns of a schema in the table its rows are written to.
+
+    Parameters:
+        schema (BaseConfigSchema): Schema of the table.
+        names (list): Column names of the schema.
+
+    Returns:
+        list: The names with 'symbol' replaced by 'symbol_id' in the compact layout.
+    """
+    if not uses_symbol_ids(schema.table_name):
+        return list(names)
+    return ["symbol_id" if name == "symbol" else name for name in names]
+
+
+def storage_plan(schema):
+    """
+    Returns the compiled plan of the table the rows of a schema are written to.
+    In the compact layout the plan of a raw data table describes its storage table, with the
+    'symbol' column replaced by a SMALLINT 'symbol_id' column at the same position.
+
+    Parameters:
+        schema (BaseConfigSchema): Schema of the table.
+
+    Returns:
+        TablePlan: The compiled plan.
+    """
+    if not uses_symbol_ids(schema.table_name):
+        return schema.plan
+    columns = tuple(
+        (
+            Column("symbol_id", "SMALLINT", primary_key=column.primary_key)
+            if column.name == "symbol"
+            else column
+        )
+        for column in schema.columns
+    )
+    indexes = tuple(
+        index._replace(
+            columns=tuple(storage_columns(schema, index.columns)),
+            include=tuple(storage_columns(schema, index.include)),
+        )
+        for index in schema.indexes
+    )
+    return compile_table(storage_table_name(schema.table_name), columns, indexes)
+
+
+def table_sql_command(schema):
+    """
+    Returns the SQL command creating the table of a schema in the configured layout.
+    In the compact layout this creates the storage table and the view of a raw data table,
+    the 'symbols' table has to exist already.
+
+    Parameters:
+        schema (BaseConfigSchema): Schema of the table.
+
+    Returns:
+        str: SQL command string.
+    """
+    if not uses_symbol_ids(schema.table_name):
+        return schema.sql_command
+
+    storage_table = storage_table_name(schema.table_name)
+    columns = [
+        "s.symbol" if column.name == "symbol" else f"t.{column.name}"
+        for column in schema.columns
+    ]
+    return f"""{storage_plan(schema).sql_command};
+        CREATE VIEW {schema.table_name} AS
+            SELECT {', '.join(columns)}
+            FROM {storage_table} t
+            JOIN {SYMBOLS_TABLE} s ON s.symbol_id = t.symbol_id
+        """
+
+
+def encode_symbols(data_frame, symbol_ids):
+    """
+    Replaces the 'symbol' column of a frame with the 'symbol_id' column at the same position.
+
+    Parameters:
+        data_frame (pd.DataFrame): Rows with a 'symbol' column.
+        symbol_ids (dict): Mapping of every symbol in the frame to its id.
+
+    Returns:
+        pd.DataFrame: The rows with symbol ids.
+    """
+    encoded = data_frame.rename(columns={"symbol": "symbol_id"})
+    encoded["symbol_id"] = data_frame["symbol"].map(symbol_ids).astype("int16")
+    return encoded
@@ -0,0 +1,56 @@
+"""
+This module defines the schema for configuring the materialized views of the latest row per symbol.
+"""
+
+from src.db.schemas.base_view_schema import BaseViewSchema
+
+
+class LatestValuesViewSchema(BaseViewSchema):
+    """
+    Concrete class that implements the BaseViewSchema for the latest row of every symbol in a raw
+    data table, e.g. 'multiple_prices_latest' with the latest price, carry and forward.
+    """
+
+    def __init__(self, source_schema):
+        """
+        Initialize the view schema for a raw data schema.
+
+        Parameters:
+            source_schema (BaseConfigSchema): Schema of the raw data table.
+        """
+        self._source_schema = source_schema
+
+    @property
+    def view_name(self):
+        """
+        Returns the name of the materialized view.
+
+        Returns:
+            str: Name of the materialized view.
+        """
+        return f"{self._source_schema.table_name}_latest"
+
+    @property
+    def source_schema(self):
+        """
+        Returns the schema of the raw data table the view is computed from.
+
+        Returns:
+            BaseConfigSchema: Schema of the source table.
+        """
+        return self._source_schema
+
+    @property
+    def query(self):
+        """
+        Returns the query selecting the row with the latest time of every symbol.
+
+        Returns:
+            str: SQL query string.
+        """
+        columns = ", ".join(column.name for column in self._source_schema.columns)
+        return (
+            f"SELECT DISTINCT ON (symbol) {columns} "
+            f"FROM {self._source_schema.table_name} "
+            "ORDER BY symbol, unix_date_time DESC"
+        )
@@ -0,0 +1,55 @@
+"""
+This module defines the schema for configuring the materialized views of per-symbol summary statistics.
+"""
+
+from src.db.schemas.base_view_schema import BaseViewSchema
+
+
+class SymbolSummaryViewSchema(BaseViewSchema):
+    """
+    Concrete class that implements the BaseViewSchema for the first and last time and the row
+    count of every symbol in a raw data table, e.g. 'adjusted_prices_summary'.
+    """
+
+    def __init__(self, source_schema):
+        """
+        Initialize the view schema for a raw data schema.
+
+        Parameters:
+            source_schema (BaseConfigSchema): Schema of the raw data table.
+        """
+        self._source_schema = source_schema
+
+    @property
+    def view_name(self):
+        """
+        Returns the name of the materialized view.
+
+        Returns:
+            str: Name of the materialized view.
+        """
+        return f"{self._source_schema.table_name}_summary"
+
+    @property
+    def source_schema(self):
+        """
+        Returns the schema of the raw data table the view is computed from.
+
+        Returns:
+            BaseConfigSchema: Schema of the source table.
+        """
+        return self._source_schema
+
+    @property
+    def query(self):
+        """
+        Returns the query aggregating the rows of every symbol.
+
+        Returns:
+            str: SQL query string.
+        """
+        return (
+            "SELECT symbol, MIN(unix_date_time) AS first_date, "
+            "MAX(unix_date_time) AS last_date, COUNT(*) AS row_count "
+            f"FROM {self._source_schema.table_name} GROUP BY symbol"
+        )
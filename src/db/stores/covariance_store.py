@@ -0,0 +1,177 @@
+"""
+This module provides a file-based cache of weekly EWMA covariance matrices.
+
+Every sampled week is stored as the upper triangle of its covariance matrix in a
+week x pair float32 `.npy` file that is memory-mapped on read, so the matrix of any date
+is returned without recomputation. The EWMA state after the last week is stored next to
+it, so new weeks can be appended without going through the history again.
+
+Layout::
+
+    <base_path>/covariance/current.json       manifest with the version, symbols and span
+    <base_path>/covariance/<version>/dates.npy
+    <base_path>/covariance/<version>/covariance.npy
+    <base_path>/covariance/<version>/state.npz
+"""
+
+import os
+
+import numpy as np
+
+from src.data_processing.covariance_helper import (
+    EwmaCovarianceState,
+    covariance_to_correlation,
+    from_upper_triangle,
+)
+from src.db.errors import MatrixNotFoundError, MatrixStoreError
+from src.db.stores.versioned_store import VersionedStore
+
+DATASET_NAME = "covariance"
+
+
+class CovarianceStore(VersionedStore):
+    """
+    Writes, extends and reads the cached weekly covariance matrices.
+    """
+
+    def write(self, dates, symbols, covariances, state, span) -> None:
+        """
+        Write the covariance matrices of all sampled weeks as a new version.
+
+        Parameters:
+            dates (np.ndarray): Unix timestamps of the sampled weeks.
+            symbols (list): Symbols of the matrix rows and columns.
+            covariances (np.ndarray): Week x upper-triangle array of packed covariance matrices.
+            state (EwmaCovarianceState): EWMA state after the last week.
+            span (int): Span of the EWMA in weeks.
+        """
+        version_path = self._create_version(DATASET_NAME)
+        np.save(os.path.join(version_path, "dates.npy"), np.asarray(dates, np.int64))
+        np.save(os.path.join(version_path, "covariance.npy"), covariances)
+        self._save_state(version_path, state)
+        self._publish(DATASET_NAME, version_path, {"symbols": symbols, "span": span})
+
+    def extend(self, dates, covariances, state) -> None:
+        """
+        Append the covariance matrices of weeks after the last stored week as a new version.
+
+        Parameters:
+            dates (np.ndarray): Unix timestamps of the new weeks.
+            covariances (np.ndarray): Week x upper-triangle array of the new packed matrices.
+            state (EwmaCovarianceState): EWMA state after the last new week.
+        """
+        manifest = self._read_manifest(DATASET_NAME)
+        stored_dates, stored = self._load_matrices(manifest)
+        if len(dates) and len(stored_dates) and dates[0] <= stored_dates[-1]:
+            raise MatrixStoreError("New weeks overlap the stored covariance matrices")
+
+        version_path = self._create_version(DATASET_NAME)
+        all_dates = np.concatenate([stored_dates, np.asarray(dates, np.int64)])
+        np.save(os.path.join(version_path, "dates.npy"), all_dates)
+        extended = np.lib.format.open_memmap(
+            os.path.join(version_path, "covariance.npy"),
+            mode="w+",
+            dtype=np.float32,
+            shape=(len(all_dates), stored.shape[1]),
+        )
+        extended[: len(stored_dates)] = stored
+        extended[len(stored_dates) :] = covariances
+        extended.flush()
+        del extended
+        self._save_state(version_path, state)
+        self._publish(
+            DATASET_NAME,
+            version_path,
+            {"symbols": manifest["symbols"], "span": manifest["span"]},
+        )
+
+    def get_matrix(self, unix_date_time, kind="covariance"):
+        """
+        Returns the matrix of the last sampled week at or before a date.
+
+        Parameters:
+            unix_date_time (int): The unix timestamp of the requested date.
+            kind (str): Either 'covariance' or 'correlation'.
+
+        Returns:
+            tuple: Unix timestamp of the sampled week, list of symbols and the full matrix.
+        """
+        manifest = self._read_manifest(DATASET_NAME)
+        dates, covariances = self._load_matrices(manifest)
+        position = np.searchsorted(dates, unix_date_time, side="right") - 1
+        if position < 0:
+            raise MatrixNotFoundError(
+                f"No covariance matrix at or before {unix_date_time}"
+            )
+        matrix = from_upper_triangle(covariances[position], len(manifest["symbols"]))
+        if kind == "correlation":
+            matrix = covariance_to_correlation(matrix)
+        return int(dates[position]), manifest["symbols"], matrix
+
+    def symbols(self):
+        """
+        Returns the symbols of the stored matrices, or None when nothing is stored yet.
+
+        Returns:
+            list or None: Symbols of the matrix rows and columns.
+        """
+        try:
+            return self._read_manifest(DATASET_NAME)["symbols"]
+        except MatrixNotFoundError:
+            return None
+
+    def span(self):
+        """
+        Returns the EWMA span of the stored matrices, or None when nothing is stored yet.
+
+        Returns:
+            int or None: Span of the EWMA in weeks.
+        """
+        try:
+            return self._read_manifest(DATASET_NAME)["span"]
+        except MatrixNotFoundError:
+            return None
+
+    def last_date(self):
+        """
+        Returns the last stored week, or None when nothing is stored yet.
+
+        Returns:
+            int or None: Unix timestamp of the last sampled week.
+        """
+        try:
+            dates, _ = self._load_matrices(self._read_manifest(DATASET_NAME))
+        except MatrixNotFoundError:
+            return None
+        return int(dates[-1]) if len(dates) else None
+
+    def load_state(self):
+        """
+        Returns the EWMA state after the last stored week.
+
+        Returns:
+            EwmaCovarianceState: State to continue the recursion from.
+        """
+        manifest = self._read_manifest(DATASET_NAME)
+        version_path = self._version_path(DATASET_NAME, manifest["version"])
+        with np.load(os.path.join(version_path, "state.npz")) as state:
+            return EwmaCovarianceState(
+                state["weighted_products"], state["weights"], state["last_prices"]
+            )
+
+    def _load_matrices(self, manifest):
+        version_path = self._version_path(DATASET_NAME, manifest["version"])
+        dates = np.load(os.path.join(version_path, "dates.npy"), mmap_mode="r")
+        covariances = np.load(
+            os.path.join(version_path, "covariance.npy"), mmap_mode="r"
+        )
+        return dates, covariances
+
+    @staticmethod
+    def _save_state(version_path, state):
+        np.savez(
+            os.path.join(version_path, "state.npz"),
+            weighted_products=state.weighted_products,
+            weights=state.weights,
+            last_prices=state.last_prices,
+        )
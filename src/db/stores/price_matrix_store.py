@@ -0,0 +1,212 @@
+"""
+This module provides a file-based store of aligned date x symbol price matrices.
+
+Each table is written as `.npy` files plus a date and symbol index into a versioned
+directory. Readers open the matrices with `np.load(mmap_mode="r")`, so opening the full
+panel does not read it into memory and the pages are shared between worker processes
+through the operating system page cache.
+
+Layout::
+
+    <base_path>/<table_name>/current.json       manifest with the version, symbols and columns
+    <base_path>/<table_name>/<version>/dates.npy
+    <base_path>/<table_name>/<version>/<column>.npy
+"""
+
+import os
+
+import numpy as np
+
+from src.db.errors import MatrixNotFoundError, MatrixStoreError
+from src.db.stores.versioned_store import VersionedStore
+from src.monitoring.metrics import CACHE_REQUESTS
+
+
+class PriceMatrix:
+    """
+    Read-only view of one aligned date x symbol matrix.
+    """
+
+    def __init__(self, values, dates, symbols):
+        """
+        Initialize the PriceMatrix.
+
+        Parameters:
+            values (np.ndarray): Memory-mapped float64 matrix with one row per date and one column per symbol.
+            dates (np.ndarray): Sorted unix timestamps of the matrix rows.
+            symbols (list): Symbols of the matrix columns.
+        """
+        self.values = values
+        self.dates = dates
+        self.symbols = symbols
+        self._symbol_positions = {symbol: i for i, symbol in enumerate(symbols)}
+
+    def series(self, symbol):
+        """
+        Returns the column of a symbol as a view into the memory-mapped matrix.
+
+        Parameters:
+            symbol (str): The instrument symbol.
+
+        Returns:
+            np.ndarray: Values of the symbol for every date, NaN where there is no price.
+        """
+        if symbol not in self._symbol_positions:
+            raise MatrixNotFoundError(f"Symbol {symbol} is not part of the matrix")
+        return self.values[:, self._symbol_positions[symbol]]
+
+    def row(self, unix_date_time):
+        """
+        Returns the values of all symbols on a given date.
+
+        Parameters:
+            unix_date_time (int): The unix timestamp of the date.
+
+        Returns:
+            np.ndarray: Values of every symbol on the date.
+        """
+        position = np.searchsorted(self.dates, unix_date_time)
+        if position == len(self.dates) or self.dates[position] != unix_date_time:
+            raise MatrixNotFoundError(
+                f"Date {unix_date_time} is not part of the matrix"
+            )
+        return self.values[position]
+
+
+class PriceMatrixStore(VersionedStore):
+    """
+    Writes, extends and memory-maps aligned price matrices stored on disk.
+    """
+
+    def __init__(self, base_path):
+        """
+        Initialize the PriceMatrixStore with the directory holding the matrices.
+
+        Parameters:
+            base_path (str): Root directory of the store.
+        """
+        super().__init__(base_path)
+        self._cache = {}
+
+    def write(self, table_name, dates, symbols, matrices) -> None:
+        """
+        Write a complete set of matrices for a table as a new version.
+
+        Parameters:
+            table_name (str): Name of the source database table.
+            dates (np.ndarray): Sorted unix timestamps of the matrix rows.
+            symbols (list): Symbols of the matrix columns.
+            matrices (dict): Mapping of value column names to date x symbol matrices.
+        """
+        version_path = self._create_version(table_name)
+        np.save(os.path.join(version_path, "dates.npy"), np.asarray(dates, np.int64))
+        for column, matrix in matrices.items():
+            np.save(
+                os.path.join(version_path, f"{column}.npy"),
+                np.asarray(matrix, np.float64),
+            )
+        self._publish(
+            table_name, version_path, {"symbols": symbols, "columns": list(matrices)}
+        )
+
+    def extend(self, table_name, dates, matrices) -> None:
+        """
+        Append rows for dates after the last stored date as a new version.
+        The existing rows are copied file to file, so nothing has to be reloaded from the database.
+
+        Parameters:
+            table_name (str): Name of the source database table.
+            dates (np.ndarray): Sorted unix timestamps of the new rows, all after the last stored date.
+            matrices (dict): Mapping of value column names to matrices aligned with the stored symbols.
+        """
+        manifest = self._read_manifest(table_name)
+        stored_dates = self._load_dates(table_name, manifest)
+        if len(dates) and len(stored_dates) and dates[0] <= stored_dates[-1]:
+            raise MatrixStoreError(f"New rows of {table_name} overlap the stored dates")
+
+        version_path = self._create_version(table_name)
+        all_dates = np.concatenate([stored_dates, np.asarray(dates, np.int64)])
+        np.save(os.path.join(version_path, "dates.npy"), all_dates)
+        for column in manifest["columns"]:
+            stored = self.open(table_name, column).values
+            extended = np.lib.format.open_memmap(
+                os.path.join(version_path, f"{column}.npy"),
+                mode="w+",
+                dtype=np.float64,
+                shape=(len(all_dates), len(manifest["symbols"])),
+            )
+            extended[: len(stored_dates)] = stored
+            extended[len(stored_dates) :] = matrices[column]
+            extended.flush()
+            del extended
+        self._publish(
+            table_name,
+            version_path,
+            {"symbols": manifest["symbols"], "columns": manifest["columns"]},
+        )
+
+    def open(self, table_name, column) -> PriceMatrix:
+        """
+        Memory-map the published matrix of a table column.
+
+        Parameters:
+            table_name (str): Name of the source database table.
+            column (str): Name of the value column.
+
+        Returns:
+            PriceMatrix: Read-only view of the matrix.
+        """
+        manifest = self._read_manifest(table_name)
+        if column not in manifest["columns"]:
+            raise MatrixNotFoundError(f"No matrix stored for {table_name}.{column}")
+        key = (table_name, column, manifest["version"])
+        CACHE_REQUESTS.inc(
+            cache="price_matrix", result="hit" if key in self._cache else "miss"
+        )
+        if key not in self._cache:
+            self._cache = {
+                cached_key: matrix
+                for cached_key, matrix in self._cache.items()
+                if cached_key[:2] != key[:2]
+            }
+            version_path = self._version_path(table_name, manifest["version"])
+            values = np.load(os.path.join(version_path, f"{column}.npy"), mmap_mode="r")
+            self._cache[key] = PriceMatrix(
+                values, self._load_dates(table_name, manifest), manifest["symbols"]
+            )
+        return self._cache[key]
+
+    def symbols(self, table_name):
+        """
+        Returns the symbols of the published matrices of a table.
+
+        Parameters:
+            table_name (str): Name of the source database table.
+
+        Returns:
+            list: Symbols of the matrix columns.
+        """
+        return self._read_manifest(table_name)["symbols"]
+
+    def last_date(self, table_name):
+        """
+        Returns the last stored date of a table, or None when nothing is stored yet.
+
+        Parameters:
+            table_name (str): Name of the source database table.
+
+        Returns:
+            int or None: Unix timestamp of the last matrix row.
+        """
+        try:
+            dates = self._load_dates(table_name, self._read_manifest(table_name))
+        except MatrixNotFoundError:
+            return None
+        return int(dates[-1]) if len(dates) else None
+
+    def _load_dates(self, table_name, manifest):
+        version_path = self._version_path(table_name, manifest["version"])
+        return np.load(os.path.join(version_path, "dates.npy"), mmap_mode="r")
+
+    def _version_path(self, table_name, version):
+        return os.path.join(self.base_path, table_name, f"v{version}")
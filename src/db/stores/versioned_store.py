@@ -0,0 +1,68 @@
+"""
+This module provides the base class of the file stores that publish immutable versions.
+
+A store keeps one directory per dataset. Every write goes to a new version directory and
+becomes visible by atomically replacing the dataset manifest, so readers never see a
+partially written version and memory maps of the previous version stay valid.
+"""
+
+import json
+import logging
+import os
+import shutil
+
+from src.db.errors import MatrixNotFoundError
+
+# Setting up the logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "current.json"
+
+
+class VersionedStore:
+    """
+    Base class for file stores that publish versions through an atomically replaced manifest.
+    """
+
+    def __init__(self, base_path):
+        """
+        Initialize the store with the directory holding its datasets.
+
+        Parameters:
+            base_path (str): Root directory of the store.
+        """
+        self.base_path = base_path
+
+    def _create_version(self, name):
+        os.makedirs(os.path.join(self.base_path, name), exist_ok=True)
+        try:
+            version = self._read_manifest(name)["version"] + 1
+        except MatrixNotFoundError:
+            version = 1
+        version_path = self._version_path(name, version)
+        shutil.rmtree(version_path, ignore_errors=True)
+        os.makedirs(version_path)
+        return version_path
+
+    def _publish(self, name, version_path, manifest_fields):
+        version = int(os.path.basename(version_path)[1:])
+        manifest_path = os.path.join(self.base_path, name, MANIFEST_FILE)
+        with open(manifest_path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump({"version": version, **manifest_fields}, file)
+        # Readers either see the old or the new manifest, never a partial one
+        os.replace(manifest_path + ".tmp", manifest_path)
+        # The previous version is kept for readers that loaded the old manifest
+        shutil.rmtree(self._version_path(name, version - 2), ignore_errors=True)
+        logger.info("Published version %d of %s.", version, name)
+
+    def _read_manifest(self, name):
+        manifest_path = os.path.join(self.base_path, name, MANIFEST_FILE)
+        try:
+            with open(manifest_path, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError as exc:
+            raise MatrixNotFoundError(f"Nothing stored for {name}") from exc
+
+    def _version_path(self, name, version):
+        return os.path.join(self.base_path, name, f"v{version}")
@@ -0,0 +1,95 @@
+"""
+Carry Forecast module.
+
+This module computes carry forecasts for all instruments at once from the price and carry
+series of 'multiple_prices'. The annualised carry is the price difference between the
+priced and the carry contract divided by their distance in years. It is normalised by the
+annualised EWMA volatility of adjusted prices, the same volatility the analytics stage
+stores in 'daily_volatility', smoothed, scaled and capped, following the pysystemtrade
+carry rule.
+"""
+
+import logging
+
+import numpy as np
+
+from src.data_processing.errors import CarryComputationError
+from src.data_processing.returns_helper import compute_returns, compute_volatility
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BUSINESS_DAYS_IN_YEAR = 256
+
+
+def contract_months(contract_ids):
+    """
+    Converts pysystemtrade contract ids (YYYYMMDD, usually with DD = 00) to an absolute month count.
+
+    Parameters:
+        contract_ids (pd.Series): Contract ids as numbers.
+
+    Returns:
+        pd.Series: Number of months since year zero for every contract id.
+    """
+    contract_ids = contract_ids.astype("float64")
+    return (contract_ids // 10000) * 12 + (contract_ids // 100) % 100
+
+
+def compute_carry_forecast(
+    data_frame, vol_window, vol_span, smooth_span, forecast_scalar, forecast_cap
+):
+    """
+    Computes the carry forecast of every symbol in grouped vectorized passes.
+
+    Parameters:
+        data_frame (pd.DataFrame): DataFrame containing 'unix_date_time', 'symbol', 'price', 'carry',
+            'price_contract', 'carry_contract' and 'adjusted_price' columns.
+        vol_window (int): Window of the rolling volatility computed alongside the EWMA volatility.
+        vol_span (int): Span of the EWMA volatility of adjusted price returns.
+        smooth_span (int): Span of the EWMA that smooths the raw forecast.
+        forecast_scalar (float): Scalar bringing the smoothed forecast to the usual forecast range.
+        forecast_cap (float): Absolute cap of the scaled forecast.
+
+    Returns:
+        pd.DataFrame: DataFrame with 'unix_date_time', 'symbol', 'annualised_carry', 'raw_forecast'
+        and 'forecast' columns, sorted by symbol and time.
+    """
+    try:
+        frame = data_frame.sort_values(["symbol", "unix_date_time"], ignore_index=True)
+        years_between = (
+            contract_months(frame["carry_contract"])
+            - contract_months(frame["price_contract"])
+        ) / 12
+        annualised_carry = (frame["price"] - frame["carry"]) / years_between.replace(
+            0, np.nan
+        )
+
+        returns = compute_returns(
+            frame[["unix_date_time", "symbol", "adjusted_price"]].rename(
+                columns={"adjusted_price": "price"}
+            )
+        )
+        volatility = compute_volatility(returns, vol_window, vol_span)
+        # Returns start at the second row of each symbol, the first row gets no volatility
+        annualised_vol = frame[["unix_date_time", "symbol"]].merge(
+            volatility[["unix_date_time", "symbol", "ewma_vol"]], how="left"
+        )["ewma_vol"] * np.sqrt(BUSINESS_DAYS_IN_YEAR)
+
+        result = frame[["unix_date_time", "symbol"]].copy()
+        result["annualised_carry"] = annualised_carry
+        result["raw_forecast"] = annualised_carry / annualised_vol.replace(0, np.nan)
+        smoothed = (
+            result.groupby("symbol", sort=False)["raw_forecast"]
+            .ewm(span=smooth_span, adjust=False)
+            .mean()
+            .reset_index(level=0, drop=True)
+        )
+        result["forecast"] = (smoothed * forecast_scalar).clip(
+            -forecast_cap, forecast_cap
+        )
+        return result
+    except Exception as error:
+        logger.error("Error during carry forecast computation: %s", error)
+        raise CarryComputationError from error
@@ -0,0 +1,102 @@
+"""
+Module to handle the analytics stage that derives returns and volatility from seeded prices.
+"""
+
+import logging
+
+from src.core.config import settings
+from src.data_processing.data_frame_helper import replace_nan_with_none
+from src.data_processing.returns_helper import compute_returns, compute_volatility
+from src.db.repositories.data_inserter import DataInserter
+from src.db.repositories.data_loader import DataLoader
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Prices after the last computed day of each symbol, plus enough earlier rows to fill the rolling window
+TAIL_PRICES_SQL = """
+    WITH last_computed AS (
+        SELECT symbol, MAX(unix_date_time) AS last_time
+        FROM daily_volatility
+        GROUP BY symbol
+    ), lookback_start AS (
+        SELECT l.symbol, MIN(t.unix_date_time) AS start_time
+        FROM last_computed l
+        CROSS JOIN LATERAL (
+            SELECT a.unix_date_time
+            FROM adjusted_prices a
+            WHERE a.symbol = l.symbol AND a.unix_date_time <= l.last_time
+            ORDER BY a.unix_date_time DESC
+            LIMIT $1
+        ) t
+        GROUP BY l.symbol
+    )
+    SELECT p.unix_date_time, p.symbol, p.price
+    FROM adjusted_prices p
+    LEFT JOIN lookback_start s ON s.symbol = p.symbol
+    WHERE s.start_time IS NULL OR p.unix_date_time >= s.start_time
+    ORDER BY p.symbol, p.unix_date_time
+"""
+
+LAST_VOLATILITY_SQL = """
+    SELECT DISTINCT ON (symbol) symbol, unix_date_time, ewma_vol
+    FROM daily_volatility
+    ORDER BY symbol, unix_date_time DESC
+"""
+
+
+class AnalyticsHandler:
+    """
+    Computes daily returns and volatility for every symbol in 'adjusted_prices'
+    and appends them to the derived analytics tables.
+    """
+
+    def __init__(self, database_url):
+        """
+        Initialize the AnalyticsHandler with a database URL.
+
+        Parameters:
+            database_url (str): URL of the database to connect to.
+        """
+        self.database_url = database_url
+        self.window = settings.volatility_window
+        self.span = settings.volatility_ewma_span
+
+    async def compute_analytics_async(self) -> None:
+        """
+        Compute returns and volatility for the prices loaded since the last run.
+        Only the tail of each symbol after its last computed day is recomputed;
+        symbols that were never computed are processed from their first price.
+        """
+        loader = DataLoader(self.database_url)
+        prices = await loader.fetch_data_as_dataframe_async(
+            TAIL_PRICES_SQL, {"lookback": self.window + 1}
+        )
+        if prices.empty:
+            logger.info("No prices found for the analytics stage.")
+            return
+
+        seeds = await loader.fetch_data_as_dataframe_async(LAST_VOLATILITY_SQL, None)
+        returns = compute_returns(prices)
+        volatility = compute_volatility(returns, self.window, self.span, seeds)
+        if not seeds.empty:
+            last_time = returns["symbol"].map(
+                seeds.set_index("symbol")["unix_date_time"]
+            )
+            returns = returns[
+                last_time.isna() | (returns["unix_date_time"] > last_time)
+            ]
+
+        inserter = DataInserter(self.database_url)
+        await inserter.insert_dataframes_async(
+            {
+                "daily_returns": replace_nan_with_none(returns),
+                "daily_volatility": replace_nan_with_none(volatility),
+            }
+        )
+        logger.info(
+            "Analytics computed for %d new rows of %d symbols.",
+            len(volatility),
+            volatility["symbol"].nunique(),
+        )
@@ -3,12 +3,21 @@ Module to handle configuration data processing.
 """
 
 import logging
+import os
 
 from src.data_processing.csv_helper import save_to_csv
-from src.data_processing.data_frame_helper import fill_empty_values
+from src.data_processing.data_frame_helper import fill_empty_values, filter_symbols
 from src.data_processing.data_preprocessor import load_csv, rename_columns
-from src.db.schemas.schemas import get_configs_schemas
-from src.handlers.errors import ProcessingError
+from src.db.schemas.schemas import get_configs_schemas, select_schemas
+from src.handlers.errors import ProcessingError, SchemaProcessingError
+from src.jobs.errors import JobCancelledError
+from src.jobs.progress import (
+    check_cancelled,
+    report_file_done,
+    report_files_total,
+    schema_scope,
+)
+from src.monitoring.tracing import span
 
 # Initialize logger
 logging.basicConfig(level=logging.INFO)
@@ -26,21 +35,25 @@ class ConfigDataHandler:
     def __init__(self):
         self.schemas = get_configs_schemas()
 
-    def handle_data_processing(self) -> None:
+    def handle_data_processing(self, schemas=None, symbols=None) -> None:
         """
         Processes each configuration schema provided to the handler synchronously.
         This includes loading, transforming, and saving the data for each schema.
+
+        Parameters:
+        - schemas: Glob patterns of the table names to process, all schemas if empty.
+        - symbols: Glob patterns of the symbols to keep, all rows if empty.
         """
-        results = [self._process_config_schema(schema) for schema in self.schemas]
-        for schema, result in zip(self.schemas, results):
-            if isinstance(result, Exception):
-                logger.error(
-                    "Error processing data for schema %s: %s",
-                    schema.__class__.__name__,
-                    result,
-                )
+        failed = []
+        for schema in select_schemas(self.schemas, schemas):
+            try:
+                self.process_config_schema(schema, symbols)
+            except ProcessingError:
+                failed.append(schema.table_name)
+        if failed:
+            raise SchemaProcessingError(f"Processing failed for: {', '.join(failed)}")
 
-    def _process_config_schema(self, schema):
+    def process_config_schema(self, schema, symbols=None):
         """
         Processes a single configuration schema synchronously.
         This includes loading the data from the specified CSV file, transforming the data
@@ -50,18 +63,34 @@ class ConfigDataHandler:
 
         Parameters:
         - schema: The configuration schema detailing how the data should be processed.
+        - symbols: Glob patterns of the symbols to keep, all rows if empty.
         """
         try:
-            data = load_csv(schema.origin_csv_file_path)
-            renamed = rename_columns(data, schema.column_mapping)
-            filled = fill_empty_values(
-                renamed, fill_value=0
-            )  # Assuming you want to fill with 0
-            save_to_csv(filled, schema.file_path)
+            with schema_scope(schema.table_name):
+                check_cancelled()
+                report_files_total(1)
+                file_size = os.path.getsize(schema.origin_csv_file_path)
+                with span(
+                    "file", file=schema.origin_csv_file_path, bytes=file_size
+                ) as file_span:
+                    data = load_csv(
+                        schema.origin_csv_file_path, dtype=schema.plan.source_dtypes
+                    )
+                    renamed = filter_symbols(
+                        rename_columns(data, schema.column_mapping), symbols
+                    )
+                    filled = fill_empty_values(
+                        renamed, fill_value=0
+                    )  # Assuming you want to fill with 0
+                    save_to_csv(filled, schema.file_path)
+                    file_span.set_attributes(rows=len(filled))
+                report_file_done(len(filled), file_size)
             logger.info(
                 "Data processing completed for schema: %s", schema.__class__.__name__
             )
             return True
+        except JobCancelledError:
+            raise
         except Exception as error:  # More specific exceptions are advisable
             logger.error(
                 "Error processing data for schema %s: %s",
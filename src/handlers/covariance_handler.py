@@ -0,0 +1,82 @@
+"""
+Module to handle building the cache of weekly covariance and correlation matrices.
+"""
+
+import logging
+
+import numpy as np
+
+from src.core.config import settings
+from src.data_processing.covariance_helper import (
+    EwmaCovarianceState,
+    compute_ewma_covariances,
+    weekly_sample_prices,
+)
+from src.db.stores.covariance_store import CovarianceStore
+from src.db.stores.price_matrix_store import PriceMatrixStore
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class CovarianceHandler:
+    """
+    Computes EWMA covariance matrices of weekly returns over the aligned adjusted price panel.
+    """
+
+    def __init__(self):
+        self.price_store = PriceMatrixStore(settings.price_matrix_path)
+        self.store = CovarianceStore(settings.covariance_path)
+        self.span = settings.correlation_ewma_span
+
+    def build_covariances(self, rebuild=False) -> None:
+        """
+        Append the matrices of the weeks completed since the last build, or rebuild the
+        whole cache when requested, when nothing is stored yet, when the symbols changed or
+        when the configured span differs from the stored one.
+
+        Parameters:
+            rebuild (bool): Recompute the matrices of every week.
+        """
+        prices = self.price_store.open("adjusted_prices", "price")
+
+        last_date = self.store.last_date()
+        if not rebuild and last_date is not None:
+            if self.store.symbols() != prices.symbols:
+                logger.info("Symbols of the price panel changed, rebuilding.")
+            elif self.store.span() != self.span:
+                logger.info("EWMA span of the covariances changed, rebuilding.")
+            else:
+                # The last stored week is complete, later rows belong to new weeks only
+                start = np.searchsorted(prices.dates, last_date, side="right")
+                dates, weekly_prices = weekly_sample_prices(
+                    prices.dates[start:], prices.values[start:]
+                )
+                if len(dates) == 0:
+                    logger.info("No new complete weeks for the covariance cache.")
+                    return
+                covariances, state = compute_ewma_covariances(
+                    weekly_prices, self.span, self.store.load_state()
+                )
+                self.store.extend(dates, covariances, state)
+                return
+
+        dates, weekly_prices = weekly_sample_prices(prices.dates, prices.values)
+        covariances, state = compute_ewma_covariances(
+            weekly_prices, self.span, EwmaCovarianceState.empty(len(prices.symbols))
+        )
+        self.store.write(dates, prices.symbols, covariances, state, self.span)
+
+    def get_matrix(self, unix_date_time, kind):
+        """
+        Returns the cached matrix of the last sampled week at or before a date.
+
+        Parameters:
+            unix_date_time (int): The unix timestamp of the requested date.
+            kind (str): Either 'covariance' or 'correlation'.
+
+        Returns:
+            tuple: Unix timestamp of the sampled week, list of symbols and the full matrix.
+        """
+        return self.store.get_matrix(unix_date_time, kind)
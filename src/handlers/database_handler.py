@@ -4,9 +4,17 @@ Module to handle database operations like table initialization and reset.
 
 import logging
 
+from src.core.config import settings
 from src.db.repositories.table_creator import TableCreator
 from src.db.repositories.table_dropper import TableDropper
-from src.db.schemas.schemas import get_schemas
+from src.db.schemas.packed_series import packed_sql_command, uses_packed_series
+from src.db.schemas.schemas import (
+    get_analytics_schemas,
+    get_forecast_schemas,
+    get_schemas,
+    get_view_schemas,
+)
+from src.db.schemas.symbol_dimension import SYMBOLS_SQL_COMMAND, table_sql_command
 from src.handlers.errors import DatabaseError
 
 # Initialize logger
@@ -20,8 +28,10 @@ class DatabaseHandler:
     """
 
     def __init__(self, conn):
-        """Initialize the handler with schemas fetched from get_schemas."""
-        self.config_schemas = get_schemas()
+        """Initialize the handler with the seeded, analytics and forecast schemas."""
+        self.config_schemas = (
+            get_schemas() + get_analytics_schemas() + get_forecast_schemas()
+        )
         self.connection = conn
 
     async def init_tables_async(self) -> None:
@@ -29,13 +39,23 @@ class DatabaseHandler:
         Initialize tables in the database using the SQL commands defined in the schemas.
         """
         creator = TableCreator(self.connection)
-        for schema in self.config_schemas:
+        sql_commands = [table_sql_command(schema) for schema in self.config_schemas]
+        if settings.compact_symbols:
+            sql_commands.insert(0, SYMBOLS_SQL_COMMAND)
+        sql_commands += [
+            packed_sql_command(schema)
+            for schema in self.config_schemas
+            if uses_packed_series(schema.table_name)
+        ]
+        # Views read the tables, they are created last
+        sql_commands += [view.sql_command for view in get_view_schemas()]
+        for sql_command in sql_commands:
             try:
-                await creator.create_table_async(schema.sql_command)
+                await creator.create_table_async(sql_command)
             except DatabaseError as db_error:  # Catching a more specific exception
                 logger.error(
                     "Database error while creating table with SQL command %s: %s",
-                    schema.sql_command,
+                    sql_command,
                     db_error,
                 )
 
@@ -9,3 +9,15 @@ class DatabaseError(Exception):
 
 class ProcessingError(Exception):
     """An error occurred while processing the data."""
+
+
+class SchemaProcessingError(Exception):
+    """One or more schemas failed to be processed or seeded."""
+
+
+class UnknownSchemaError(Exception):
+    """No schema is defined for the requested table."""
+
+
+class InvalidUploadError(Exception):
+    """An uploaded file cannot be loaded into the requested table."""
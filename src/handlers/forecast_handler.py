@@ -0,0 +1,65 @@
+"""
+Module to handle the forecast stage that computes trading rule forecasts from seeded prices.
+"""
+
+import logging
+
+from src.core.config import settings
+from src.data_processing.data_frame_helper import replace_nan_with_none
+from src.db.repositories.data_inserter import DataInserter
+from src.db.repositories.data_loader import DataLoader
+from src.forecast.carry_forecast import compute_carry_forecast
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CARRY_INPUTS_SQL = """
+    SELECT m.unix_date_time, m.symbol, m.price, m.carry,
+           m.price_contract, m.carry_contract, a.price AS adjusted_price
+    FROM multiple_prices m
+    JOIN adjusted_prices a
+        ON a.unix_date_time = m.unix_date_time AND a.symbol = m.symbol
+"""
+
+
+class ForecastHandler:
+    """
+    Computes forecasts for the whole instrument universe and stores them in the forecast tables.
+    """
+
+    def __init__(self, database_url):
+        """
+        Initialize the ForecastHandler with a database URL.
+
+        Parameters:
+            database_url (str): URL of the database to connect to.
+        """
+        self.database_url = database_url
+
+    async def compute_carry_forecasts_async(self) -> None:
+        """
+        Compute the carry forecast of every symbol in a single vectorized pass
+        and replace the content of the 'carry_forecasts' table with it.
+        """
+        loader = DataLoader(self.database_url)
+        inputs = await loader.fetch_data_as_dataframe_async(CARRY_INPUTS_SQL, None)
+        if inputs.empty:
+            logger.info("No multiple prices found for the carry forecast.")
+            return
+
+        forecasts = compute_carry_forecast(
+            inputs,
+            vol_window=settings.volatility_window,
+            vol_span=settings.volatility_ewma_span,
+            smooth_span=settings.carry_smooth_span,
+            forecast_scalar=settings.carry_forecast_scalar,
+            forecast_cap=settings.forecast_cap,
+        )
+        inserter = DataInserter(self.database_url)
+        await inserter.replace_dataframe_async(
+            replace_nan_with_none(forecasts), "carry_forecasts"
+        )
+        logger.info(
+            "Carry forecasts computed for %d symbols.", forecasts["symbol"].nunique()
+        )
@@ -0,0 +1,61 @@
+"""
+Module to handle reading the full history of a symbol from the array-packed raw data tables.
+"""
+
+import logging
+
+from src.db.repositories.packed_series_repository import PackedSeriesRepository
+from src.db.schemas.packed_series import uses_packed_series
+from src.db.schemas.schemas import get_raw_data_schemas
+from src.handlers.errors import UnknownSchemaError
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class PackedSeriesHandler:
+    """
+    Serves the history of a symbol from the packed companion of a raw data table.
+    """
+
+    def __init__(self, database_url):
+        """
+        Initialize the PackedSeriesHandler with a database URL.
+
+        Parameters:
+            database_url (str): URL of the database to connect to.
+        """
+        self.raw_data_schemas = {
+            schema.table_name: schema for schema in get_raw_data_schemas()
+        }
+        self.repository = PackedSeriesRepository(database_url)
+
+    async def read_series_async(self, table_name, symbol, columns=None) -> dict:
+        """
+        Read the full history of a symbol as one list per column, in time order.
+        Missing values are returned as None.
+
+        Parameters:
+            table_name (str): Name of the raw data table.
+            symbol (str): The symbol.
+            columns (list, optional): Value columns to read, all by default.
+
+        Returns:
+            dict: Mapping of 'unix_date_time' and every read column to its values.
+        """
+        if not uses_packed_series(table_name):
+            raise UnknownSchemaError(f"No packed table is defined for {table_name}")
+        series = await self.repository.read_async(
+            self.raw_data_schemas[table_name], symbol, columns
+        )
+        return {name: _to_list(values) for name, values in series.items()}
+
+
+def _to_list(values):
+    # Deferred like in the application, NumPy is not needed to start it
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if values.dtype.kind == "f":
+        values = np.where(np.isnan(values), None, values)
+    return values.tolist()
@@ -0,0 +1,74 @@
+"""
+Module to handle building the memory-mapped price matrix store from the seeded tables.
+"""
+
+import logging
+
+from src.core.config import settings
+from src.data_processing.matrix_helper import pivot_to_matrices
+from src.db.repositories.data_loader import DataLoader
+from src.db.schemas.schemas import get_raw_data_schemas
+from src.db.stores.price_matrix_store import PriceMatrixStore
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class PriceMatrixHandler:
+    """
+    Materialises aligned date x symbol matrices for every raw data schema with matrix columns.
+    """
+
+    def __init__(self, database_url):
+        """
+        Initialize the PriceMatrixHandler with a database URL.
+
+        Parameters:
+            database_url (str): URL of the database to connect to.
+        """
+        self.schemas = [
+            schema for schema in get_raw_data_schemas() if schema.matrix_columns
+        ]
+        self.database_url = database_url
+        self.store = PriceMatrixStore(settings.price_matrix_path)
+
+    async def build_matrices_async(self, rebuild=False) -> None:
+        """
+        Extend the stored matrices with rows loaded since the last build, or rebuild them
+        from scratch when requested, when nothing is stored yet or when new symbols appeared.
+
+        Parameters:
+            rebuild (bool): Rebuild every matrix from the full table.
+        """
+        for schema in self.schemas:
+            last_date = None if rebuild else self.store.last_date(schema.table_name)
+            rows = await self._load_rows_async(schema, last_date)
+            if rows.empty:
+                logger.info("No new rows for %s price matrices.", schema.table_name)
+                continue
+
+            if last_date is not None:
+                stored_symbols = self.store.symbols(schema.table_name)
+                if set(rows["symbol"].unique()) <= set(stored_symbols):
+                    dates, _, matrices = pivot_to_matrices(
+                        rows, schema.matrix_columns, stored_symbols
+                    )
+                    self.store.extend(schema.table_name, dates, matrices)
+                    continue
+                logger.info("New symbols in %s, rebuilding.", schema.table_name)
+                rows = await self._load_rows_async(schema, None)
+
+            dates, symbols, matrices = pivot_to_matrices(rows, schema.matrix_columns)
+            self.store.write(schema.table_name, dates, symbols, matrices)
+
+    async def _load_rows_async(self, schema, after):
+        columns = ", ".join(["unix_date_time", "symbol"] + schema.matrix_columns)
+        loader = DataLoader(self.database_url)
+        sql = f"SELECT {columns} FROM {schema.table_name}"
+        # A full build must not filter, bars before 1970 have negative unix times
+        if after is None:
+            return await loader.fetch_data_as_dataframe_async(sql, {})
+        return await loader.fetch_data_as_dataframe_async(
+            f"{sql} WHERE unix_date_time > $1", {"after": after}
+        )
@@ -8,8 +8,13 @@ from src.data_processing.data_preprocessor import (
     process_all_csv_in_directory,
     save_concatenated_dataframes,
 )
-from src.db.schemas.schemas import get_raw_data_schemas
-from src.handlers.errors import ProcessingError
+from src.db.schemas.schemas import (
+    get_raw_data_schemas,
+    get_rollup_schemas,
+    select_schemas,
+)
+from src.handlers.errors import ProcessingError, SchemaProcessingError
+from src.jobs.progress import schema_scope
 
 # Initialize logger
 logging.basicConfig(level=logging.INFO)
@@ -24,18 +29,45 @@ class RawDataHandler:
     def __init__(self):
         self.schemas = get_raw_data_schemas()
 
-    def handle_data_processing(self) -> None:
+    def handle_data_processing(self, schemas=None, symbols=None) -> None:
         """
         Processes each configuration schema provided to the handler synchronously.
         This includes loading, transforming, and saving the data for each schema.
+
+        Parameters:
+        - schemas: Glob patterns of the table names to process, all schemas if empty.
+        - symbols: Glob patterns of the symbols to process, all files if empty.
+        """
+        failed = []
+        for schema in select_schemas(self.schemas, schemas):
+            try:
+                self.process_raw_data_schema(schema, symbols)
+            except ProcessingError:
+                failed.append(schema.table_name)
+        if failed:
+            raise SchemaProcessingError(f"Processing failed for: {', '.join(failed)}")
+
+    def process_raw_data_schema(self, schema, symbols=None):
         """
-        for schema in self.schemas:
-            self._process_raw_data_schema(schema)
+        Processes all raw data files of a schema and saves them, with their rollups, as temporary files.
 
-    def _process_raw_data_schema(self, schema):
+        Parameters:
+        - schema: The raw data schema detailing how the data should be processed.
+        - symbols: Glob patterns of the symbols to process, all files if empty.
+        """
+        with schema_scope(schema.table_name):
+            self._process_raw_data_schema(schema, symbols)
+
+    def _process_raw_data_schema(self, schema, symbols):
         try:
+            rollup_schemas = get_rollup_schemas(schema)
+            rollups = {rollup.resolution: [] for rollup in rollup_schemas}
             processed_dataframes = process_all_csv_in_directory(
-                schema.origin_csv_file_path, schema.column_mapping
+                schema.origin_csv_file_path,
+                schema.column_mapping,
+                rollups,
+                symbols,
+                schema.plan.source_dtypes,
             )
             if processed_dataframes:
                 save_concatenated_dataframes(processed_dataframes, schema.file_path)
@@ -43,21 +75,25 @@ class RawDataHandler:
                 logger.error(
                     "No valid data to save for schema: %s", schema.__class__.__name__
                 )
-        except FileNotFoundError:
+            for rollup in rollup_schemas:
+                if rollups[rollup.resolution]:
+                    save_concatenated_dataframes(
+                        rollups[rollup.resolution], rollup.file_path
+                    )
+        except FileNotFoundError as error:
             logger.error(
                 "File not found while processing schema: %s", schema.__class__.__name__
             )
-        except KeyError:
+            raise ProcessingError from error
+        except KeyError as error:
             logger.error(
                 "KeyError occurred while processing schema: %s",
                 schema.__class__.__name__,
             )
-        except ValueError:
+            raise ProcessingError from error
+        except ValueError as error:
             logger.error(
                 "ValueError occurred while processing schema: %s",
                 schema.__class__.__name__,
             )
-        except ProcessingError as error:  # Keeping a general Exception as a last resort
-            logger.error(
-                "An unidentified error occurred while processing the schema: %s", error
-            )
+            raise ProcessingError from error
@@ -0,0 +1,195 @@
+"""
+Module to handle a complete rebuild of the database as one dependency graph.
+"""
+
+import asyncio
+import logging
+
+from src.core.config import settings
+from src.db.repositories.table_creator import TableCreator
+from src.db.schemas.packed_series import (
+    packed_sql_command,
+    packed_table_name,
+    uses_packed_series,
+)
+from src.db.schemas.schemas import (
+    get_analytics_schemas,
+    get_forecast_schemas,
+    get_rollup_schemas,
+    get_view_schemas,
+    select_schemas,
+)
+from src.db.schemas.symbol_dimension import (
+    SYMBOLS_SQL_COMMAND,
+    SYMBOLS_TABLE,
+    table_sql_command,
+    uses_symbol_ids,
+)
+from src.handlers.config_data_handler import ConfigDataHandler
+from src.handlers.database_handler import DatabaseHandler
+from src.handlers.raw_data_handler import RawDataHandler
+from src.handlers.seed_db_handler import SeedDBHandler
+from src.jobs.dag import Dag
+from src.monitoring.profiling import to_thread
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class RebuildHandler:
+    """
+    Resets, creates, parses and seeds every table in one run. Parsing does not depend on the
+    database and starts right away, and each table is seeded as soon as its own file is
+    parsed and its table is created, so the rebuild takes about as long as the slowest table.
+    """
+
+    def __init__(self, database_url):
+        """
+        Initialize the RebuildHandler with a database URL.
+
+        Parameters:
+            database_url (str): URL of the database to connect to.
+        """
+        self.database_url = database_url
+        self.config_handler = ConfigDataHandler()
+        self.raw_data_handler = RawDataHandler()
+        self.database_handler = DatabaseHandler(database_url)
+        self.seed_handler = SeedDBHandler(database_url)
+
+    async def rebuild_async(self, schemas=None, symbols=None) -> dict:
+        """
+        Run the rebuild graph.
+
+        Parameters:
+            schemas (list, optional): Glob patterns of the table names to rebuild, all schemas if empty.
+            symbols (list, optional): Glob patterns of the symbols to rebuild, all symbols if empty.
+
+        Returns:
+            dict: Duration in seconds of every task of the graph.
+        """
+        dag = self.build_dag(schemas, symbols)
+        await dag.run_async()
+        return dag.durations
+
+    def build_dag(self, schemas=None, symbols=None) -> Dag:
+        """
+        Builds the rebuild graph:
+
+        - 'reset' drops every table,
+        - 'ddl:<table>' creates a table after the reset, raw data tables stored with symbol
+          ids after 'ddl:symbols',
+        - 'parse:<table>' parses the files of a config or raw data schema, independent of the database,
+        - 'seed:<table>' copies a parsed file once its table exists.
+
+        With schema or symbol filters the tables are kept: only the selected schemas are
+        parsed and the rows of the selected symbols replaced.
+
+        Parameters:
+            schemas (list, optional): Glob patterns of the table names to rebuild, all schemas if empty.
+            symbols (list, optional): Glob patterns of the symbols to rebuild, all symbols if empty.
+
+        Returns:
+            Dag: The rebuild graph.
+        """
+        dag = Dag()
+        partial = bool(schemas or symbols)
+        seeded = select_schemas(self.seed_handler.schemas, schemas)
+        rollup_sources = {
+            rollup.table_name: rollup.source_schema.table_name
+            for rollup in get_rollup_schemas()
+        }
+        sources = {
+            schema.table_name: rollup_sources.get(schema.table_name, schema.table_name)
+            for schema in seeded
+        }
+
+        views = [
+            view
+            for view in get_view_schemas()
+            if view.source_schema.table_name in sources
+        ]
+
+        # Parsing is CPU bound and runs in threads, bounded to keep memory in check
+        parse_slots = asyncio.Semaphore(settings.max_parallel_parses)
+        for handler, parse in (
+            (self.config_handler, self.config_handler.process_config_schema),
+            (self.raw_data_handler, self.raw_data_handler.process_raw_data_schema),
+        ):
+            for schema in handler.schemas:
+                if schema.table_name in sources.values():
+                    dag.add(
+                        f"parse:{schema.table_name}",
+                        self._in_thread(parse_slots, parse, schema, symbols),
+                    )
+
+        if not partial:
+            dag.add("reset", self.database_handler.reset_tables_async)
+            if settings.compact_symbols:
+                dag.add(
+                    f"ddl:{SYMBOLS_TABLE}",
+                    self._execute_ddl(SYMBOLS_SQL_COMMAND),
+                    depends_on=["reset"],
+                )
+            for schema in seeded + get_analytics_schemas() + get_forecast_schemas():
+                depends_on = ["reset"]
+                if uses_symbol_ids(schema.table_name):
+                    depends_on.append(f"ddl:{SYMBOLS_TABLE}")
+                dag.add(
+                    f"ddl:{schema.table_name}",
+                    self._execute_ddl(table_sql_command(schema)),
+                    depends_on=depends_on,
+                )
+                if uses_packed_series(schema.table_name):
+                    dag.add(
+                        f"ddl:{packed_table_name(schema.table_name)}",
+                        self._execute_ddl(packed_sql_command(schema)),
+                        depends_on=["reset"],
+                    )
+            for view in views:
+                dag.add(
+                    f"ddl:{view.view_name}",
+                    self._execute_ddl(view.sql_command),
+                    depends_on=[f"ddl:{view.source_schema.table_name}"],
+                )
+
+        for schema in seeded:
+            depends_on = [f"parse:{sources[schema.table_name]}"]
+            if not partial:
+                depends_on.append(f"ddl:{schema.table_name}")
+                # Seeding refreshes the views of the table
+                depends_on += [
+                    f"ddl:{view.view_name}"
+                    for view in views
+                    if view.source_schema.table_name == schema.table_name
+                ]
+                if uses_packed_series(schema.table_name):
+                    depends_on.append(f"ddl:{packed_table_name(schema.table_name)}")
+            dag.add(
+                f"seed:{schema.table_name}",
+                self._seed(schema, symbols),
+                depends_on=depends_on,
+            )
+        return dag
+
+    @staticmethod
+    def _in_thread(slots, function, schema, symbols):
+        async def run():
+            async with slots:
+                await to_thread(function, schema, symbols)
+
+        return run
+
+    def _execute_ddl(self, sql_command):
+        async def run():
+            await TableCreator(self.database_url).create_table_async(sql_command)
+
+        return run
+
+    def _seed(self, schema, symbols):
+        async def run():
+            await self.seed_handler.load_csv_and_insert_data_to_db_async(
+                schema, symbols
+            )
+
+        return run
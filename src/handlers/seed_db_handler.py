@@ -5,10 +5,19 @@ This module contains the SeedDBHandler class, which is responsible for seeding t
 import asyncio
 import logging
 
+from src.core.config import settings
 from src.data_processing.csv_helper import load_csv
+from src.data_processing.data_frame_helper import filter_symbols, sort_rows
 from src.db.repositories.data_inserter import DataInserter
+from src.db.repositories.packed_series_repository import PackedSeriesRepository
+from src.db.repositories.table_maintainer import TableMaintainer
 from src.db.schemas.base_config_schema import BaseConfigSchema
-from src.db.schemas.schemas import get_schemas
+from src.db.schemas.packed_series import uses_packed_series
+from src.db.schemas.schemas import get_schemas, get_view_schemas, select_schemas
+from src.db.schemas.symbol_dimension import storage_columns, storage_plan
+from src.handlers.errors import SchemaProcessingError
+from src.jobs.progress import report_rows_total, schema_scope
+from src.monitoring.profiling import to_thread
 
 # Initialize logger
 logging.basicConfig(level=logging.INFO)
@@ -27,28 +36,71 @@ class SeedDBHandler:
         self.schemas = get_schemas()
         self.database_url = database_url
 
-    async def insert_data_from_csv_async(self):
+    async def insert_data_from_csv_async(self, schemas=None, symbols=None):
         """
         Asynchronously seed the database from CSV files using predefined schemas.
+        With a symbol filter only the rows of the matching symbols are replaced.
+
+        Parameters:
+            schemas (list, optional): Glob patterns of the table names to seed, all schemas if empty.
+            symbols (list, optional): Glob patterns of the symbols to replace, all rows if empty.
         """
+        selected = select_schemas(self.schemas, schemas)
         tasks = [
-            self._load_csv_and_insert_data_to_db_async(schema)
-            for schema in self.schemas
+            self.load_csv_and_insert_data_to_db_async(schema, symbols)
+            for schema in selected
         ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        for result in results:
+        failed = []
+        for schema, result in zip(selected, results):
             if isinstance(result, Exception):
                 logger.error("Error occurred while inserting data from CSV: %s", result)
+                failed.append(schema.table_name)
+        if failed:
+            raise SchemaProcessingError(f"Seeding failed for: {', '.join(failed)}")
 
-    async def _load_csv_and_insert_data_to_db_async(self, schema: BaseConfigSchema):
+    async def load_csv_and_insert_data_to_db_async(
+        self, schema: BaseConfigSchema, symbols=None
+    ):
         """
         Asynchronously load data from a CSV file and insert it into the database as specified by the schema.
+        With a symbol filter the stored rows of the matching symbols are replaced instead.
         """
         data_seeder = DataInserter(self.database_url)
         try:
-            data_frame = load_csv(schema.file_path)
-            await data_seeder.insert_dataframe_async(data_frame, schema.table_name)
+            with schema_scope(schema.table_name):
+                # Parse in a worker thread so the event loop keeps serving requests
+                data_frame = await to_thread(
+                    load_csv, schema.file_path, dtype=schema.plan.dtypes
+                )
+                if symbols:
+                    data_frame = filter_symbols(data_frame, symbols)
+                if settings.sort_before_copy and schema.sort_key:
+                    # Rows of a symbol are read together, store them on adjacent pages
+                    data_frame = await to_thread(sort_rows, data_frame, schema.sort_key)
+                report_rows_total(len(data_frame))
+                if symbols:
+                    await data_seeder.replace_symbols_async(
+                        data_frame, schema.table_name, symbols, storage_plan(schema)
+                    )
+                else:
+                    await data_seeder.insert_dataframe_async(
+                        data_frame, schema.table_name, storage_plan(schema)
+                    )
+                if uses_packed_series(schema.table_name):
+                    await PackedSeriesRepository(self.database_url).pack_async(
+                        schema, symbols, data_frame["symbol"].unique()
+                    )
+                await self.build_indexes_async(schema)
+                await self.finalize_table_async(schema)
+                await TableMaintainer(self.database_url).refresh_views_async(
+                    [
+                        view.refresh_command
+                        for view in get_view_schemas()
+                        if view.source_schema.table_name == schema.table_name
+                    ]
+                )
         except Exception as error:
             logger.error(
                 "Error occurred while processing the CSV file %s: %s",
@@ -56,3 +108,35 @@ class SeedDBHandler:
                 error,
             )
             raise error
+
+    async def build_indexes_async(self, schema: BaseConfigSchema):
+        """
+        Build the indexes a schema declares to be built after loading, at most
+        MAX_INDEX_BUILDS at the same time. Indexes that exist already are kept.
+        """
+        sql_commands = storage_plan(schema).load_index_commands(
+            settings.concurrent_index_builds
+        )
+        if sql_commands:
+            await TableMaintainer(self.database_url).build_indexes_async(
+                sql_commands, settings.max_index_builds
+            )
+
+    async def finalize_table_async(self, schema: BaseConfigSchema):
+        """
+        Finalise a seeded table as configured: set its fill factor, CLUSTER it by the index
+        leading with its sort key and refresh its planner statistics.
+        Tables without such an index are not clustered.
+        """
+        plan = storage_plan(schema)
+        cluster_index = None
+        if settings.cluster_after_seed:
+            cluster_index = plan.leading_index(storage_columns(schema, schema.sort_key))
+            if cluster_index is None:
+                logger.info("No index to cluster %s by, skipping.", plan.table_name)
+        await TableMaintainer(self.database_url).finalize_table_async(
+            plan.table_name,
+            cluster_index=cluster_index,
+            fillfactor=settings.table_fillfactor,
+            analyze=settings.analyze_after_seed,
+        )
@@ -0,0 +1,55 @@
+"""
+Module to handle reading the materialized snapshot views of the raw data tables.
+"""
+
+import logging
+
+from src.data_processing.data_frame_helper import filter_symbols, replace_nan_with_none
+from src.db.repositories.data_loader import DataLoader
+from src.db.schemas.schemas import get_view_schemas
+from src.handlers.errors import UnknownSchemaError
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class SnapshotHandler:
+    """
+    Serves the latest row and the summary statistics of every symbol from the materialized views.
+    """
+
+    def __init__(self, database_url):
+        """
+        Initialize the SnapshotHandler with a database URL.
+
+        Parameters:
+            database_url (str): URL of the database to connect to.
+        """
+        self.views = {view.view_name: view for view in get_view_schemas()}
+        self.database_url = database_url
+
+    async def read_snapshot_async(self, table_name, kind, symbols=None) -> list:
+        """
+        Read a snapshot view of a raw data table. The views hold one row per symbol, so
+        the read does not depend on the length of the stored history.
+
+        Parameters:
+            table_name (str): Name of the raw data table.
+            kind (str): 'latest' or 'summary'.
+            symbols (list, optional): Glob patterns of the symbols to return, all if empty.
+
+        Returns:
+            list: One dictionary per symbol, ordered by symbol.
+        """
+        view_name = f"{table_name}_{kind}"
+        if view_name not in self.views:
+            raise UnknownSchemaError(
+                f"No {kind} view is defined for table {table_name}"
+            )
+        rows = await DataLoader(self.database_url).fetch_data_as_dataframe_async(
+            f"SELECT * FROM {view_name} ORDER BY symbol", {}
+        )
+        if rows.empty:
+            return []
+        return replace_nan_with_none(filter_symbols(rows, symbols)).to_dict("records")
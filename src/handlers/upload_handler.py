@@ -0,0 +1,152 @@
+"""
+Module to handle CSV uploads that are streamed straight into the database.
+"""
+
+import logging
+
+from src.core.config import settings
+from src.data_processing.stream_processor import StreamTransformer, iter_csv_chunks
+from src.db.repositories.data_inserter import DataInserter
+from src.db.repositories.packed_series_repository import PackedSeriesRepository
+from src.db.repositories.table_maintainer import TableMaintainer
+from src.db.schemas.packed_series import uses_packed_series
+from src.db.schemas.schemas import (
+    get_configs_schemas,
+    get_raw_data_schemas,
+    get_view_schemas,
+)
+from src.db.schemas.symbol_dimension import (
+    encode_symbols,
+    storage_plan,
+    storage_table_name,
+    uses_symbol_ids,
+)
+from src.handlers.errors import InvalidUploadError, UnknownSchemaError
+from src.jobs.progress import report_rows_copied, schema_scope
+from src.monitoring.profiling import to_thread
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class UploadHandler:
+    """
+    Parses uploaded CSV streams chunk by chunk and pipes the rows into a COPY.
+    """
+
+    def __init__(self, database_url):
+        """
+        Initialize the UploadHandler with a database URL.
+
+        Parameters:
+            database_url (str): URL of the database to connect to.
+        """
+        self.database_url = database_url
+        self.config_schemas = {
+            schema.table_name: schema for schema in get_configs_schemas()
+        }
+        self.raw_data_schemas = {
+            schema.table_name: schema for schema in get_raw_data_schemas()
+        }
+
+    async def upload_csv_async(
+        self, table_name, byte_stream, compression="none", symbol=None
+    ) -> int:
+        """
+        Transform a streamed CSV with the schema of a table and copy the rows into it.
+
+        Parameters:
+            table_name (str): Name of the config or raw data table.
+            byte_stream (AsyncIterator[bytes]): The uploaded body.
+            compression (str): One of 'none', 'gzip' and 'zstd'.
+            symbol (str, optional): Symbol of the rows, required for raw data tables.
+
+        Returns:
+            int: Number of copied rows.
+        """
+        if table_name in self.raw_data_schemas:
+            if not symbol:
+                raise InvalidUploadError(f"Uploads to {table_name} need a symbol")
+            schema = self.raw_data_schemas[table_name]
+            transformer = StreamTransformer(
+                schema.column_mapping,
+                symbol,
+                schema.plan.source_dtypes,
+                schema.plan.dtypes,
+            )
+        elif table_name in self.config_schemas:
+            schema = self.config_schemas[table_name]
+            transformer = StreamTransformer(
+                schema.column_mapping,
+                dtypes=schema.plan.source_dtypes,
+                column_dtypes=schema.plan.dtypes,
+            )
+        else:
+            raise UnknownSchemaError(f"No schema is defined for table {table_name}")
+
+        inserter = DataInserter(self.database_url)
+        target_table, symbol_ids = table_name, None
+        if uses_symbol_ids(table_name):
+            target_table = storage_table_name(table_name)
+            symbol_ids = await inserter.symbol_ids_async([symbol])
+
+        with schema_scope(table_name):
+            frames = self._transform_async(
+                iter_csv_chunks(byte_stream, compression, settings.upload_chunk_rows),
+                transformer,
+            )
+            # The COPY needs the column order, which is known after the first rows
+            first = await anext(frames, None)
+            if first is None:
+                return 0
+            if symbol_ids:
+                first = encode_symbols(first, symbol_ids)
+            columns = first.columns.tolist()
+            copied = [0]
+
+            async def encoded_rows():
+                frame = first
+                while frame is not None:
+                    copied[0] += len(frame)
+                    payload = frame[columns].to_csv(header=False, index=False).encode()
+                    report_rows_copied(len(frame), len(payload))
+                    yield payload
+                    frame = await anext(frames, None)
+                    if frame is not None and symbol_ids:
+                        frame = encode_symbols(frame, symbol_ids)
+
+            await inserter.copy_csv_stream_async(target_table, columns, encoded_rows())
+            if uses_packed_series(table_name):
+                # Repack the uploaded symbol so the packed rows match the row table
+                await PackedSeriesRepository(self.database_url).pack_async(
+                    schema, [symbol], [symbol]
+                )
+            # Tables created but never seeded still lack the indexes built after loads
+            sql_commands = storage_plan(schema).load_index_commands(
+                settings.concurrent_index_builds
+            )
+            if sql_commands:
+                await TableMaintainer(self.database_url).build_indexes_async(
+                    sql_commands, settings.max_index_builds
+                )
+            await TableMaintainer(self.database_url).refresh_views_async(
+                [
+                    view.refresh_command
+                    for view in get_view_schemas()
+                    if view.source_schema.table_name == table_name
+                ]
+            )
+        logger.info("Uploaded %d rows into %s.", copied[0], table_name)
+        return copied[0]
+
+    @staticmethod
+    async def _transform_async(chunks, transformer):
+        async for csv_text in chunks:
+            # Parsing is CPU bound, keep it off the event loop
+            frame = await to_thread(transformer.transform, csv_text)
+            if not frame.empty:
+                yield frame
+        frame = transformer.flush()
+        if not frame.empty:
+            yield frame
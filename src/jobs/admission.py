@@ -0,0 +1,81 @@
+"""
+Module to admit pipeline runs that change the database.
+
+Runs wait for their advisory locks before they start. Only `max_waiting_runs` runs of a
+worker may be waiting at the same time, later runs are rejected right away instead of
+piling up connections and memory while they wait.
+"""
+
+import functools
+import logging
+
+from src.core.config import settings
+from src.db.repositories.advisory_locks import AdvisoryLocks, describe_scope
+from src.jobs.errors import PipelineBusyError
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """
+    Bounds the runs waiting for pipeline locks and runs admitted tasks under their locks.
+    """
+
+    def __init__(self, locks, max_waiting_runs):
+        """
+        Initialize the AdmissionController.
+
+        Parameters:
+            locks (AdvisoryLocks): The locks runs wait for.
+            max_waiting_runs (int): Number of runs allowed to wait at the same time.
+        """
+        self.locks = locks
+        self.max_waiting_runs = max_waiting_runs
+        self.waiting = 0
+
+    def admit(self, task, scope):
+        """
+        Admit a run of a coroutine function. The run counts as waiting from now on until it
+        holds its locks, or until `release` of the returned function is called.
+
+        Parameters:
+            task (callable): Coroutine function that changes the database.
+            scope (str or list): GLOBAL, or the names of the tables the task changes.
+
+        Returns:
+            callable: Coroutine function that runs the task while holding the locks and
+            returns its result.
+        """
+        if self.waiting >= self.max_waiting_runs:
+            raise PipelineBusyError(
+                f"{self.waiting} runs are already waiting for pipeline locks, "
+                f"retry once they have finished (requested {describe_scope(scope)})"
+            )
+        self.waiting += 1
+        released = False
+
+        def release():
+            nonlocal released
+            if not released:
+                released = True
+                self.waiting -= 1
+
+        @functools.wraps(task)
+        async def run(*args):
+            try:
+                async with self.locks.hold(scope):
+                    release()
+                    return await task(*args)
+            finally:
+                release()
+
+        run.release = release
+        return run
+
+
+admission = AdmissionController(
+    AdvisoryLocks(settings.database_url, settings.lock_wait_timeout),
+    settings.max_waiting_runs,
+)
@@ -0,0 +1,73 @@
+"""
+Module to run coroutine tasks along a dependency graph.
+
+Every task starts as soon as all tasks it depends on have finished, so independent
+branches of the graph run concurrently. Dependencies must be added before the tasks that
+depend on them, which keeps the graph acyclic by construction.
+"""
+
+import asyncio
+import logging
+import time
+
+from src.monitoring.tracing import span
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class Dag:
+    """
+    A dependency graph of named coroutine tasks.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+        self.durations = {}
+
+    def add(self, name, task, depends_on=()):
+        """
+        Add a task to the graph.
+
+        Parameters:
+            name (str): Unique name of the task.
+            task (callable): Coroutine function without arguments.
+            depends_on (iterable): Names of previously added tasks that must finish first.
+        """
+        if name in self._tasks:
+            raise ValueError(f"Task {name} was already added")
+        missing = [
+            dependency for dependency in depends_on if dependency not in self._tasks
+        ]
+        if missing:
+            raise ValueError(f"Task {name} depends on unknown tasks {missing}")
+        self._tasks[name] = (task, tuple(depends_on))
+
+    async def run_async(self) -> None:
+        """
+        Run every task once its dependencies have finished. The first failure cancels the
+        tasks that are still running or waiting and is raised.
+        """
+        futures = {}
+        for name, (task, depends_on) in self._tasks.items():
+            dependencies = [futures[dependency] for dependency in depends_on]
+            futures[name] = asyncio.ensure_future(
+                self._run_task_async(name, task, dependencies)
+            )
+        try:
+            await asyncio.gather(*futures.values())
+        except BaseException:
+            for future in futures.values():
+                future.cancel()
+            await asyncio.gather(*futures.values(), return_exceptions=True)
+            raise
+
+    async def _run_task_async(self, name, task, dependencies):
+        if dependencies:
+            await asyncio.gather(*dependencies)
+        start = time.perf_counter()
+        with span("dag_task", task=name):
+            await task()
+        self.durations[name] = time.perf_counter() - start
+        logger.info("Task %s finished in %.2fs.", name, self.durations[name])
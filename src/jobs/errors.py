@@ -0,0 +1,15 @@
+"""
+Module to handle custom exceptions for background pipeline jobs.
+"""
+
+
+class JobNotFoundError(Exception):
+    """Raised when a job id is not known to the job manager."""
+
+
+class JobCancelledError(Exception):
+    """Raised inside a running job when its cancellation was requested."""
+
+
+class PipelineBusyError(Exception):
+    """Raised when a run is rejected because too many runs already wait for their locks."""
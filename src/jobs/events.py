@@ -0,0 +1,98 @@
+"""
+Module that turns the cumulative progress counters of jobs into live throughput events.
+
+The counters are fed by the preprocessing functions and by the COPY batches of the
+DataInserter. A ThroughputSampler keeps the counters of its previous sample, so every event
+carries the rates since the previous event of the same stream.
+"""
+
+import json
+import time
+
+from src.jobs.job import JobStatus
+
+BYTES_IN_MEGABYTE = 1024 * 1024
+
+
+class ThroughputSampler:
+    """
+    Samples the progress of jobs and computes rows and megabytes per second between samples.
+    """
+
+    def __init__(self):
+        self._previous = {}
+
+    def sample(self, jobs):
+        """
+        Returns a throughput event for the given jobs.
+
+        Parameters:
+            jobs (list): Jobs to report, usually every job known to the job manager.
+
+        Returns:
+            dict: Queue depths and, for every running or just finished job, the per-schema
+            rates, completion and the seconds since the schema last made progress.
+        """
+        now = time.monotonic()
+        event = {
+            "time": time.time(),
+            "queued_jobs": sum(job.status == JobStatus.QUEUED for job in jobs),
+            "running_jobs": sum(job.status == JobStatus.RUNNING for job in jobs),
+            "jobs": [],
+        }
+        for job in jobs:
+            if job.status == JobStatus.QUEUED or (
+                job.is_finished and job.id not in self._previous
+            ):
+                continue
+            schemas = {
+                name: self._schema_rates(job.id, name, schema, now)
+                for name, schema in job.progress.items()
+            }
+            event["jobs"].append(
+                {
+                    "id": job.id,
+                    "name": job.name,
+                    "status": job.status.value,
+                    "pending_schemas": sum(
+                        schema["completion"] != 1.0 for schema in schemas.values()
+                    ),
+                    "schemas": schemas,
+                }
+            )
+            if job.is_finished:
+                # Finished jobs are reported once more with their final counters
+                del self._previous[job.id]
+            else:
+                self._previous.setdefault(job.id, {})
+        return event
+
+    def _schema_rates(self, job_id, name, schema, now):
+        previous = self._previous.setdefault(job_id, {})
+        last_time, last_rows, last_bytes = previous.get(name, (schema.started_at, 0, 0))
+        elapsed = max(now - last_time, 1e-9)
+        previous[name] = (now, schema.rows_done, schema.bytes_done)
+        return {
+            "rows_per_second": (schema.rows_done - last_rows) / elapsed,
+            "mb_per_second": (schema.bytes_done - last_bytes)
+            / elapsed
+            / BYTES_IN_MEGABYTE,
+            "rows_done": schema.rows_done,
+            "rows_total": schema.rows_total,
+            "completion": schema.completion(),
+            "idle_seconds": now - schema.updated_at,
+        }
+
+
+def format_event(event, name="progress"):
+    """
+    Formats an event as a Server-Sent Events message.
+
+    Parameters:
+        event (dict): JSON serialisable event.
+        name (str): Event type of the message.
+
+    Returns:
+        str: The message including the terminating blank line.
+    """
+    return f"event: {name}\ndata: {json.dumps(event)}\n\n"
@@ -0,0 +1,105 @@
+"""
+Module defining a background pipeline job and its lifecycle.
+"""
+
+import threading
+import time
+import uuid
+from enum import Enum
+
+from src.jobs.progress import JobProgress
+
+
+class JobStatus(str, Enum):
+    """States of a background job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class Job:
+    """
+    A pipeline task running in the background with its status and progress.
+    """
+
+    def __init__(self, name, is_async, profile_id=None):
+        """
+        Initialize a queued job.
+
+        Parameters:
+            name (str): Name of the pipeline stage the job runs.
+            is_async (bool): Whether the task is a coroutine function running on the event loop.
+            profile_id (str, optional): Id of the profile recorded for the job.
+        """
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.is_async = is_async
+        self.profile_id = profile_id
+        self.status = JobStatus.QUEUED
+        self.error = None
+        self.result = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.progress = JobProgress()
+        self.task = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancel_requested(self):
+        """Whether cancellation of the job was requested."""
+        return self._cancel_event.is_set()
+
+    @property
+    def is_finished(self):
+        """Whether the job reached a final state."""
+        return self.status in FINISHED_STATUSES
+
+    def request_cancel(self):
+        """Marks the job for cancellation."""
+        self._cancel_event.set()
+
+    def mark_running(self):
+        """Marks the job as started."""
+        self.status = JobStatus.RUNNING
+        self.started_at = time.time()
+
+    def mark_finished(self, status, error=None, result=None):
+        """
+        Marks the job as finished.
+
+        Parameters:
+            status (JobStatus): Final state of the job.
+            error (Exception, optional): Error the job failed with.
+            result (optional): JSON serialisable value the task returned.
+        """
+        self.status = status
+        self.error = None if error is None else str(error)
+        self.result = result
+        self.finished_at = time.time()
+
+    def to_dict(self):
+        """
+        Returns the job as a JSON serialisable dictionary.
+
+        Returns:
+            dict: Job id, name, status, timestamps, error, result and per-schema progress.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status.value,
+            "error": self.error,
+            "result": self.result,
+            "profile_id": self.profile_id,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": self.progress.to_dict(),
+        }
@@ -0,0 +1,162 @@
+"""
+Module to run pipeline tasks as background jobs.
+
+Coroutine functions run as tasks on the event loop, synchronous functions in a bounded
+thread pool, so long loads neither block the event loop nor hold a request worker. At most
+`max_concurrent_jobs` jobs run at the same time, later jobs wait in the queued state.
+"""
+
+import asyncio
+import contextvars
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.config import settings
+from src.jobs import progress
+from src.jobs.errors import JobCancelledError, JobNotFoundError
+from src.jobs.job import Job, JobStatus
+from src.monitoring.metrics import stage_timer
+from src.monitoring.profiling import maybe_profiled, requested_profile_id
+
+# Initialize logger
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class JobManager:
+    """
+    Submits, tracks and cancels background jobs.
+    """
+
+    def __init__(self, max_concurrent_jobs, history_size):
+        """
+        Initialize the JobManager.
+
+        Parameters:
+            max_concurrent_jobs (int): Number of jobs allowed to run at the same time.
+            history_size (int): Number of finished jobs kept for status queries.
+        """
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.history_size = history_size
+        self._jobs = OrderedDict()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_jobs, thread_name_prefix="pipeline-job"
+        )
+        self._semaphore = None
+
+    def submit(self, name, task, *args) -> Job:
+        """
+        Start a task as a background job. Must be called from a running event loop.
+
+        Parameters:
+            name (str): Name of the pipeline stage the job runs.
+            task (callable): Coroutine function or synchronous function to run.
+            *args: Arguments passed to the task.
+
+        Returns:
+            Job: The queued job.
+        """
+        job = Job(name, asyncio.iscoroutinefunction(task), requested_profile_id())
+        task = maybe_profiled(task, name)
+        self._jobs[job.id] = job
+        self._forget_finished_jobs()
+        job.task = asyncio.get_running_loop().create_task(self._run(job, task, args))
+        return job
+
+    def get(self, job_id) -> Job:
+        """
+        Returns a job by its id.
+
+        Parameters:
+            job_id (str): Id of the job.
+
+        Returns:
+            Job: The job.
+        """
+        if job_id not in self._jobs:
+            raise JobNotFoundError(f"Job {job_id} was not found")
+        return self._jobs[job_id]
+
+    def list(self):
+        """
+        Returns the known jobs, oldest first.
+
+        Returns:
+            list: Running, queued and recently finished jobs.
+        """
+        return list(self._jobs.values())
+
+    def cancel(self, job_id) -> Job:
+        """
+        Request cancellation of a job. Queued jobs and jobs running on the event loop are
+        cancelled right away, which also cancels their in-flight COPY commands. Jobs running
+        in the thread pool stop at their next progress checkpoint.
+
+        Parameters:
+            job_id (str): Id of the job.
+
+        Returns:
+            Job: The job.
+        """
+        job = self.get(job_id)
+        if job.is_finished:
+            return job
+        job.request_cancel()
+        if job.is_async or job.status == JobStatus.QUEUED:
+            job.task.cancel()
+        return job
+
+    async def wait(self, job_id) -> Job:
+        """
+        Wait until a job is finished.
+
+        Parameters:
+            job_id (str): Id of the job.
+
+        Returns:
+            Job: The finished job.
+        """
+        job = self.get(job_id)
+        await asyncio.shield(job.task)
+        return job
+
+    async def _run(self, job, task, args):
+        progress.bind_job(job)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_jobs)
+        try:
+            async with self._semaphore:
+                job.mark_running()
+                logger.info("Job %s (%s) started.", job.id, job.name)
+                with stage_timer(f"job:{job.name}"):
+                    if job.is_async:
+                        result = await task(*args)
+                    else:
+                        context = contextvars.copy_context()
+                        result = await asyncio.get_running_loop().run_in_executor(
+                            self._executor, context.run, task, *args
+                        )
+        except (asyncio.CancelledError, JobCancelledError):
+            job.request_cancel()
+        except Exception as error:
+            # Handlers may wrap the cancellation into their own errors
+            if not job.cancel_requested:
+                job.mark_finished(JobStatus.FAILED, error)
+                logger.error("Job %s (%s) failed: %s", job.id, job.name, error)
+                return
+        else:
+            # Work that finished before reaching a checkpoint is kept, whatever was requested
+            job.mark_finished(JobStatus.SUCCEEDED, result=result)
+            logger.info("Job %s (%s) completed.", job.id, job.name)
+            return
+        job.mark_finished(JobStatus.CANCELLED)
+        logger.info("Job %s (%s) was cancelled.", job.id, job.name)
+
+    def _forget_finished_jobs(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished]
+        for job_id in finished[: max(len(finished) - self.history_size, 0)]:
+            del self._jobs[job_id]
+
+
+job_manager = JobManager(settings.max_concurrent_jobs, settings.job_history_size)
@@ -0,0 +1,218 @@
+"""
+Module for reporting the progress of background pipeline jobs.
+
+Pipeline code reports progress through the module functions. The job that is currently
+running and the schema it is working on are tracked in context variables, so the
+functions do nothing when they are called outside of a job, e.g. from tests.
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+from src.jobs.errors import JobCancelledError
+from src.monitoring.metrics import BYTES_PROCESSED, ROWS_PROCESSED
+from src.monitoring.tracing import span
+
+_current_job = contextvars.ContextVar("current_job", default=None)
+_current_schema = contextvars.ContextVar("current_schema", default=None)
+
+
+class SchemaProgress:
+    """
+    Progress of a job on a single schema.
+    """
+
+    def __init__(self):
+        self.files_total = 0
+        self.files_done = 0
+        self.rows_total = 0
+        self.rows_done = 0
+        self.bytes_done = 0
+        self.started_at = time.monotonic()
+        self.updated_at = self.started_at
+
+    def completion(self):
+        """
+        Returns the completed fraction of the schema's rows, or of its files when the
+        number of rows is not known.
+
+        Returns:
+            float or None: Fraction between 0 and 1, None while nothing is known about the total.
+        """
+        for done, total in (
+            (self.rows_done, self.rows_total),
+            (self.files_done, self.files_total),
+        ):
+            if total:
+                return min(done / total, 1.0)
+        return None
+
+    def eta_seconds(self):
+        """
+        Estimates the remaining time from the rate of copied rows, or of processed files
+        when no rows were copied yet.
+
+        Returns:
+            float or None: Estimated remaining seconds, None while there is nothing to estimate from.
+        """
+        elapsed = time.monotonic() - self.started_at
+        for done, total in (
+            (self.rows_done, self.rows_total),
+            (self.files_done, self.files_total),
+        ):
+            if done and total:
+                return max(total - done, 0) * elapsed / done
+        return None
+
+    def to_dict(self):
+        """
+        Returns the progress as a JSON serialisable dictionary.
+
+        Returns:
+            dict: Progress counters and the estimated remaining time.
+        """
+        return {
+            "files_total": self.files_total,
+            "files_done": self.files_done,
+            "rows_total": self.rows_total,
+            "rows_done": self.rows_done,
+            "bytes_done": self.bytes_done,
+            "eta_seconds": self.eta_seconds(),
+        }
+
+
+class JobProgress:
+    """
+    Per-schema progress of a job.
+    """
+
+    def __init__(self):
+        self._schemas = {}
+        self._lock = threading.Lock()
+
+    def schema(self, schema_name):
+        """
+        Returns the progress of a schema, creating it on first use.
+
+        Parameters:
+            schema_name (str): Name of the schema's database table.
+
+        Returns:
+            SchemaProgress: Progress of the schema.
+        """
+        with self._lock:
+            if schema_name not in self._schemas:
+                self._schemas[schema_name] = SchemaProgress()
+            return self._schemas[schema_name]
+
+    def items(self):
+        """
+        Returns the schemas and their progress.
+
+        Returns:
+            list: Pairs of schema names and SchemaProgress.
+        """
+        with self._lock:
+            return list(self._schemas.items())
+
+    def to_dict(self):
+        """
+        Returns the progress of every schema as a JSON serialisable dictionary.
+
+        Returns:
+            dict: Mapping of schema names to their progress.
+        """
+        return {name: progress.to_dict() for name, progress in self.items()}
+
+
+def bind_job(job):
+    """
+    Makes a job the receiver of the progress reported in the current context.
+
+    Parameters:
+        job (Job): The job that is running in the current context.
+    """
+    _current_job.set(job)
+
+
+@contextmanager
+def schema_scope(schema_name):
+    """
+    Attributes the progress reported inside the block to a schema and traces the block
+    as a 'schema' span.
+
+    Parameters:
+        schema_name (str): Name of the schema's database table.
+    """
+    token = _current_schema.set(schema_name)
+    try:
+        with span("schema", schema=schema_name):
+            yield
+    finally:
+        _current_schema.reset(token)
+
+
+def report_files_total(count):
+    """Reports the number of files the current schema has to process."""
+    progress = _current_progress()
+    if progress is not None:
+        progress.files_total += count
+        progress.updated_at = time.monotonic()
+
+
+def report_file_done(rows, bytes_read):
+    """Reports a processed file of the current schema with its row count and size."""
+    ROWS_PROCESSED.inc(rows, schema=_schema_label(), stage="parse")
+    BYTES_PROCESSED.inc(bytes_read, schema=_schema_label(), stage="parse")
+    progress = _current_progress()
+    if progress is not None:
+        progress.files_done += 1
+        progress.rows_done += rows
+        progress.bytes_done += bytes_read
+        progress.updated_at = time.monotonic()
+
+
+def report_rows_total(rows):
+    """Reports the number of rows the current schema has to copy."""
+    progress = _current_progress()
+    if progress is not None:
+        progress.rows_total += rows
+        progress.updated_at = time.monotonic()
+
+
+def report_rows_copied(rows, bytes_copied=0):
+    """
+    Reports rows of the current schema that were copied into the database together with
+    the size of the COPY payload they were sent in.
+    """
+    ROWS_PROCESSED.inc(rows, schema=_schema_label(), stage="copy")
+    BYTES_PROCESSED.inc(bytes_copied, schema=_schema_label(), stage="copy")
+    progress = _current_progress()
+    if progress is not None:
+        progress.rows_done += rows
+        progress.bytes_done += bytes_copied
+        progress.updated_at = time.monotonic()
+
+
+def check_cancelled():
+    """
+    Raises JobCancelledError when cancellation of the current job was requested.
+    Long-running synchronous code calls it between units of work.
+    """
+    job = _current_job.get()
+    if job is not None and job.cancel_requested:
+        raise JobCancelledError(f"Job {job.id} was cancelled")
+
+
+def _schema_label():
+    return _current_schema.get() or "unknown"
+
+
+def _current_progress():
+    job = _current_job.get()
+    schema_name = _current_schema.get()
+    if job is None or schema_name is None:
+        return None
+    return job.progress.schema(schema_name)
@@ -3,15 +3,30 @@ Main entry point for the FastAPI application.
 """
 
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from src.api.dependencies import create_handler_registry
+from src.api.middleware import RequestContextMiddleware
 from src.api.router import router
+from src.api.routes.metrics_route import router as metrics_router
 from src.core.config import settings
 
 logging.basicConfig(level=logging.INFO)
 
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    """
+    Sets up the handlers that the routes receive as dependencies.
+    """
+    application.state.handlers = create_handler_registry()
+    yield
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title=settings.title,
     version=settings.version,
     description=settings.description,
@@ -21,6 +36,9 @@ app = FastAPI(
 )
 
 app.include_router(router, prefix=settings.api_prefix)
+# Scrapers expect the metrics at the conventional root path
+app.include_router(metrics_router)
+app.add_middleware(RequestContextMiddleware)
 
 
 @app.get("/")
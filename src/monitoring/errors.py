@@ -0,0 +1,11 @@
+"""
+Module to handle custom exceptions for monitoring and profiling.
+"""
+
+
+class ProfileNotFoundError(Exception):
+    """Raised when a profile or one of its artifacts does not exist."""
+
+
+class ProfilingBusyError(Exception):
+    """Raised when a profiled run starts while another one is still running."""
@@ -0,0 +1,215 @@
+"""
+Module for opt-in memory accounting of the pipeline stages.
+
+When enabled, every stage timed by `stage_timer` or `timed` also records how far the traced
+memory rose above its level at the start of the stage. On the first run of a stage and
+schema it also records which allocation sites hold the most new memory at its end. Results
+are kept per stage and schema, the schema is taken from the enclosing tracing spans.
+Allocation tracing is process wide, so stages running concurrently see each other's
+allocations. Tracing slows the pipeline down noticeably, it is disabled by default and
+stages only pay for reading a flag then.
+"""
+
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+from src.core.config import settings
+from src.monitoring.tracing import current_attribute
+
+TRACEBACK_DEPTH = 10
+_SOURCE_DIRECTORY = f"{os.sep}src{os.sep}"
+
+
+class _StageRun:
+    """Traced memory of a stage that is running."""
+
+    def __init__(self, start_bytes, snapshot):
+        self.start_bytes = start_bytes
+        self.peak_bytes = start_bytes
+        self.snapshot = snapshot
+
+
+class MemoryTracker:
+    """
+    Records allocation peaks and the largest allocation sites per stage and schema.
+    """
+
+    def __init__(self, enabled=False, top_sites=10):
+        """
+        Initialize the tracker.
+
+        Parameters:
+            enabled (bool): Whether stages are tracked from the start.
+            top_sites (int): Number of allocation sites kept per stage and schema.
+        """
+        self.top_sites = top_sites
+        self._enabled = False
+        self._started_tracing = False
+        self._running = []
+        self._stages = {}
+        self._lock = threading.Lock()
+        if enabled:
+            self.enable()
+
+    @property
+    def enabled(self):
+        """Whether stages are tracked."""
+        return self._enabled
+
+    def enable(self):
+        """Starts tracking stages, and allocation tracing unless it already runs."""
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEBACK_DEPTH)
+                self._started_tracing = True
+            self._enabled = True
+
+    def disable(self):
+        """Stops tracking stages, the recorded results are kept."""
+        with self._lock:
+            self._enabled = False
+            if self._started_tracing and not self._running:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    def reset(self):
+        """Forgets the recorded results."""
+        with self._lock:
+            self._stages.clear()
+
+    @contextmanager
+    def track(self, stage):
+        """
+        Records the memory of the block as a run of the stage.
+
+        Parameters:
+            stage (str): Name of the pipeline stage.
+        """
+        if not self._enabled or not tracemalloc.is_tracing():
+            yield
+            return
+
+        schema = current_attribute("schema") or "unknown"
+        # Snapshots cost time in proportion to all traced blocks, take them on the first
+        # run of a stage and schema only
+        with self._lock:
+            sample_sites = self.top_sites and (stage, schema) not in self._stages
+        snapshot = tracemalloc.take_snapshot() if sample_sites else None
+        with self._lock:
+            run = _StageRun(self._update_peaks(), snapshot)
+            self._running.append(run)
+        try:
+            yield
+        finally:
+            with self._lock:
+                end_bytes = self._update_peaks()
+                self._running.remove(run)
+            sites = []
+            if run.snapshot is not None:
+                sites = self._grown_sites(run.snapshot)
+                # Comparing snapshots allocates as well, keep it out of enclosing stages
+                with self._lock:
+                    tracemalloc.reset_peak()
+            self._record(
+                stage,
+                schema,
+                run.peak_bytes - run.start_bytes,
+                end_bytes - run.start_bytes,
+                sites,
+            )
+            if not self._enabled:
+                self.disable()
+
+    def report(self, stage=None, schema=None):
+        """
+        Returns the recorded results, largest peak first.
+
+        Parameters:
+            stage (str, optional): Only results of this stage.
+            schema (str, optional): Only results of this schema.
+
+        Returns:
+            list: Per stage and schema the number of runs, the largest and the summed peak
+            increase in bytes, the bytes still allocated after the largest run and the
+            allocation sites holding the most new memory at the end of the first run.
+        """
+        with self._lock:
+            results = [
+                {"stage": key[0], "schema": key[1], **result}
+                for key, result in self._stages.items()
+            ]
+        return sorted(
+            (
+                result
+                for result in results
+                if (stage is None or result["stage"] == stage)
+                and (schema is None or result["schema"] == schema)
+            ),
+            key=lambda result: result["peak_bytes"],
+            reverse=True,
+        )
+
+    def _update_peaks(self):
+        # The traced peak is global, fold it into every running stage before resetting it
+        current, peak = tracemalloc.get_traced_memory()
+        for run in self._running:
+            run.peak_bytes = max(run.peak_bytes, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def _record(self, stage, schema, peak_bytes, retained_bytes, sites):
+        with self._lock:
+            result = self._stages.setdefault(
+                (stage, schema),
+                {
+                    "runs": 0,
+                    "peak_bytes": 0,
+                    "total_peak_bytes": 0,
+                    "retained_bytes": 0,
+                    "top_allocations": [],
+                },
+            )
+            result["runs"] += 1
+            result["total_peak_bytes"] += peak_bytes
+            if peak_bytes >= result["peak_bytes"]:
+                result["peak_bytes"] = peak_bytes
+                result["retained_bytes"] = retained_bytes
+            if sites:
+                result["top_allocations"] = sites
+
+    def _grown_sites(self, before):
+        differences = [
+            difference
+            for difference in tracemalloc.take_snapshot().compare_to(
+                before, "traceback"
+            )
+            if difference.size_diff > 0
+            # Snapshots of enclosing stages are allocated here as well
+            and all(frame.filename != __file__ for frame in difference.traceback)
+        ]
+        sites = []
+        for difference in differences[: self.top_sites]:
+            frames = list(difference.traceback)
+            # The innermost frame is often inside pandas, also name the pipeline code
+            origin = next(
+                (
+                    frame
+                    for frame in reversed(frames)
+                    if _SOURCE_DIRECTORY in frame.filename
+                ),
+                None,
+            )
+            sites.append(
+                {
+                    "site": f"{frames[-1].filename}:{frames[-1].lineno}",
+                    "origin": f"{origin.filename}:{origin.lineno}" if origin else None,
+                    "size_bytes": difference.size_diff,
+                    "blocks": difference.count_diff,
+                }
+            )
+        return sites
+
+
+memory_tracker = MemoryTracker(settings.memory_tracking, settings.memory_top_sites)
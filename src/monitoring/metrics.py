@@ -0,0 +1,277 @@
+"""
+Module providing in-process metrics rendered in the Prometheus text exposition format.
+
+Counters and histograms are kept in memory behind a lock per metric. Recording a value is
+a dictionary lookup and an addition, so the instrumentation stays on in production. The
+pipeline stages are timed with the `timed` decorator or the `stage_timer` context manager,
+which also record every stage as a tracing span.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextlib import asynccontextmanager, contextmanager
+
+from src.monitoring.memory import memory_tracker
+from src.monitoring.tracing import span
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+
+class Counter:
+    """
+    Monotonic counter with labels.
+    """
+
+    def __init__(self, name, documentation, label_names):
+        """
+        Initialize the counter.
+
+        Parameters:
+            name (str): Metric name, ending with '_total' by convention.
+            documentation (str): Help text of the metric.
+            label_names (tuple): Names of the labels.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        """Increase the counter of a label combination."""
+        key = tuple(str(labels[name]) for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        """Returns the current value of a label combination."""
+        key = tuple(str(labels[name]) for name in self.label_names)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def render(self):
+        """Returns the counter in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            lines.append(f"{self.name}{_labels(self.label_names, key)} {value}")
+        return lines
+
+
+class Histogram:
+    """
+    Histogram with cumulative buckets and labels.
+    """
+
+    def __init__(self, name, documentation, label_names, buckets=DEFAULT_BUCKETS):
+        """
+        Initialize the histogram.
+
+        Parameters:
+            name (str): Metric name.
+            documentation (str): Help text of the metric.
+            label_names (tuple): Names of the labels.
+            buckets (tuple): Sorted upper bounds of the buckets.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        """Record an observation of a label combination."""
+        key = tuple(str(labels[name]) for name in self.label_names)
+        position = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[position] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, **labels):
+        """Returns the number of observations of a label combination."""
+        key = tuple(str(labels[name]) for name in self.label_names)
+        with self._lock:
+            counts, _ = self._values.get(key, ([0], 0.0))
+            return sum(counts)
+
+    def total(self, **labels):
+        """Returns the sum of the observations of a label combination."""
+        key = tuple(str(labels[name]) for name in self.label_names)
+        with self._lock:
+            _, total = self._values.get(key, ([0], 0.0))
+            return total
+
+    def render(self):
+        """Returns the histogram in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            values = [
+                (key, list(counts), total)
+                for key, (counts, total) in self._values.items()
+            ]
+        for key, counts, total in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = _labels(self.label_names + ("le",), key + (le,))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {total}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+def _labels(names, values):
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+STAGE_SECONDS = Histogram(
+    "pipeline_stage_seconds", "Duration of pipeline stages in seconds.", ("stage",)
+)
+STAGE_ERRORS = Counter(
+    "pipeline_stage_errors_total", "Pipeline stages that raised an error.", ("stage",)
+)
+POOL_ACQUIRE_SECONDS = Histogram(
+    "db_pool_acquire_seconds",
+    "Time spent waiting for a database connection from the pool.",
+    ("repository",),
+)
+ROWS_PROCESSED = Counter(
+    "pipeline_rows_total", "Rows processed per schema and stage.", ("schema", "stage")
+)
+BYTES_PROCESSED = Counter(
+    "pipeline_bytes_total", "Bytes read per schema and stage.", ("schema", "stage")
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total", "Cache lookups by cache and result.", ("cache", "result")
+)
+
+REGISTRY = (
+    STAGE_SECONDS,
+    STAGE_ERRORS,
+    POOL_ACQUIRE_SECONDS,
+    ROWS_PROCESSED,
+    BYTES_PROCESSED,
+    CACHE_REQUESTS,
+)
+
+
+def render_metrics():
+    """
+    Renders every registered metric in the Prometheus text exposition format.
+
+    Returns:
+        str: The exposition text.
+    """
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def stage_timer(stage):
+    """
+    Records the duration of the block in the stage histogram, and errors raised by it.
+    The block runs inside a tracing span named after the stage, and its memory is
+    recorded when memory tracking is enabled.
+
+    Parameters:
+        stage (str): Name of the pipeline stage.
+
+    Yields:
+        Span: The tracing span of the stage.
+    """
+    start = time.perf_counter()
+    try:
+        with span(stage) as stage_span, memory_tracker.track(stage):
+            yield stage_span
+    except BaseException:
+        STAGE_ERRORS.inc(stage=stage)
+        raise
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage=stage)
+
+
+def timed(stage):
+    """
+    Decorator recording the duration of every call of a function as a pipeline stage.
+    Works for both synchronous and coroutine functions.
+
+    Parameters:
+        stage (str): Name of the pipeline stage.
+    """
+
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with stage_timer(stage) as stage_span:
+                    return _record_rows(stage_span, await func(*args, **kwargs))
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage_timer(stage) as stage_span:
+                return _record_rows(stage_span, func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def _record_rows(stage_span, result):
+    # Stages returning a DataFrame report its size on their span
+    if hasattr(result, "shape"):
+        stage_span.set_attributes(rows=len(result))
+    return result
+
+
+@asynccontextmanager
+async def acquire_timed(pool, repository):
+    """
+    Acquires a connection from an asyncpg pool and records the wait.
+
+    Parameters:
+        pool (asyncpg.Pool): The connection pool.
+        repository (str): Name of the repository acquiring the connection.
+    """
+    start = time.perf_counter()
+    async with pool.acquire() as conn:
+        POOL_ACQUIRE_SECONDS.observe(time.perf_counter() - start, repository=repository)
+        yield conn
@@ -0,0 +1,328 @@
+"""
+Module for on-demand profiling of pipeline requests.
+
+A request opts in with the `X-Profile: true` header or the `profile=true` query parameter.
+The middleware then assigns a profile id to the request context. The handler, or the
+background job the request starts, runs under cProfile with a tracemalloc snapshot taken at
+the end, and the artifacts are stored under the profile id. Requests without the opt-in only
+pay for reading a context variable.
+
+cProfile only sees the thread it was enabled in. Work the run hands to worker threads with
+`to_thread` is profiled by a profiler of its own in that thread, and the statistics of all
+of them are merged into the stored profile. Only one profiled run can be active at a time,
+two profilers on the event loop thread would replace each other.
+
+Layout::
+
+    <profile_path>/<profile_id>/meta.json        name, timestamps, duration and peak memory
+    <profile_path>/<profile_id>/profile.pstats   cProfile statistics, readable with pstats or snakeviz
+    <profile_path>/<profile_id>/summary.txt      functions sorted by cumulative time
+    <profile_path>/<profile_id>/allocations.txt  largest allocation sites at the end of the run
+"""
+
+import asyncio
+import contextvars
+import cProfile
+import functools
+import io
+import json
+import logging
+import os
+import pstats
+import shutil
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+
+from src.core.config import settings
+from src.monitoring.errors import ProfileNotFoundError, ProfilingBusyError
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile"
+PROFILE_QUERY_PARAMETER = "profile"
+ARTIFACTS = ("profile.pstats", "summary.txt", "allocations.txt")
+TRACEBACK_DEPTH = 10
+SUMMARY_LINES = 60
+TOP_ALLOCATIONS = 25
+
+_requested_profile_id = contextvars.ContextVar("requested_profile_id", default=None)
+_active_run = contextvars.ContextVar("active_profile_run", default=None)
+_run_slot = threading.Lock()
+
+
+class _ProfileRun:
+    """Collects the profilers of the worker threads of a profiled run."""
+
+    def __init__(self):
+        self.thread_profilers = []
+        self._lock = threading.Lock()
+
+    def add(self, profiler):
+        with self._lock:
+            self.thread_profilers.append(profiler)
+
+
+class ProfileStore:
+    """
+    Stores profile artifacts in one directory per profile id.
+    """
+
+    def __init__(self, base_path, retention):
+        """
+        Initialize the store.
+
+        Parameters:
+            base_path (str): Directory holding the profiles.
+            retention (int): Number of most recent profiles that are kept.
+        """
+        self.base_path = base_path
+        self.retention = retention
+
+    def save(self, profile_id, name, stats, snapshot, duration, peak_bytes):
+        """
+        Write the artifacts of a finished profile run.
+
+        Parameters:
+            profile_id (str): Id of the profile.
+            name (str): Name of the profiled handler or job.
+            stats (pstats.Stats): Statistics of the disabled profilers.
+            snapshot (tracemalloc.Snapshot): Allocation snapshot taken at the end of the run.
+            duration (float): Wall-clock duration in seconds.
+            peak_bytes (int): Peak traced memory during the run.
+        """
+        path = os.path.join(self.base_path, profile_id)
+        os.makedirs(path, exist_ok=True)
+        stats.dump_stats(os.path.join(path, "profile.pstats"))
+
+        summary = io.StringIO()
+        stats.stream = summary
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_LINES)
+        with open(os.path.join(path, "summary.txt"), "w", encoding="utf-8") as file:
+            file.write(summary.getvalue())
+
+        allocations = snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+        with open(os.path.join(path, "allocations.txt"), "w", encoding="utf-8") as file:
+            file.write("\n".join(str(statistic) for statistic in allocations))
+
+        meta = {
+            "id": profile_id,
+            "name": name,
+            "created_at": time.time(),
+            "duration_seconds": duration,
+            "peak_memory_bytes": peak_bytes,
+            "artifacts": list(ARTIFACTS),
+        }
+        with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+        self._remove_old_profiles()
+        logger.info("Stored profile %s of %s.", profile_id, name)
+
+    def list(self):
+        """
+        Returns the metadata of the stored profiles, newest first.
+
+        Returns:
+            list: Metadata dictionaries.
+        """
+        if not os.path.isdir(self.base_path):
+            return []
+        profiles = []
+        for profile_id in os.listdir(self.base_path):
+            try:
+                profiles.append(self.get(profile_id))
+            except ProfileNotFoundError:
+                continue
+        return sorted(profiles, key=lambda meta: meta["created_at"], reverse=True)
+
+    def get(self, profile_id):
+        """
+        Returns the metadata of a profile.
+
+        Parameters:
+            profile_id (str): Id of the profile.
+
+        Returns:
+            dict: Metadata of the profile.
+        """
+        try:
+            with open(
+                os.path.join(self.base_path, os.path.basename(profile_id), "meta.json"),
+                encoding="utf-8",
+            ) as file:
+                return json.load(file)
+        except FileNotFoundError as exc:
+            raise ProfileNotFoundError(f"Profile {profile_id} was not found") from exc
+
+    def artifact_path(self, profile_id, artifact):
+        """
+        Returns the path of a profile artifact.
+
+        Parameters:
+            profile_id (str): Id of the profile.
+            artifact (str): One of the artifact file names.
+
+        Returns:
+            str: Path of the artifact file.
+        """
+        path = os.path.join(self.base_path, os.path.basename(profile_id), artifact)
+        if artifact not in ARTIFACTS or not os.path.isfile(path):
+            raise ProfileNotFoundError(
+                f"Artifact {artifact} of profile {profile_id} was not found"
+            )
+        return path
+
+    def _remove_old_profiles(self):
+        for meta in self.list()[self.retention :]:
+            shutil.rmtree(os.path.join(self.base_path, meta["id"]), ignore_errors=True)
+
+
+profile_store = ProfileStore(settings.profile_path, settings.profile_retention)
+
+
+def is_profiling_requested(headers, query_params):
+    """
+    Returns whether a request opted in to profiling.
+
+    Parameters:
+        headers (Mapping): Request headers.
+        query_params (Mapping): Request query parameters.
+
+    Returns:
+        bool: True when the header or the query parameter is set to a true value.
+    """
+    value = headers.get(PROFILE_HEADER) or query_params.get(PROFILE_QUERY_PARAMETER)
+    return value is not None and value.lower() in ("1", "true", "yes")
+
+
+@contextmanager
+def request_profile():
+    """
+    Assigns a new profile id to the current request context.
+
+    Yields:
+        str: The profile id.
+    """
+    profile_id = uuid.uuid4().hex
+    token = _requested_profile_id.set(profile_id)
+    try:
+        yield profile_id
+    finally:
+        _requested_profile_id.reset(token)
+
+
+def requested_profile_id():
+    """Returns the profile id of the current request context, or None when it did not opt in."""
+    return _requested_profile_id.get()
+
+
+@contextmanager
+def profile_run(profile_id, name):
+    """
+    Runs the block under cProfile and stores the profile with an allocation snapshot.
+    Functions the block runs with `to_thread` are profiled in their threads as well.
+    Allocation tracing is process wide, so allocations of concurrent work show up as well.
+
+    Parameters:
+        profile_id (str): Id of the profile.
+        name (str): Name of the profiled handler or job.
+
+    Raises:
+        ProfilingBusyError: If another profiled run is active.
+    """
+    if not _run_slot.acquire(blocking=False):
+        raise ProfilingBusyError(
+            f"Another profiled run is in progress, {name} was not started"
+        )
+    run = _ProfileRun()
+    token = _active_run.set(run)
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(TRACEBACK_DEPTH)
+    tracemalloc.reset_peak()
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        duration = time.perf_counter() - start
+        _active_run.reset(token)
+        snapshot = tracemalloc.take_snapshot()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        if not was_tracing:
+            tracemalloc.stop()
+        try:
+            stats = pstats.Stats(profiler, *run.thread_profilers)
+            profile_store.save(profile_id, name, stats, snapshot, duration, peak_bytes)
+        finally:
+            _run_slot.release()
+
+
+def _profiled_in_thread(function, run):
+    @functools.wraps(function)
+    def profiled(*args, **kwargs):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profiler.disable()
+            run.add(profiler)
+
+    return profiled
+
+
+async def to_thread(function, *args, **kwargs):
+    """
+    Runs a function in a worker thread like `asyncio.to_thread`. Inside a profiled run the
+    function is profiled in that thread and its statistics join the run's profile.
+
+    Parameters:
+        function (callable): Synchronous function.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        The result of the function.
+    """
+    run = _active_run.get()
+    if run is not None:
+        function = _profiled_in_thread(function, run)
+    return await asyncio.to_thread(function, *args, **kwargs)
+
+
+def maybe_profiled(task, name):
+    """
+    Wraps a task so it runs under the profiler when the current request opted in.
+    Otherwise the task is returned unchanged.
+
+    Parameters:
+        task (callable): Coroutine function or synchronous function.
+        name (str): Name of the profiled handler or job.
+
+    Returns:
+        callable: The task or its profiled wrapper of the same kind.
+    """
+    profile_id = requested_profile_id()
+    if profile_id is None:
+        return task
+
+    if asyncio.iscoroutinefunction(task):
+
+        async def run_async(*args):
+            with profile_run(profile_id, name):
+                return await task(*args)
+
+        return run_async
+
+    def run(*args):
+        with profile_run(profile_id, name):
+            return task(*args)
+
+    return run
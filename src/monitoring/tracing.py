@@ -0,0 +1,204 @@
+"""
+Module providing lightweight nested tracing spans.
+
+A span covers a request, a handler or job, a schema, a file or a single operation. The
+current span is tracked in a context variable, so spans opened inside worker threads that
+run with a copied context nest under the span that started the work. Finished spans are
+kept in an in-memory ring buffer that the API queries and are optionally appended to a
+JSON-lines file.
+"""
+
+import collections
+import contextvars
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from src.core.config import settings
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """
+    A timed unit of work with attributes.
+    """
+
+    def __init__(self, name, parent, attributes):
+        """
+        Initialize a started span.
+
+        Parameters:
+            name (str): Name of the unit of work, e.g. 'schema', 'file' or 'load_csv'.
+            parent (Span or None): The enclosing span.
+            attributes (dict): Initial attributes such as schema, symbol or rows.
+        """
+        self.name = name
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent else None
+        self.parent = parent
+        self.attributes = dict(attributes)
+        self.status = "ok"
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        self.duration_ms = None
+
+    def set_attributes(self, **attributes):
+        """Add or replace attributes of the span."""
+        self.attributes.update(attributes)
+
+    def finish(self, status="ok"):
+        """Ends the span."""
+        self.status = status
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+
+    def to_dict(self):
+        """
+        Returns the span as a JSON serialisable dictionary.
+
+        Returns:
+            dict: Ids, name, timing, status and attributes of the span.
+        """
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class SpanExporter:
+    """
+    Keeps finished spans in a ring buffer and optionally appends them to a JSON-lines file.
+    """
+
+    def __init__(self, buffer_size, file_path=None):
+        """
+        Initialize the exporter.
+
+        Parameters:
+            buffer_size (int): Number of most recent spans kept in memory.
+            file_path (str, optional): JSON-lines file the spans are appended to.
+        """
+        self.file_path = file_path
+        self._spans = collections.deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    def export(self, finished_span):
+        """Store a finished span."""
+        record = finished_span.to_dict()
+        self._spans.append(record)
+        if self.file_path:
+            line = json.dumps(record, default=str)
+            with self._lock, open(self.file_path, "a", encoding="utf-8") as file:
+                file.write(line + "\n")
+
+    def spans(self, name=None, trace_id=None):
+        """
+        Returns the buffered spans, oldest first.
+
+        Parameters:
+            name (str, optional): Only spans with this name.
+            trace_id (str, optional): Only spans of this trace.
+
+        Returns:
+            list: Span dictionaries.
+        """
+        return [
+            record
+            for record in list(self._spans)
+            if (name is None or record["name"] == name)
+            and (trace_id is None or record["trace_id"] == trace_id)
+        ]
+
+    def slowest(self, name, group_by=None, limit=10):
+        """
+        Returns the slowest spans of a name, or the attribute values with the largest total
+        duration when grouping, e.g. the slowest symbols of the 'file' spans.
+
+        Parameters:
+            name (str): Name of the spans.
+            group_by (str, optional): Attribute to sum the durations by.
+            limit (int): Number of results.
+
+        Returns:
+            list: Span dictionaries, or dictionaries with the attribute value, the total
+            duration and the number of spans.
+        """
+        records = [r for r in self.spans(name) if r["duration_ms"] is not None]
+        if group_by is None:
+            return sorted(records, key=lambda r: r["duration_ms"], reverse=True)[:limit]
+        totals = collections.defaultdict(lambda: [0.0, 0])
+        for record in records:
+            total = totals[record["attributes"].get(group_by)]
+            total[0] += record["duration_ms"]
+            total[1] += 1
+        groups = [
+            {group_by: value, "total_duration_ms": total, "spans": count}
+            for value, (total, count) in totals.items()
+        ]
+        return sorted(groups, key=lambda g: g["total_duration_ms"], reverse=True)[
+            :limit
+        ]
+
+
+exporter = SpanExporter(settings.trace_buffer_size, settings.trace_file)
+
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Runs the block inside a new span nested under the current span.
+
+    Parameters:
+        name (str): Name of the unit of work.
+        **attributes: Initial attributes of the span.
+
+    Yields:
+        Span: The started span, attributes can be added while it runs.
+    """
+    current = Span(name, _current_span.get(), attributes)
+    token = _current_span.set(current)
+    status = "ok"
+    try:
+        yield current
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        _current_span.reset(token)
+        current.finish(status)
+        exporter.export(current)
+
+
+def set_span_attributes(**attributes):
+    """Adds attributes to the current span, does nothing outside of a span."""
+    current = _current_span.get()
+    if current is not None:
+        current.set_attributes(**attributes)
+
+
+def current_attribute(name):
+    """
+    Returns an attribute of the current span or of the closest enclosing span that has it,
+    e.g. the schema a stage runs for.
+
+    Parameters:
+        name (str): Name of the attribute.
+
+    Returns:
+        The attribute value, or None when no enclosing span has it.
+    """
+    current = _current_span.get()
+    while current is not None:
+        if name in current.attributes:
+            return current.attributes[name]
+        current = current.parent
+    return None
@@ -82,3 +82,55 @@ def mock_dataframe_for_datetime_success():
 def mock_dataframe_for_datetime_fail():
     data = {"datetime_column": ["not_a_datetime", "another_not_datetime"]}
     return pd.DataFrame(data)
+
+
+# Mock DataFrame with daily prices of two symbols for returns computation
+@pytest.fixture
+def mock_dataframe_for_returns():
+    data = {
+        "unix_date_time": [3, 1, 2, 1, 2, 3],
+        "symbol": ["AEX", "AEX", "AEX", "GOLD", "GOLD", "GOLD"],
+        "price": [12.0, 10.0, 11.0, 100.0, 0.0, 5.0],
+    }
+    return pd.DataFrame(data)
+
+
+# Mock DataFrame with long price rows of two symbols for the matrix pivot
+@pytest.fixture
+def mock_dataframe_for_matrix():
+    data = {
+        "unix_date_time": [86400, 0, 0, 172800],
+        "symbol": ["GOLD", "AEX", "GOLD", "AEX"],
+        "price": [2.0, 10.0, 1.0, 12.0],
+    }
+    return pd.DataFrame(data)
+
+
+# Mock DataFrame with multiple prices of one symbol for the carry forecast
+@pytest.fixture
+def mock_dataframe_for_carry():
+    data = {
+        "unix_date_time": [1, 2, 3, 4],
+        "symbol": ["GOLD"] * 4,
+        "price": [101.0, 102.0, 101.0, 103.0],
+        "carry": [100.0, 101.0, 100.0, 102.0],
+        "price_contract": [20230300] * 4,
+        "carry_contract": [20230600] * 4,
+        "adjusted_price": [50.0, 51.0, 50.0, 52.0],
+    }
+    return pd.DataFrame(data)
+
+
+# Mock DataFrame with intraday prices over two weeks and two months for rollups
+@pytest.fixture
+def mock_dataframe_for_rollups():
+    data = {
+        "unix_date_time": [
+            "2024-01-29 09:00:00",
+            "2024-01-29 17:00:00",
+            "2024-01-31 12:00:00",
+            "2024-02-05 12:00:00",
+        ],
+        "price": [1.0, 3.0, 2.0, 6.0],
+    }
+    return pd.DataFrame(data)
@@ -0,0 +1,66 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.db.repositories.advisory_locks import GLOBAL, table_lock_key
+from src.jobs.admission import AdmissionController
+from src.jobs.errors import PipelineBusyError
+
+
+class FakeLocks:
+    """Holds the scopes in memory instead of as advisory locks."""
+
+    def __init__(self):
+        self.held = []
+        self.released = asyncio.Event()
+
+    @asynccontextmanager
+    async def hold(self, scope):
+        await self.released.wait()
+        self.held.append(scope)
+        yield
+
+
+@pytest.mark.asyncio
+async def test_runs_beyond_the_waiting_limit_are_rejected():
+    locks = FakeLocks()
+    controller = AdmissionController(locks, max_waiting_runs=1)
+    calls = []
+
+    async def seed(table_name):
+        calls.append(table_name)
+        return len(calls)
+
+    first = controller.admit(seed, ["adjusted_prices"])
+    with pytest.raises(PipelineBusyError):
+        controller.admit(seed, GLOBAL)
+
+    run = asyncio.create_task(first("adjusted_prices"))
+    locks.released.set()
+    assert await run == 1
+    assert calls == ["adjusted_prices"]
+    assert locks.held == [["adjusted_prices"]]
+    assert controller.waiting == 0
+    # Holding runs no longer count as waiting
+    controller.admit(seed, GLOBAL)
+
+
+def test_release_of_a_run_that_never_started():
+    controller = AdmissionController(FakeLocks(), max_waiting_runs=1)
+
+    async def reset():
+        pass
+
+    run = controller.admit(reset, GLOBAL)
+    run.release()
+    run.release()
+
+    assert controller.waiting == 0
+    assert run.__name__ == "reset"
+
+
+def test_table_lock_keys_are_stable_and_never_global():
+    assert table_lock_key("adjusted_prices") == table_lock_key("adjusted_prices")
+    assert table_lock_key("adjusted_prices") != table_lock_key("fx_prices")
+    assert 0 < table_lock_key("fx_prices") < 2**31
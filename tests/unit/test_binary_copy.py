@@ -0,0 +1,69 @@
+import struct
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing.binary_copy import (
+    PGCOPY_HEADER,
+    PGCOPY_TRAILER,
+    TEXT,
+    BinaryCopyEncoder,
+)
+
+
+def _decode(payload, formats):
+    assert payload.startswith(PGCOPY_HEADER)
+    assert payload.endswith(PGCOPY_TRAILER)
+    body, rows = payload[len(PGCOPY_HEADER) : -len(PGCOPY_TRAILER)], []
+    while body:
+        (field_count,) = struct.unpack(">h", body[:2])
+        assert field_count == len(formats)
+        body, row = body[2:], []
+        for value_format in formats:
+            (length,) = struct.unpack(">i", body[:4])
+            if length < 0:
+                row.append(None)
+                body = body[4:]
+                continue
+            field = body[4 : 4 + length]
+            body = body[4 + length :]
+            if value_format is TEXT:
+                row.append(field.decode())
+            else:
+                row.append(np.frombuffer(field, dtype=value_format)[0].item())
+        rows.append(tuple(row))
+    return rows
+
+
+def test_rows_keep_their_order_and_missing_values_become_null():
+    data_frame = pd.DataFrame(
+        {
+            "unix_date_time": pd.array([86400, None, 0], dtype="Int32"),
+            "symbol": ["GOLD", None, "CRUDE_W"],
+            "price": [1.5, 2.0, float("nan")],
+            "sample_count": pd.array([3, 4, None], dtype="Int16"),
+        }
+    )
+    formats = (">i4", TEXT, ">f8", ">i2")
+
+    rows = _decode(BinaryCopyEncoder(formats).encode(data_frame), formats)
+
+    assert rows[:2] == [(86400, "GOLD", 1.5, 3), (None, None, 2.0, 4)]
+    assert rows[2][:2] == (0, "CRUDE_W") and rows[2][3] is None
+    assert np.isnan(rows[2][2])
+
+
+def test_texts_are_utf8_encoded():
+    data_frame = pd.DataFrame({"description": ["Zürich", "", "Zürich"]})
+
+    rows = _decode(BinaryCopyEncoder((TEXT,)).encode(data_frame), (TEXT,))
+
+    assert rows == [("Zürich",), ("",), ("Zürich",)]
+
+
+def test_empty_frames_encode_header_and_trailer_only():
+    data_frame = pd.DataFrame({"price": pd.Series([], dtype="float64")})
+
+    assert BinaryCopyEncoder((">f8",)).encode(data_frame) == (
+        PGCOPY_HEADER + PGCOPY_TRAILER
+    )
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_processing.errors import CarryComputationError
+from src.forecast.carry_forecast import compute_carry_forecast, contract_months
+
+
+def test_contract_months():
+    months = contract_months(pd.Series([20230300, 20240100]))
+    assert list(months) == [2023 * 12 + 3, 2024 * 12 + 1]
+
+
+def test_compute_carry_forecast(mock_dataframe_for_carry):
+    result = compute_carry_forecast(
+        mock_dataframe_for_carry,
+        vol_window=2,
+        vol_span=2,
+        smooth_span=2,
+        forecast_scalar=30,
+        forecast_cap=20,
+    )
+
+    # One point of backwardation over a quarter of a year
+    assert list(result["annualised_carry"]) == pytest.approx([4.0] * 4)
+    # The first row has no return, so it has no volatility either
+    assert np.isnan(result["raw_forecast"].iloc[0])
+    assert result["raw_forecast"].iloc[1] == pytest.approx(4.0 / 16.0)
+    assert result["forecast"].abs().max() <= 20
+
+
+def test_compute_carry_forecast_fail(mock_dataframe_for_symbol):
+    with pytest.raises(CarryComputationError):
+        compute_carry_forecast(
+            mock_dataframe_for_symbol,
+            vol_window=2,
+            vol_span=2,
+            smooth_span=2,
+            forecast_scalar=30,
+            forecast_cap=20,
+        )
@@ -0,0 +1,105 @@
+import pytest
+
+from src.db.schemas.analytics_schemas.daily_returns_schema import DailyReturnsSchema
+from src.db.schemas.columns import Column, Index, compile_table
+from src.db.schemas.config_schemas.instrument_config_schema import (
+    InstrumentConfigSchema,
+)
+from src.db.schemas.raw_data_schemas.multiple_prices_schema import MultiplePricesSchema
+
+
+def test_columns_compile_into_ddl_with_primary_key_and_indexes():
+    sql_command = DailyReturnsSchema().sql_command
+
+    assert sql_command.startswith("CREATE TABLE daily_returns (\n")
+    assert "    symbol VARCHAR(50),\n" in sql_command
+    assert "PRIMARY KEY (unix_date_time, symbol)\n)" in sql_command
+    assert sql_command.endswith(
+        ";\nCREATE INDEX daily_returns_symbol_time_idx "
+        "ON daily_returns (symbol, unix_date_time)"
+    )
+
+
+def test_plan_maps_source_headers_and_types_the_columns():
+    plan = MultiplePricesSchema().plan
+
+    assert plan.column_mapping["DATETIME"] == "unix_date_time"
+    assert plan.column_mapping["PRICE_CONTRACT"] == "price_contract"
+    assert "symbol" not in plan.column_mapping.values()
+    assert plan.copy_columns[:3] == ["unix_date_time", "symbol", "carry"]
+    assert plan.dtypes["unix_date_time"] == "Int32"
+    assert plan.dtypes["carry"] == "float64"
+    assert plan.dtypes["symbol"] == "str"
+    # Integers of source files are inferred, the files may hold empty cells
+    assert plan.source_dtypes == {
+        "CARRY": "float64",
+        "PRICE": "float64",
+        "FORWARD": "float64",
+    }
+
+
+def test_config_plan_reads_typed_source_columns():
+    plan = InstrumentConfigSchema().plan
+
+    assert plan.column_mapping["Instrument"] == "symbol"
+    assert plan.source_dtypes["Instrument"] == "str"
+    assert plan.source_dtypes["Pointsize"] == "float64"
+    assert "PerTrade" not in plan.source_dtypes
+
+
+def test_plans_are_compiled_once_per_table():
+    assert MultiplePricesSchema().plan is MultiplePricesSchema().plan
+
+
+def test_sort_key_and_the_index_leading_with_it():
+    schema = DailyReturnsSchema()
+
+    assert schema.sort_key == ["symbol", "unix_date_time"]
+    assert InstrumentConfigSchema().sort_key == ["symbol"]
+    assert schema.plan.leading_index(["symbol"]) == "daily_returns_symbol_time_idx"
+    assert schema.plan.leading_index(schema.sort_key) == (
+        "daily_returns_symbol_time_idx"
+    )
+    assert schema.plan.leading_index(["unix_date_time"]) is None
+    assert MultiplePricesSchema().plan.leading_index(["symbol"]) == (
+        "multiple_prices_symbol_time_idx"
+    )
+
+
+def test_unknown_sql_types_are_rejected():
+    with pytest.raises(ValueError, match="JSONB"):
+        compile_table("broken", (Column("payload", "JSONB"),))
+
+
+def test_index_names_default_to_the_columns():
+    assert Index(("symbol", "unix_date_time")).sql_command("prices") == (
+        "CREATE INDEX prices_symbol_unix_date_time_idx "
+        "ON prices (symbol, unix_date_time)"
+    )
+
+
+def test_covering_indexes_are_built_after_the_load():
+    plan = MultiplePricesSchema().plan
+
+    assert "INDEX" not in plan.sql_command
+    assert plan.load_index_commands() == [
+        "CREATE INDEX IF NOT EXISTS multiple_prices_symbol_time_idx "
+        "ON multiple_prices (symbol, unix_date_time) "
+        "INCLUDE (price, carry, price_contract, carry_contract)"
+    ]
+    assert plan.load_index_commands(concurrently=True)[0].startswith(
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS multiple_prices_symbol_time_idx"
+    )
+
+
+def test_brin_indexes_are_not_used_for_clustering():
+    plan = compile_table(
+        "ticks",
+        (Column("unix_date_time", "INTEGER"), Column("price", "FLOAT")),
+        (Index(("unix_date_time",), name="time_brin", method="brin"),),
+    )
+
+    assert plan.index_commands == [
+        "CREATE INDEX ticks_time_brin_idx ON ticks USING brin (unix_date_time)"
+    ]
+    assert plan.leading_index(["unix_date_time"]) is None
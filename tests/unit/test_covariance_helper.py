@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from src.data_processing.covariance_helper import (
+    EwmaCovarianceState,
+    compute_ewma_covariances,
+    covariance_to_correlation,
+    from_upper_triangle,
+    weekly_sample_positions,
+    weekly_sample_prices,
+)
+from src.db.errors import MatrixNotFoundError
+from src.db.stores.covariance_store import CovarianceStore
+
+DAY = 86400
+# Monday 2024-01-01
+MONDAY = 1704067200
+
+
+def test_weekly_sample_positions():
+    dates = np.array([MONDAY + day * DAY for day in [0, 4, 7, 11, 14]])
+    # The last week is incomplete and is not sampled
+    assert list(weekly_sample_positions(dates)) == [1, 3]
+
+
+def test_weekly_sample_prices_fill_within_week():
+    dates = np.array([MONDAY + day * DAY for day in [0, 4, 7, 11, 14]])
+    # GOLD has no price on the last trading date of the first week
+    prices = np.array(
+        [[1.0, 10.0], [2.0, np.nan], [3.0, np.nan], [4.0, np.nan], [5.0, 15.0]]
+    )
+
+    sample_dates, weekly = weekly_sample_prices(dates, prices)
+
+    assert list(sample_dates) == [dates[1], dates[3]]
+    np.testing.assert_array_equal(weekly, [[2.0, 10.0], [4.0, np.nan]])
+
+
+def test_compute_ewma_covariances_continues_from_state():
+    rng = np.random.default_rng(0)
+    prices = 100 + rng.normal(size=(12, 3)).cumsum(axis=0)
+    prices[:4, 2] = np.nan
+
+    full, _ = compute_ewma_covariances(prices, 4, EwmaCovarianceState.empty(3))
+    head, state = compute_ewma_covariances(prices[:7], 4, EwmaCovarianceState.empty(3))
+    tail, _ = compute_ewma_covariances(prices[7:], 4, state)
+
+    np.testing.assert_allclose(np.vstack([head, tail]), full)
+    # The instrument without prices has no covariance with the others yet
+    assert np.isnan(full[2][2])
+
+
+def test_covariance_to_correlation():
+    correlation = covariance_to_correlation(np.array([[4.0, 2.0], [2.0, 9.0]]))
+    np.testing.assert_allclose(correlation, [[1.0, 1 / 3], [1 / 3, 1.0]])
+
+
+def test_store_get_matrix(tmp_path):
+    prices = np.array([[100.0, 50.0], [101.0, 49.0], [99.0, 50.0], [100.0, 52.0]])
+    dates = np.array([MONDAY + week * 7 * DAY for week in range(4)])
+    store = CovarianceStore(str(tmp_path))
+    covariances, state = compute_ewma_covariances(
+        prices[:2], 4, EwmaCovarianceState.empty(2)
+    )
+    store.write(dates[:2], ["AEX", "GOLD"], covariances, state, 4)
+    covariances, state = compute_ewma_covariances(prices[2:], 4, store.load_state())
+    store.extend(dates[2:], covariances, state)
+
+    sample_date, symbols, matrix = store.get_matrix(dates[3] + DAY, "covariance")
+
+    assert sample_date == dates[3]
+    assert symbols == ["AEX", "GOLD"]
+    np.testing.assert_allclose(matrix, from_upper_triangle(covariances[-1], 2))
+    with pytest.raises(MatrixNotFoundError):
+        store.get_matrix(dates[0] - DAY)
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from src.jobs.dag import Dag
+
+
+def _task(name, log, delay=0.0, error=None):
+    async def run():
+        log.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        log.append(f"end:{name}")
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_tasks_run_after_their_dependencies():
+    log = []
+    dag = Dag()
+    dag.add("reset", _task("reset", log, 0.02))
+    dag.add("parse", _task("parse", log, 0.01))
+    dag.add("ddl", _task("ddl", log), depends_on=["reset"])
+    dag.add("seed", _task("seed", log), depends_on=["ddl", "parse"])
+
+    await dag.run_async()
+
+    # Independent tasks start together
+    assert log[:2] == ["start:reset", "start:parse"]
+    assert log.index("start:ddl") > log.index("end:reset")
+    assert log.index("start:seed") > log.index("end:ddl")
+    assert log.index("start:seed") > log.index("end:parse")
+    assert set(dag.durations) == {"reset", "parse", "ddl", "seed"}
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_remaining_tasks():
+    log = []
+    dag = Dag()
+    dag.add("parse", _task("parse", log, error=ValueError("broken file")))
+    dag.add("slow", _task("slow", log, 1.0))
+    dag.add("seed", _task("seed", log), depends_on=["parse"])
+
+    with pytest.raises(ValueError):
+        await dag.run_async()
+
+    assert "end:slow" not in log
+    assert "start:seed" not in log
+
+
+def test_dependencies_must_exist():
+    dag = Dag()
+    with pytest.raises(ValueError):
+        dag.add("seed", _task("seed", []), depends_on=["parse"])
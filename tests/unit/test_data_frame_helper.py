@@ -4,19 +4,25 @@ import pytest
 from src.data_processing.data_frame_helper import (
     add_symbol_by_file_name,
     aggregate_to_day_based_prices,
+    build_daily_bars,
+    build_price_rollups,
     convert_column_to_datetime,
     convert_datetime_to_unixtime,
+    daily_bars_to_prices,
     fill_empty_values,
     rename_columns,
+    sort_rows,
 )
 from src.data_processing.errors import (
     ColumnRenameError,
     DataAggregationError,
+    DataRollupError,
     DateTimeConversionError,
     EmptyValueFillError,
     InvalidDatetimeColumnError,
     SymbolAdditionError,
 )
+from src.monitoring.metrics import STAGE_SECONDS
 
 
 # Mock logger for testing
@@ -97,6 +103,20 @@ def test_aggregate_to_day_based_prices_success(
     assert all(result["price"].apply(lambda x: x == round(x, 1)))
 
 
+def test_aggregate_does_not_time_its_datetime_conversion(
+    mock_dataframe_for_aggregation_success,
+):
+    conversions = STAGE_SECONDS.count(stage="convert_datetime")
+    aggregations = STAGE_SECONDS.count(stage="aggregate")
+
+    aggregate_to_day_based_prices(mock_dataframe_for_aggregation_success)
+    build_daily_bars(mock_dataframe_for_aggregation_success)
+
+    # The benchmark sums both stages, nested timings would count the conversion twice
+    assert STAGE_SECONDS.count(stage="convert_datetime") == conversions
+    assert STAGE_SECONDS.count(stage="aggregate") == aggregations + 2
+
+
 # Test for failed data aggregation
 def test_aggregate_to_day_based_prices_fail(mock_dataframe_for_aggregation_fail):
     with pytest.raises(DataAggregationError):
@@ -115,3 +135,66 @@ def test_convert_column_to_datetime_success(mock_dataframe_for_datetime_success)
 def test_convert_column_to_datetime_fail(mock_dataframe_for_datetime_fail):
     with pytest.raises(InvalidDatetimeColumnError):
         convert_column_to_datetime(mock_dataframe_for_datetime_fail, "datetime_column")
+
+
+# Test for rolling intraday prices up to daily, weekly and monthly bars
+def test_build_price_rollups(mock_dataframe_for_rollups):
+    rollups = build_price_rollups(
+        mock_dataframe_for_rollups, ["daily", "weekly", "monthly"]
+    )
+
+    daily = rollups["daily"]
+    assert list(daily["unix_date_time"]) == list(
+        pd.to_datetime(["2024-01-29", "2024-01-31", "2024-02-05"])
+    )
+    assert list(daily.iloc[0][["open", "high", "low", "close", "mean"]]) == [
+        1.0,
+        3.0,
+        1.0,
+        3.0,
+        2.0,
+    ]
+
+    weekly = rollups["weekly"]
+    assert list(weekly["unix_date_time"]) == list(
+        pd.to_datetime(["2024-01-29", "2024-02-05"])
+    )
+    assert list(weekly["sample_count"]) == [3, 1]
+    assert weekly["mean"].iloc[0] == 2.0
+
+    monthly = rollups["monthly"]
+    assert list(monthly["unix_date_time"]) == list(
+        pd.to_datetime(["2024-01-01", "2024-02-01"])
+    )
+    assert list(monthly["close"]) == [2.0, 6.0]
+
+
+def test_daily_bars_to_prices_matches_aggregation(mock_dataframe_for_rollups):
+    prices = daily_bars_to_prices(build_daily_bars(mock_dataframe_for_rollups))
+
+    pd.testing.assert_frame_equal(
+        prices, aggregate_to_day_based_prices(mock_dataframe_for_rollups)
+    )
+
+
+# Test for failed rollup (non-numeric 'price')
+def test_build_price_rollups_fail(mock_dataframe_for_aggregation_fail):
+    with pytest.raises(DataRollupError):
+        build_price_rollups(mock_dataframe_for_aggregation_fail, ["daily"])
+
+
+def test_sort_rows_orders_by_symbol_then_time():
+    data_frame = pd.DataFrame(
+        {
+            "unix_date_time": [2, 1, 1, 2],
+            "symbol": ["GOLD", "GOLD", "AEX", "AEX"],
+            "price": [4.0, 3.0, 1.0, 2.0],
+        },
+        index=[10, 11, 12, 13],
+    )
+
+    sorted_rows = sort_rows(data_frame, ["symbol", "unix_date_time"])
+
+    assert sorted_rows["price"].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert sorted_rows.index.tolist() == [0, 1, 2, 3]
+    assert sort_rows(data_frame, []) is data_frame
@@ -0,0 +1,37 @@
+import os
+
+import pandas as pd
+
+from benchmarks.data_generator import contract_dates, generate_dataset
+from src.core.config import settings
+from src.db.schemas.schemas import get_configs_schemas, get_raw_data_schemas
+
+
+def test_generated_tree_matches_the_schemas(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "source_data_path", str(tmp_path))
+
+    rows = generate_dataset(str(tmp_path), instruments=3, years=1, bars_per_day=2)
+
+    for schema in get_configs_schemas():
+        data_frame = pd.read_csv(schema.origin_csv_file_path)
+        assert set(schema.column_mapping) <= set(data_frame.columns)
+        assert len(data_frame) == rows[schema.table_name] == 3
+    for schema in get_raw_data_schemas():
+        files = os.listdir(schema.origin_csv_file_path)
+        data_frames = [
+            pd.read_csv(os.path.join(schema.origin_csv_file_path, name))
+            for name in files
+        ]
+        assert all(
+            set(schema.column_mapping) <= set(data_frame.columns)
+            for data_frame in data_frames
+        )
+        assert sum(map(len, data_frames)) == rows[schema.table_name]
+    assert rows["adjusted_prices"] == 3 * 260 * 2
+
+
+def test_contracts_roll_quarterly():
+    times = pd.DatetimeIndex(["2023-01-15", "2023-03-31", "2023-04-01", "2023-12-01"])
+
+    assert list(contract_dates(times)) == [20230300, 20230300, 20230600, 20231200]
+    assert list(contract_dates(times, 3)) == [20230600, 20230600, 20230900, 20240300]
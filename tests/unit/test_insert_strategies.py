@@ -0,0 +1,53 @@
+import struct
+
+import pandas as pd
+
+from benchmarks.insert_strategies import encode_binary_copy, synthetic_prices
+from src.data_processing.binary_copy import PGCOPY_HEADER, PGCOPY_TRAILER
+
+
+def _decode(payload):
+    assert payload.startswith(PGCOPY_HEADER)
+    assert payload.endswith(PGCOPY_TRAILER)
+    body, rows = payload[len(PGCOPY_HEADER) : -len(PGCOPY_TRAILER)], []
+    while body:
+        (field_count,) = struct.unpack(">h", body[:2])
+        body, fields = body[2:], []
+        for _ in range(field_count):
+            (length,) = struct.unpack(">i", body[:4])
+            fields.append(body[4 : 4 + length])
+            body = body[4 + length :]
+        rows.append(
+            (
+                struct.unpack(">i", fields[0])[0],
+                fields[1].decode(),
+                struct.unpack(">d", fields[2])[0],
+            )
+        )
+    return rows
+
+
+def test_binary_copy_round_trips_rows_with_text_of_several_lengths():
+    data_frame = pd.DataFrame(
+        {
+            "unix_date_time": [86400, 0, 172800],
+            "symbol": ["GOLD", "AEX", "CRUDE_W"],
+            "price": [1.5, 10.0, float("nan")],
+        }
+    )
+
+    rows = sorted(_decode(encode_binary_copy(data_frame)), key=lambda row: row[1])
+
+    assert [row[:2] for row in rows] == [
+        (0, "AEX"),
+        (172800, "CRUDE_W"),
+        (86400, "GOLD"),
+    ]
+    assert rows[0][2] == 10.0 and rows[2][2] == 1.5
+
+
+def test_synthetic_prices_are_unique_per_date_and_symbol():
+    data_frame = synthetic_prices(1000, symbols=30)
+
+    assert len(data_frame) == 1000
+    assert not data_frame.duplicated(["unix_date_time", "symbol"]).any()
@@ -0,0 +1,134 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.jobs import progress
+from src.jobs.errors import JobNotFoundError
+from src.jobs.events import ThroughputSampler
+from src.jobs.job import JobStatus
+from src.jobs.job_manager import JobManager
+
+
+def _parse_files(file_count):
+    with progress.schema_scope("adjusted_prices"):
+        progress.report_files_total(file_count)
+        for _ in range(file_count):
+            progress.check_cancelled()
+            progress.report_file_done(rows=10, bytes_read=100)
+
+
+@pytest.mark.asyncio
+async def test_sync_job_reports_progress():
+    manager = JobManager(max_concurrent_jobs=1, history_size=10)
+    job = manager.submit("parse_files", _parse_files, 3)
+    assert job.status == JobStatus.QUEUED
+
+    await manager.wait(job.id)
+
+    assert job.status == JobStatus.SUCCEEDED
+    schema_progress = job.to_dict()["progress"]["adjusted_prices"]
+    assert schema_progress["files_done"] == 3
+    assert schema_progress["rows_done"] == 30
+    assert schema_progress["bytes_done"] == 300
+    assert schema_progress["eta_seconds"] == 0
+    assert job.to_dict()["result"] is None
+
+
+@pytest.mark.asyncio
+async def test_job_keeps_the_result_of_its_task():
+    manager = JobManager(max_concurrent_jobs=1, history_size=10)
+
+    async def rebuild():
+        return {"ddl:fx_prices": 0.5, "seed:fx_prices": 2.0}
+
+    job = manager.submit("rebuild", rebuild)
+    await manager.wait(job.id)
+
+    assert job.to_dict()["result"] == {"ddl:fx_prices": 0.5, "seed:fx_prices": 2.0}
+
+
+@pytest.mark.asyncio
+async def test_cancel_async_job():
+    manager = JobManager(max_concurrent_jobs=1, history_size=10)
+    started = asyncio.Event()
+
+    async def copy_rows():
+        started.set()
+        await asyncio.sleep(60)
+
+    job = manager.submit("seed_db", copy_rows)
+    await started.wait()
+    manager.cancel(job.id)
+    await manager.wait(job.id)
+
+    assert job.status == JobStatus.CANCELLED
+
+
+@pytest.mark.asyncio
+async def test_job_finishing_after_a_cancel_request_succeeds():
+    manager = JobManager(max_concurrent_jobs=1, history_size=10)
+    started, proceed = threading.Event(), threading.Event()
+
+    def copy_rows():
+        # Commits all rows without reaching a checkpoint
+        started.set()
+        proceed.wait(5)
+
+    job = manager.submit("seed_db", copy_rows)
+    await asyncio.to_thread(started.wait, 5)
+    manager.cancel(job.id)
+    proceed.set()
+    await manager.wait(job.id)
+
+    assert job.cancel_requested
+    assert job.status == JobStatus.SUCCEEDED
+
+
+@pytest.mark.asyncio
+async def test_failed_job_and_unknown_id():
+    manager = JobManager(max_concurrent_jobs=1, history_size=10)
+
+    async def fail():
+        raise ValueError("broken file")
+
+    job = manager.submit("seed_db", fail)
+    await manager.wait(job.id)
+
+    assert job.status == JobStatus.FAILED
+    assert job.error == "broken file"
+    with pytest.raises(JobNotFoundError):
+        manager.get("unknown")
+
+
+@pytest.mark.asyncio
+async def test_throughput_sampler_reports_rates():
+    manager = JobManager(max_concurrent_jobs=1, history_size=10)
+    proceed = asyncio.Event()
+
+    async def copy_rows():
+        with progress.schema_scope("adjusted_prices"):
+            progress.report_rows_total(100)
+            progress.report_rows_copied(40, bytes_copied=2048)
+            await proceed.wait()
+            progress.report_rows_copied(60, bytes_copied=3072)
+
+    job = manager.submit("seed_db", copy_rows)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    sampler = ThroughputSampler()
+
+    running = sampler.sample(manager.list())
+    proceed.set()
+    await manager.wait(job.id)
+    finished = sampler.sample(manager.list())
+
+    schema = running["jobs"][0]["schemas"]["adjusted_prices"]
+    assert running["running_jobs"] == 1
+    assert schema["completion"] == 0.4
+    assert schema["rows_per_second"] > 0
+    # Bytes count as the COPY progresses, not when the file was read
+    assert schema["mb_per_second"] > 0
+    assert finished["jobs"][0]["schemas"]["adjusted_prices"]["mb_per_second"] > 0
+    assert finished["jobs"][0]["schemas"]["adjusted_prices"]["completion"] == 1.0
+    assert sampler.sample(manager.list())["jobs"] == []
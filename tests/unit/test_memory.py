@@ -0,0 +1,67 @@
+import tracemalloc
+
+import numpy as np
+
+from src.monitoring.memory import MemoryTracker
+from src.monitoring.tracing import span
+
+
+def _allocate(megabytes):
+    return np.ones(megabytes * 2**20, dtype=np.uint8)
+
+
+def test_tracker_records_peaks_and_sites_per_stage_and_schema():
+    tracker = MemoryTracker(enabled=True, top_sites=5)
+    try:
+        with span("schema", schema="multiple_prices"):
+            with tracker.track("load_csv"):
+                kept = _allocate(4)
+                with tracker.track("rename_columns"):
+                    _allocate(8)
+            with tracker.track("load_csv"):
+                _allocate(1)
+    finally:
+        tracker.disable()
+
+    load_csv, rename_columns = (
+        tracker.report(stage="load_csv")[0],
+        tracker.report(stage="rename_columns")[0],
+    )
+    assert load_csv["schema"] == "multiple_prices"
+    assert load_csv["runs"] == 2
+    # The nested stage's temporary array counts towards the enclosing stage's peak
+    assert load_csv["peak_bytes"] >= 12 * 2**20
+    assert 4 * 2**20 <= load_csv["retained_bytes"] < 5 * 2**20
+    assert 8 * 2**20 <= rename_columns["peak_bytes"] < 9 * 2**20
+    assert load_csv["top_allocations"][0]["size_bytes"] >= 4 * 2**20
+    assert load_csv["top_allocations"][0]["site"].count(":") == 1
+    assert [result["stage"] for result in tracker.report()] == [
+        "load_csv",
+        "rename_columns",
+    ]
+    assert len(kept) == 4 * 2**20
+    assert not tracemalloc.is_tracing()
+
+
+def test_disabled_tracker_records_nothing():
+    tracker = MemoryTracker()
+
+    with tracker.track("load_csv"):
+        _allocate(1)
+
+    assert tracker.report() == []
+    assert not tracker.enabled
+
+
+def test_reset_forgets_results():
+    tracker = MemoryTracker(enabled=True, top_sites=0)
+    try:
+        with tracker.track("copy"):
+            _allocate(1)
+    finally:
+        tracker.disable()
+
+    assert tracker.report()[0]["schema"] == "unknown"
+    assert tracker.report()[0]["top_allocations"] == []
+    tracker.reset()
+    assert tracker.report() == []
@@ -0,0 +1,35 @@
+import pytest
+
+from src.monitoring.metrics import Counter, Histogram, render_metrics, timed
+
+
+def test_histogram_render():
+    histogram = Histogram("stage_seconds", "Stage duration.", ("stage",), (0.1, 1.0))
+    histogram.observe(0.05, stage="load_csv")
+    histogram.observe(0.5, stage="load_csv")
+
+    lines = histogram.render()
+
+    assert 'stage_seconds_bucket{stage="load_csv",le="0.1"} 1' in lines
+    assert 'stage_seconds_bucket{stage="load_csv",le="+Inf"} 2' in lines
+    assert 'stage_seconds_count{stage="load_csv"} 2' in lines
+
+
+def test_counter_escapes_labels():
+    counter = Counter("rows_total", "Rows.", ("schema",))
+    counter.inc(3, schema='a"b')
+
+    assert 'rows_total{schema="a\\"b"} 3' in counter.render()
+
+
+def test_timed_records_errors():
+    @timed("test_failing_stage")
+    def fail():
+        raise ValueError("broken")
+
+    with pytest.raises(ValueError):
+        fail()
+
+    text = render_metrics()
+    assert 'pipeline_stage_seconds_count{stage="test_failing_stage"} 1' in text
+    assert 'pipeline_stage_errors_total{stage="test_failing_stage"} 1' in text
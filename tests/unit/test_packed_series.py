@@ -0,0 +1,100 @@
+import math
+import struct
+
+import numpy as np
+import pytest
+
+from src.core.config import settings
+from src.db.repositories.packed_series_repository import PackedSeriesRepository
+from src.db.schemas.packed_series import (
+    decode_array,
+    pack_sql_command,
+    packed_sql_command,
+    uses_packed_series,
+)
+from src.db.schemas.raw_data_schemas.adjusted_prices_schema import AdjustedPricesSchema
+from src.handlers.errors import UnknownSchemaError
+from src.handlers.packed_series_handler import PackedSeriesHandler
+
+
+def _array_send(element_type, value_format, values):
+    # The binary format of a one-dimensional array as produced by 'array_send'
+    has_nulls = int(any(value is None for value in values))
+    data = struct.pack(">iiiii", 1, has_nulls, element_type, len(values), 1)
+    for value in values:
+        if value is None:
+            data += struct.pack(">i", -1)
+        else:
+            data += struct.pack(">i", struct.calcsize(value_format))
+            data += struct.pack(value_format, value)
+    return data
+
+
+def test_packed_table_holds_arrays_per_symbol_and_year(monkeypatch):
+    monkeypatch.setattr(settings, "packed_series", True)
+
+    assert uses_packed_series("adjusted_prices")
+    assert not uses_packed_series("daily_returns")
+    assert packed_sql_command(AdjustedPricesSchema()) == (
+        "CREATE TABLE adjusted_prices_packed (\n"
+        "    symbol VARCHAR(50),\n"
+        "    year SMALLINT,\n"
+        "    unix_date_time INTEGER[],\n"
+        "    price FLOAT[],\n"
+        "    PRIMARY KEY (symbol, year)\n"
+        ")"
+    )
+
+
+def test_packing_aggregates_in_time_order():
+    sql_command = pack_sql_command(AdjustedPricesSchema(), filtered=True)
+
+    assert sql_command.startswith(
+        "INSERT INTO adjusted_prices_packed (symbol, year, unix_date_time, price) "
+    )
+    assert "array_agg(price ORDER BY unix_date_time)" in sql_command
+    assert sql_command.endswith(
+        "FROM adjusted_prices WHERE symbol = ANY($1::text[]) GROUP BY symbol, year"
+    )
+
+
+def test_decode_array_reads_binary_arrays_into_numpy():
+    prices = decode_array(_array_send(701, ">d", [1.5, float("nan"), -2.0]))
+    times = decode_array(_array_send(23, ">i", [0, 86400]))
+
+    assert prices.dtype == "float64" and prices.dtype.isnative
+    assert prices[0] == 1.5 and math.isnan(prices[1]) and prices[2] == -2.0
+    assert times.dtype == "int32" and times.tolist() == [0, 86400]
+
+
+def test_decode_array_turns_null_elements_into_nan():
+    contracts = decode_array(_array_send(23, ">i", [20230300, None]))
+
+    assert contracts[0] == 20230300 and math.isnan(contracts[1])
+
+
+def test_decode_array_of_an_empty_array():
+    assert len(decode_array(struct.pack(">iii", 0, 0, 701))) == 0
+
+
+@pytest.mark.asyncio
+async def test_handler_reads_packed_history_as_lists(monkeypatch):
+    monkeypatch.setattr(settings, "packed_series", True)
+    reads = []
+
+    async def read(self, schema, symbol, columns=None):
+        reads.append((schema.table_name, symbol, columns))
+        return {
+            "unix_date_time": np.array([0, 86400], dtype="int32"),
+            "price": np.array([1.5, np.nan]),
+        }
+
+    monkeypatch.setattr(PackedSeriesRepository, "read_async", read)
+    handler = PackedSeriesHandler("postgresql://unused")
+
+    series = await handler.read_series_async("adjusted_prices", "GOLD", ["price"])
+
+    assert reads == [("adjusted_prices", "GOLD", ["price"])]
+    assert series == {"unix_date_time": [0, 86400], "price": [1.5, None]}
+    with pytest.raises(UnknownSchemaError):
+        await handler.read_series_async("daily_returns", "GOLD")
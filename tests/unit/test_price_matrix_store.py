@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from src.data_processing.errors import MatrixPivotError
+from src.data_processing.matrix_helper import pivot_to_matrices
+from src.db.errors import MatrixNotFoundError
+from src.db.stores.price_matrix_store import PriceMatrixStore
+
+
+def test_pivot_to_matrices(mock_dataframe_for_matrix):
+    dates, symbols, matrices = pivot_to_matrices(mock_dataframe_for_matrix, ["price"])
+
+    assert list(dates) == [0, 86400, 172800]
+    assert symbols == ["AEX", "GOLD"]
+    np.testing.assert_array_equal(
+        matrices["price"], [[10.0, 1.0], [np.nan, 2.0], [12.0, np.nan]]
+    )
+
+
+def test_pivot_to_matrices_fail(mock_dataframe_for_matrix):
+    with pytest.raises(MatrixPivotError):
+        pivot_to_matrices(mock_dataframe_for_matrix, ["price"], symbols=["AEX"])
+
+
+def test_store_write_extend_and_open(tmp_path, mock_dataframe_for_matrix):
+    store = PriceMatrixStore(str(tmp_path))
+    assert store.last_date("adjusted_prices") is None
+
+    dates, symbols, matrices = pivot_to_matrices(mock_dataframe_for_matrix, ["price"])
+    store.write("adjusted_prices", dates, symbols, matrices)
+    store.extend("adjusted_prices", np.array([259200]), {"price": [[13.0, 3.0]]})
+
+    prices = store.open("adjusted_prices", "price")
+    assert isinstance(prices.values, np.memmap)
+    assert store.last_date("adjusted_prices") == 259200
+    np.testing.assert_array_equal(prices.series("GOLD"), [1.0, 2.0, np.nan, 3.0])
+    np.testing.assert_array_equal(prices.row(259200), [13.0, 3.0])
+    with pytest.raises(MatrixNotFoundError):
+        store.open("adjusted_prices", "carry")
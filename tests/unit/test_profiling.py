@@ -0,0 +1,78 @@
+import pytest
+
+from src.monitoring.errors import ProfileNotFoundError, ProfilingBusyError
+from src.monitoring.profiling import (
+    ProfileStore,
+    is_profiling_requested,
+    maybe_profiled,
+    profile_run,
+    request_profile,
+    to_thread,
+)
+
+
+def _parse():
+    return sum(range(1000))
+
+
+def test_is_profiling_requested():
+    assert is_profiling_requested({"x-profile": "true"}, {})
+    assert is_profiling_requested({}, {"profile": "1"})
+    assert not is_profiling_requested({}, {})
+
+
+def test_maybe_profiled_is_noop_without_request():
+    assert maybe_profiled(_parse, "parse") is _parse
+
+
+def test_profile_run_stores_artifacts(tmp_path, mocker):
+    store = ProfileStore(str(tmp_path), retention=1)
+    mocker.patch("src.monitoring.profiling.profile_store", store)
+
+    with request_profile() as profile_id:
+        assert maybe_profiled(_parse, "parse")() == _parse()
+    with profile_run("second", "parse"):
+        _parse()
+
+    # Only the most recent profile is retained
+    assert [meta["id"] for meta in store.list()] == ["second"]
+    assert "_parse" in open(store.artifact_path("second", "summary.txt")).read()
+    with pytest.raises(ProfileNotFoundError):
+        store.get(profile_id)
+    with pytest.raises(ProfileNotFoundError):
+        store.artifact_path("second", "meta.json")
+
+
+def _parse_in_thread():
+    return sum(range(1000))
+
+
+@pytest.mark.asyncio
+async def test_profile_includes_worker_threads(tmp_path, mocker):
+    store = ProfileStore(str(tmp_path), retention=1)
+    mocker.patch("src.monitoring.profiling.profile_store", store)
+
+    async def seed():
+        return await to_thread(_parse_in_thread)
+
+    with request_profile() as profile_id:
+        assert await maybe_profiled(seed, "seed")() == _parse_in_thread()
+
+    summary = open(store.artifact_path(profile_id, "summary.txt")).read()
+    assert "_parse_in_thread" in summary
+
+
+def test_concurrent_profile_runs_are_rejected(tmp_path, mocker):
+    mocker.patch(
+        "src.monitoring.profiling.profile_store",
+        ProfileStore(str(tmp_path), retention=2),
+    )
+
+    with profile_run("first", "parse"):
+        with pytest.raises(ProfilingBusyError):
+            with profile_run("second", "parse"):
+                pass
+
+    # The slot is free again once the first run is stored
+    with profile_run("third", "parse"):
+        _parse()
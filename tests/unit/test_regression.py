@@ -0,0 +1,69 @@
+from benchmarks.regression import compare_summaries, summarize, summarize_runs
+
+
+def _report(seconds, rows_per_second, rss):
+    return {
+        "processing_wall_seconds": seconds,
+        "copy_wall_seconds": None,
+        "peak_rss_mb": rss,
+        "stages": {
+            "parse": {
+                "seconds": seconds,
+                "rows": 1000,
+                "rows_per_second": rows_per_second,
+                "peak_rss_mb": rss,
+            }
+        },
+    }
+
+
+def _finding(findings, name, metric):
+    return next(
+        finding
+        for finding in findings
+        if finding["name"] == name and finding["metric"] == metric
+    )
+
+
+def test_summarize_uses_median_and_median_absolute_deviation():
+    summary = summarize([1.0, 2.0, 100.0, None])
+
+    assert summary["median"] == 2.0
+    assert summary["mad"] == 1.0
+    assert (summary["min"], summary["max"]) == (1.0, 100.0)
+    assert summarize([None]) is None
+
+
+def test_compare_flags_slower_stages_and_lower_throughput():
+    baseline = summarize_runs([_report(1.0, 1000, 100), _report(1.02, 980, 100)])
+    current = summarize_runs([_report(1.5, 660, 100), _report(1.52, 650, 100)])
+
+    findings = compare_summaries(baseline, current, threshold=0.1)
+
+    assert _finding(findings, "parse", "seconds")["status"] == "regression"
+    assert _finding(findings, "parse", "rows_per_second")["status"] == "regression"
+    assert _finding(findings, "parse", "peak_rss_mb")["status"] == "ok"
+    assert not [f for f in findings if f["metric"] == "copy_wall_seconds"]
+
+
+def test_compare_reports_improvements():
+    baseline = summarize_runs([_report(2.0, 500, 200)])
+    current = summarize_runs([_report(1.0, 1000, 100)])
+
+    findings = compare_summaries(baseline, current, threshold=0.1)
+
+    assert {finding["status"] for finding in findings} == {"improvement"}
+
+
+def test_compare_ignores_changes_within_noise():
+    baseline = summarize_runs(
+        [_report(seconds, 1000, 100) for seconds in (1.0, 1.3, 0.8, 1.2, 0.9)]
+    )
+    current = summarize_runs(
+        [_report(seconds, 1000, 100) for seconds in (1.2, 1.5, 0.9, 1.4, 1.0)]
+    )
+
+    findings = compare_summaries(baseline, current, threshold=0.1, noise_factor=3.0)
+
+    assert _finding(findings, "parse", "seconds")["change"] > 0.1
+    assert _finding(findings, "parse", "seconds")["status"] == "ok"
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_processing.errors import ReturnsComputationError
+from src.data_processing.returns_helper import compute_returns, compute_volatility
+
+
+def test_compute_returns(mock_dataframe_for_returns):
+    result = compute_returns(mock_dataframe_for_returns)
+
+    assert list(result["symbol"]) == ["AEX", "AEX", "GOLD", "GOLD"]
+    assert list(result["unix_date_time"]) == [2, 3, 2, 3]
+    assert list(result["price_return"]) == [1.0, 1.0, -100.0, 5.0]
+    assert result["percentage_return"].iloc[0] == pytest.approx(0.1)
+    # Return from a zero price is undefined
+    assert np.isnan(result["percentage_return"].iloc[3])
+
+
+def test_compute_returns_fail(mock_dataframe_for_symbol):
+    with pytest.raises(ReturnsComputationError):
+        compute_returns(mock_dataframe_for_symbol)
+
+
+def test_compute_volatility(mock_dataframe_for_returns):
+    returns = compute_returns(mock_dataframe_for_returns)
+    result = compute_volatility(returns, window=2, span=3)
+
+    assert list(result.columns) == [
+        "unix_date_time",
+        "symbol",
+        "rolling_vol",
+        "ewma_vol",
+    ]
+    assert np.isnan(result["rolling_vol"].iloc[0])
+    assert result["rolling_vol"].iloc[1] == pytest.approx(0.0)
+    assert result["ewma_vol"].iloc[0] == pytest.approx(1.0)
+
+
+def test_compute_volatility_continues_from_seeds():
+    returns = pd.DataFrame(
+        {
+            "unix_date_time": [1, 2, 3, 4],
+            "symbol": ["AEX"] * 4,
+            "price_return": [1.0, -2.0, 3.0, -1.0],
+        }
+    )
+    full = compute_volatility(returns, window=2, span=3)
+    seeds = full[full["unix_date_time"] == 2][["symbol", "unix_date_time", "ewma_vol"]]
+
+    tail = compute_volatility(returns, window=2, span=3, seeds=seeds)
+
+    assert list(tail["unix_date_time"]) == [3, 4]
+    pd.testing.assert_frame_equal(
+        tail, full[full["unix_date_time"] > 2].reset_index(drop=True)
+    )
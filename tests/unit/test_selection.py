@@ -0,0 +1,43 @@
+import pandas as pd
+
+from src.core.selection import matches_any, select_names
+from src.data_processing.data_frame_helper import filter_symbols
+from src.db.schemas.raw_data_schemas.adjusted_prices_schema import AdjustedPricesSchema
+from src.db.schemas.raw_data_schemas.fx_prices_schema import FxPricesSchema
+from src.db.schemas.rollup_schemas.price_rollup_schema import PriceRollupSchema
+from src.db.schemas.schemas import select_schemas
+
+
+def test_empty_filter_selects_everything():
+    assert matches_any("GOLD")
+    assert select_names(["GOLD", "SILVER"], []) == ["GOLD", "SILVER"]
+
+
+def test_glob_patterns_select_names():
+    names = ["GOLD", "GOLD_micro", "SILVER", "EUR"]
+    assert select_names(names, ["GOLD*"]) == ["GOLD", "GOLD_micro"]
+    assert select_names(names, ["EUR", "SILV?R"]) == ["SILVER", "EUR"]
+    # Symbols are case sensitive
+    assert not matches_any("gold", ["GOLD"])
+
+
+def test_select_schemas_includes_rollups_of_selected_raw_data():
+    adjusted_prices = AdjustedPricesSchema()
+    weekly = PriceRollupSchema(adjusted_prices, "weekly")
+    schemas = [adjusted_prices, FxPricesSchema(), weekly]
+
+    selected = select_schemas(schemas, ["adjusted_prices"])
+
+    assert selected == [adjusted_prices, weekly]
+    assert select_schemas(schemas, ["*_weekly_ohlc"]) == [weekly]
+
+
+def test_filter_symbols_keeps_matching_rows():
+    data_frame = pd.DataFrame(
+        {"symbol": ["GOLD", "SILVER", "GOLD"], "price": [1, 2, 3]}
+    )
+
+    filtered = filter_symbols(data_frame, ["GOLD"])
+
+    assert filtered["price"].tolist() == [1, 3]
+    assert filter_symbols(data_frame, None) is data_frame
@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from src.core.config import settings
+from src.db.repositories.data_loader import DataLoader
+from src.db.schemas.raw_data_schemas.multiple_prices_schema import MultiplePricesSchema
+from src.db.schemas.schemas import get_view_schemas
+from src.db.schemas.view_schemas.latest_values_view_schema import LatestValuesViewSchema
+from src.handlers.errors import UnknownSchemaError
+from src.handlers.snapshot_handler import SnapshotHandler
+
+
+def test_views_are_defined_per_raw_data_table(monkeypatch):
+    monkeypatch.setattr(settings, "snapshot_views", True)
+
+    names = [view.view_name for view in get_view_schemas()]
+
+    assert "multiple_prices_latest" in names
+    assert "adjusted_prices_summary" in names
+    assert len(names) == 8
+    monkeypatch.setattr(settings, "snapshot_views", False)
+    assert get_view_schemas() == []
+
+
+def test_latest_view_is_keyed_by_symbol_for_concurrent_refreshes():
+    view = LatestValuesViewSchema(MultiplePricesSchema())
+
+    assert view.sql_command == (
+        "CREATE MATERIALIZED VIEW multiple_prices_latest AS "
+        "SELECT DISTINCT ON (symbol) unix_date_time, symbol, carry, carry_contract, "
+        "price, price_contract, forward, forward_contract FROM multiple_prices "
+        "ORDER BY symbol, unix_date_time DESC;\n"
+        "CREATE UNIQUE INDEX multiple_prices_latest_key_idx "
+        "ON multiple_prices_latest (symbol)"
+    )
+    assert view.refresh_command == (
+        "REFRESH MATERIALIZED VIEW CONCURRENTLY multiple_prices_latest"
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_handler_reads_a_view_and_filters_symbols(monkeypatch):
+    monkeypatch.setattr(settings, "snapshot_views", True)
+    queries = []
+
+    async def fetch(self, sql_template, parameters):
+        queries.append(sql_template)
+        return pd.DataFrame(
+            {
+                "symbol": ["AEX", "GOLD", "GOLDM"],
+                "unix_date_time": [1, 2, 3],
+                "price": [1.5, float("nan"), 2.5],
+            }
+        )
+
+    monkeypatch.setattr(DataLoader, "fetch_data_as_dataframe_async", fetch)
+    handler = SnapshotHandler("postgresql://unused")
+
+    rows = await handler.read_snapshot_async("adjusted_prices", "latest", ["GOLD*"])
+
+    assert queries == ["SELECT * FROM adjusted_prices_latest ORDER BY symbol"]
+    assert rows == [
+        {"symbol": "GOLD", "unix_date_time": 2, "price": None},
+        {"symbol": "GOLDM", "unix_date_time": 3, "price": 2.5},
+    ]
+    with pytest.raises(UnknownSchemaError):
+        await handler.read_snapshot_async("spread_cost", "latest")
@@ -0,0 +1,28 @@
+from benchmarks.startup import HEAVY_MODULES, measure_startup
+from src.api.dependencies import HandlerRegistry
+
+
+def test_startup_does_not_load_heavy_modules():
+    result = measure_startup()
+
+    assert result["heavy_modules"] == []
+    # Generous bound, a regression to eager imports takes several times longer
+    assert result["startup_ms"] < 5000
+    assert "pandas" in HEAVY_MODULES
+
+
+def test_handlers_are_created_on_first_use():
+    created = []
+
+    def factory():
+        created.append("seed_db")
+        return object()
+
+    registry = HandlerRegistry({"seed_db": factory})
+    assert registry.created == []
+
+    first = registry.get("seed_db")
+
+    assert registry.get("seed_db") is first
+    assert created == ["seed_db"]
+    assert registry.created == ["seed_db"]
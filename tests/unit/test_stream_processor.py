@@ -0,0 +1,88 @@
+import gzip
+
+import pandas as pd
+import pytest
+
+from src.data_processing.data_preprocessor import load_and_process_raw_data_csv
+from src.data_processing.errors import StreamDecodingError
+from src.data_processing.stream_processor import StreamTransformer, iter_csv_chunks
+from src.db.schemas.raw_data_schemas.multiple_prices_schema import MultiplePricesSchema
+
+RAW_CSV = (
+    "DATETIME,price\n"
+    "2024-01-01 09:00:00,1.0\n"
+    "2024-01-01 17:00:00,2.0\n"
+    "2024-01-02 09:00:00,3.0\n"
+    "2024-01-02 17:00:00,5.0\n"
+    "2024-01-03 12:00:00,6.0\n"
+)
+
+
+async def _stream(data, piece_size=7):
+    for start in range(0, len(data), piece_size):
+        yield data[start : start + piece_size]
+
+
+async def _transform(data, compression, chunk_rows):
+    transformer = StreamTransformer(
+        {"DATETIME": "unix_date_time", "price": "price"}, "AEX"
+    )
+    frames = [
+        transformer.transform(text)
+        async for text in iter_csv_chunks(_stream(data), compression, chunk_rows)
+    ]
+    return pd.concat(frames + [transformer.flush()], ignore_index=True)
+
+
+@pytest.mark.asyncio
+async def test_streamed_chunks_match_file_processing(tmp_path):
+    path = tmp_path / "AEX.csv"
+    path.write_text(RAW_CSV)
+    expected = load_and_process_raw_data_csv(
+        str(path), {"DATETIME": "unix_date_time", "price": "price"}, "AEX"
+    )
+
+    # A day split across two chunks is still averaged once
+    streamed = await _transform(gzip.compress(RAW_CSV.encode()), "gzip", 3)
+
+    pd.testing.assert_frame_equal(streamed, expected.reset_index(drop=True))
+
+
+def test_multiple_prices_contracts_stay_integers():
+    schema = MultiplePricesSchema()
+    transformer = StreamTransformer(
+        schema.column_mapping, "GOLD", schema.plan.source_dtypes, schema.plan.dtypes
+    )
+    frame = transformer.transform(
+        "DATETIME,CARRY,CARRY_CONTRACT,PRICE,PRICE_CONTRACT,FORWARD,FORWARD_CONTRACT\n"
+        "2024-01-01 09:00:00,1.0,20240400,2.0,20240300,3.0,20240500\n"
+        "2024-01-01 17:00:00,1.5,20240400,2.5,20240300,3.5,20240500\n"
+        "2024-01-02 09:00:00,1.0,20240400,2.0,20240300,3.0,20240500\n"
+    )
+    frame = pd.concat([frame, transformer.flush()], ignore_index=True)
+
+    assert str(frame["price_contract"].dtype) == "Int32"
+    # The COPY gets the contract months as INTEGER literals after averaging
+    columns = ["unix_date_time", "price", "price_contract", "carry_contract"]
+    assert frame[columns].to_csv(header=False, index=False).splitlines() == [
+        "1704067200,2.2,20240300,20240400",
+        "1704153600,2.0,20240300,20240400",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_chunks_repeat_header():
+    chunks = [
+        text
+        async for text in iter_csv_chunks(_stream(b"a,b\n1,2\n3,4\n5,6"), "none", 2)
+    ]
+
+    assert chunks == ["a,b\n1,2\n3,4", "a,b\n5,6"]
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_chunks_fail_on_corrupt_gzip():
+    with pytest.raises(StreamDecodingError):
+        _ = [text async for text in iter_csv_chunks(_stream(b"not gzip"), "gzip", 2)]
+    with pytest.raises(StreamDecodingError):
+        _ = [text async for text in iter_csv_chunks(_stream(b"a"), "brotli", 2)]
@@ -0,0 +1,68 @@
+import pandas as pd
+
+from src.core.config import settings
+from src.db.schemas.raw_data_schemas.multiple_prices_schema import MultiplePricesSchema
+from src.db.schemas.symbol_dimension import (
+    encode_symbols,
+    storage_plan,
+    storage_table_name,
+    table_sql_command,
+    uses_symbol_ids,
+)
+
+
+def test_default_layout_keeps_the_schema_ddl(monkeypatch):
+    monkeypatch.setattr(settings, "compact_symbols", False)
+    schema = MultiplePricesSchema()
+
+    assert not uses_symbol_ids("multiple_prices")
+    assert table_sql_command(schema) == schema.sql_command
+
+
+def test_compact_layout_stores_ids_behind_a_view(monkeypatch):
+    monkeypatch.setattr(settings, "compact_symbols", True)
+
+    sql_command = " ".join(table_sql_command(MultiplePricesSchema()).split())
+
+    assert uses_symbol_ids("multiple_prices")
+    assert not uses_symbol_ids("instrument_config")
+    assert "CREATE TABLE multiple_prices_by_id (" in sql_command
+    assert "symbol_id SMALLINT," in sql_command
+    assert "PRIMARY KEY (unix_date_time, symbol_id)" in sql_command
+    assert "VARCHAR" not in sql_command
+    assert (
+        "CREATE VIEW multiple_prices AS SELECT t.unix_date_time, s.symbol, t.carry, "
+        "t.carry_contract, t.price, t.price_contract, t.forward, t.forward_contract "
+        "FROM multiple_prices_by_id t JOIN symbols s ON s.symbol_id = t.symbol_id"
+    ) in sql_command
+    assert storage_table_name("multiple_prices") == "multiple_prices_by_id"
+
+
+def test_compact_storage_plan_copies_symbol_ids(monkeypatch):
+    monkeypatch.setattr(settings, "compact_symbols", True)
+    schema = MultiplePricesSchema()
+
+    plan = storage_plan(schema)
+
+    assert plan.table_name == "multiple_prices_by_id"
+    assert plan.copy_columns[:3] == ["unix_date_time", "symbol_id", "carry"]
+    assert plan.encoder.formats[:2] == (">i4", ">i2")
+    assert plan.load_index_commands()[0].startswith(
+        "CREATE INDEX IF NOT EXISTS multiple_prices_by_id_symbol_time_idx "
+        "ON multiple_prices_by_id (symbol_id, unix_date_time) INCLUDE (price,"
+    )
+    monkeypatch.setattr(settings, "compact_symbols", False)
+    assert storage_plan(schema) is schema.plan
+
+
+def test_encode_symbols_replaces_the_column_in_place():
+    data_frame = pd.DataFrame(
+        {"unix_date_time": [1, 2], "symbol": ["GOLD", "AEX"], "price": [1.0, 2.0]}
+    )
+
+    encoded = encode_symbols(data_frame, {"AEX": 1, "GOLD": 2})
+
+    assert encoded.columns.tolist() == ["unix_date_time", "symbol_id", "price"]
+    assert encoded["symbol_id"].tolist() == [2, 1]
+    assert encoded.to_numpy(object).tolist()[0] == [1, 2, 1.0]
+    assert data_frame["symbol"].tolist() == ["GOLD", "AEX"]
@@ -0,0 +1,18 @@
+from src.db.repositories.table_maintainer import finalize_commands
+
+
+def test_finalize_sets_fillfactor_before_clustering_and_analyzes_last():
+    assert finalize_commands(
+        "adjusted_prices",
+        cluster_index="adjusted_prices_symbol_time_idx",
+        fillfactor=90,
+    ) == [
+        "ALTER TABLE adjusted_prices SET (fillfactor = 90)",
+        "CLUSTER adjusted_prices USING adjusted_prices_symbol_time_idx",
+        "ANALYZE adjusted_prices",
+    ]
+
+
+def test_finalize_defaults_to_analyze_only():
+    assert finalize_commands("spread_cost") == ["ANALYZE spread_cost"]
+    assert finalize_commands("spread_cost", analyze=False) == []
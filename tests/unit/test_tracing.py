@@ -0,0 +1,84 @@
+import pytest
+
+from src.api.middleware import RequestContextMiddleware
+from src.monitoring.metrics import timed
+from src.monitoring.profiling import requested_profile_id
+from src.monitoring.tracing import SpanExporter, span
+
+
+@pytest.fixture
+def span_exporter(mocker):
+    span_exporter = SpanExporter(buffer_size=100)
+    mocker.patch("src.monitoring.tracing.exporter", span_exporter)
+    return span_exporter
+
+
+def test_spans_nest(span_exporter, mock_dataframe_for_symbol):
+    @timed("rename_columns")
+    def rename():
+        return mock_dataframe_for_symbol
+
+    with span("schema", schema="adjusted_prices") as schema_span:
+        with span("file", symbol="AEX"):
+            rename()
+
+    operation, file_span, schema_record = span_exporter.spans()
+    assert operation["name"] == "rename_columns"
+    assert operation["attributes"]["rows"] == 3
+    assert operation["parent_id"] == file_span["span_id"]
+    assert file_span["parent_id"] == schema_span.span_id
+    assert schema_record["parent_id"] is None
+    assert {operation["trace_id"], file_span["trace_id"]} == {schema_span.trace_id}
+
+
+def test_slowest_groups_by_attribute(span_exporter):
+    for symbol in ["AEX", "GOLD", "AEX"]:
+        with span("file", symbol=symbol):
+            pass
+    with pytest.raises(ValueError):
+        with span("file", symbol="CORN"):
+            raise ValueError("broken file")
+
+    groups = span_exporter.slowest("file", group_by="symbol")
+
+    assert {group["symbol"]: group["spans"] for group in groups} == {
+        "AEX": 2,
+        "GOLD": 1,
+        "CORN": 1,
+    }
+    assert span_exporter.spans(name="file")[-1]["status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_request_context_middleware(span_exporter):
+    profile_ids = []
+
+    async def app(scope, receive, send):
+        profile_ids.append(requested_profile_id())
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def request(query_string):
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/seed_db/",
+            "headers": [],
+            "query_string": query_string,
+        }
+        await RequestContextMiddleware(app)(scope, None, send)
+        return dict(messages[0]["headers"])
+
+    assert b"x-profile-id" not in await request(b"")
+    headers = await request(b"profile=true")
+
+    assert profile_ids[0] is None
+    assert headers[b"x-profile-id"].decode() == profile_ids[1]
+    assert [record["attributes"] for record in span_exporter.spans("request")] == [
+        {"method": "POST", "path": "/api/seed_db/", "status_code": 201}
+    ] * 2